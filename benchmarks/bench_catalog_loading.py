@@ -0,0 +1,90 @@
+# benchmarks/bench_catalog_loading.py
+"""
+Cold-start benchmark for loading a large cocktails.json: the previous json.load-based
+loader vs the streaming loader, eager and lazy, and opening the memory-mapped binary
+catalog built from the same file. Reports load time and the peak Python heap while
+loading (tracemalloc), then checks all loaders agree on names and ingredients.
+
+Run from the project root: python benchmarks/bench_catalog_loading.py [--recipes 50000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cocktail_manager import (CocktailRecipe, IngredientRequirement, _dict_to_cocktail_recipe,
+                              _cocktail_recipe_to_dict, build_binary_catalog, iter_cocktail_recipes,
+                              load_binary_cocktail_recipes, stream_cocktail_recipes_to_json)
+
+CATEGORIES = [f"Ingredient {i}" for i in range(400)]
+WORDS = "shake stir strain chill glass ice garnish pour top muddle gently build rim salt sugar".split()
+
+
+def make_recipes(size: int, rng: random.Random):
+    for i in range(size):
+        yield CocktailRecipe(
+            f"Cocktail {i}",
+            [IngredientRequirement(category, "1 oz") for category in rng.sample(CATEGORIES, rng.randint(2, 6))],
+            " ".join(rng.choices(WORDS, k=rng.randint(40, 160))).capitalize() + ".",
+            garnish_suggestion="Lime wheel",
+            description=" ".join(rng.choices(WORDS, k=30)),
+            image_url=f"https://www.thecocktaildb.com/images/media/drink/{i}.jpg",
+        )
+
+
+def load_with_json_load(filepath: str) -> list[CocktailRecipe]:
+    """The previous loader: parse the whole file, then convert every record."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [recipe for recipe in map(_dict_to_cocktail_recipe, json.load(f)) if recipe]
+
+
+def measure(label: str, load) -> list[CocktailRecipe]:
+    start = time.perf_counter()
+    recipes = load()
+    elapsed = time.perf_counter() - start
+    del recipes
+
+    tracemalloc.start()
+    recipes = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>16} {elapsed * 1000:>10.0f}ms {peak / 1e6:>10.1f}MB")
+    return recipes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog loading.")
+    parser.add_argument("--recipes", type=int, default=50_000, help="Number of synthetic recipes.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filepath = os.path.join(temp_dir, "cocktails.json")
+        stream_cocktail_recipes_to_json(make_recipes(args.recipes, random.Random(42)), filepath)
+        build_binary_catalog(filepath)
+        print(f"Catalog: {os.path.getsize(filepath) / 1e6:.1f}MB JSON, "
+              f"{os.path.getsize(os.path.join(temp_dir, 'cocktails.bin')) / 1e6:.1f}MB binary")
+
+        print(f"{'loader':>16} {'time':>12} {'peak heap':>12}")
+        baseline = measure("json.load", lambda: load_with_json_load(filepath))
+        eager = measure("streaming", lambda: list(iter_cocktail_recipes(filepath)))
+        lazy = measure("streaming lazy", lambda: list(iter_cocktail_recipes(filepath, lazy=True)))
+        mapped = measure("binary (mmap)", lambda: load_binary_cocktail_recipes(filepath))
+
+        # The binary catalog also holds the built-in recipes, after the catalog's own
+        mapped_own = mapped[:len(baseline)]
+        summary = lambda recipe: (recipe.name, [(req.category_needed, req.quantity) for req in recipe.ingredients])
+        assert list(map(summary, baseline)) == list(map(summary, eager)) == list(map(summary, lazy)) == list(map(summary, mapped_own))
+        assert _cocktail_recipe_to_dict(lazy[-1]) == _cocktail_recipe_to_dict(baseline[-1]) # Hydration
+        assert _cocktail_recipe_to_dict(mapped_own[-1]) == _cocktail_recipe_to_dict(baseline[-1])
+        mapped.catalog.close()
+        print("All loaders agree.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_fetch_cocktails.py
+"""
+Cold-start benchmark for fetching cocktail recipes from the API.
+Compares the old one-at-a-time loop (fresh requests.get + 0.2s sleep per name)
+with api_client.fetch_cocktails, both against a local stub server and an empty cache.
+
+fetch_cocktails is always measured with the shipped rate limiter
+(DEFAULT_RATE_PER_SECOND, DEFAULT_BURST), which is what real runs get; with 5 req/s
+that limiter, not the worker count, bounds the speedup. Pass --rate to add a row for
+another rate (e.g. a mirror that allows more).
+
+Run from the project root: python benchmarks/bench_fetch_cocktails.py [--names 200] [--rate 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import requests
+import api_client
+from api_cache import MemoryCache
+from cocktaildb_stub import StubCocktailDB
+
+
+def sequential_fetch(names: list[str]) -> dict:
+    """The previous get_all_recipes behaviour: one request and one fixed sleep per name."""
+    results = {}
+    for name in names:
+        response = requests.get(api_client.API_BASE_URL + "search.php", params={"s": name}, timeout=10)
+        results[name] = response.json()
+        time.sleep(0.2)
+    return results
+
+
+def timed_fetch(names: list[str], workers: int, rate: float, burst: int) -> tuple[float, int]:
+    """Runs fetch_cocktails on an empty cache with the given limiter. Returns (seconds, drinks fetched)."""
+    api_client.set_cache_backend(MemoryCache())
+    api_client.set_rate_limit(rate, burst=burst)
+    start = time.perf_counter()
+    results = api_client.fetch_cocktails(names, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(1 for payload in results.values() if payload and payload.get("drinks"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start cocktail fetching.")
+    parser.add_argument("--names", type=int, default=100, help="Number of cocktail names to fetch.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated server latency in seconds.")
+    parser.add_argument("--workers", type=int, default=api_client.DEFAULT_MAX_WORKERS)
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Also measure with this token-bucket rate (requests/second), burst = --workers.")
+    args = parser.parse_args()
+
+    names = [f"Stub Cocktail {i}" for i in range(args.names)]
+    limiters = [(api_client.DEFAULT_RATE_PER_SECOND, api_client.DEFAULT_BURST, "shipped limiter")]
+    if args.rate is not None:
+        limiters.append((args.rate, args.workers, "--rate"))
+
+    with StubCocktailDB(latency=args.latency) as stub:
+        api_client.API_BASE_URL = stub.base_url
+
+        start = time.perf_counter()
+        sequential_fetch(names)
+        sequential_time = time.perf_counter() - start
+
+        rows = [(rate, burst, label, *timed_fetch(names, args.workers, rate, burst)) for rate, burst, label in limiters]
+
+    print(f"\n{args.names} names, {args.latency * 1000:.0f}ms simulated latency")
+    print(f"  sequential + sleep(0.2): {sequential_time:7.2f}s")
+    for rate, burst, label, bulk_time, fetched in rows:
+        print(f"  fetch_cocktails ({args.workers} workers, {rate:g} req/s, burst {burst}, {label}): {bulk_time:7.2f}s "
+              f"({fetched} fetched), speedup {sequential_time / bulk_time:.1f}x at {rate:g} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_inventory_codecs.py
+"""
+Round-trip benchmark for saved inventories: encodes synthetic items with every available
+encoding (indented JSON, compact JSON, and orjson/msgpack when installed), decodes them back
+to InventoryItem objects, and reports encode time, decode time and size. The previous
+isinstance/if-elif converters with indented json.dump are included as the baseline.
+
+Run from the project root: python benchmarks/bench_inventory_codecs.py [--items 100000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from data_handler import ENCODINGS, _dict_to_inventory_item, _inventory_item_to_dict, decode_inventory, encode_inventory
+from inventory_manager import Garnish, InventoryItem, Mixer, Spirit
+
+CATEGORIES = ["Gin", "Vodka", "Light rum", "Tequila", "Bourbon", "Scotch Whisky", "Campari", "Sweet Vermouth"]
+
+
+def make_items(size: int, rng: random.Random) -> list[InventoryItem]:
+    items = []
+    for i in range(size):
+        kind = rng.random()
+        if kind < 0.6:
+            items.append(Spirit(f"Spirit {i}", f"Brand {i % 500}", rng.choice(CATEGORIES), "700ml",
+                                round(rng.uniform(15, 200), 2), "Blended", round(rng.uniform(15, 60), 1), "Scotland",
+                                tasting_notes="Honey, vanilla and smoke.", user_notes="Top shelf."))
+        elif kind < 0.9:
+            items.append(Mixer(f"Mixer {i}", f"Brand {i % 500}", "Tonic Water", "6x200ml", 5.0, "Tonic Water"))
+        else:
+            items.append(Garnish(f"Garnish {i}", "N/A", "Garnish", "10", 1.0, "Lime"))
+    return items
+
+
+def legacy_item_to_dict(item: InventoryItem) -> dict:
+    """The previous converter: isinstance dispatch."""
+    data = {"_type": item.__class__.__name__, "name": item.name, "brand": item.brand, "category": item.category,
+            "quantity": item.quantity, "price": item.price, "user_notes": item.user_notes}
+    if isinstance(item, Spirit):
+        data.update(type_of_liquor=item.type_of_liquor, abv=item.abv, origin=item.origin,
+                    tasting_notes=item.tasting_notes, suggested_pairings_raw=item.suggested_pairings_raw)
+    elif isinstance(item, Mixer):
+        data["mixer_type"] = item.mixer_type
+    elif isinstance(item, Garnish):
+        data["garnish_type"] = item.garnish_type
+    return data
+
+
+def legacy_dict_to_item(data: dict) -> InventoryItem:
+    """The previous converter: pops "_type" (mutating the dict) and dispatches with if/elif."""
+    item_type_str = data.pop("_type", None)
+    if item_type_str == "Spirit":
+        return Spirit(**data)
+    elif item_type_str == "Mixer":
+        return Mixer(**data)
+    elif item_type_str == "Garnish":
+        return Garnish(**data)
+    return InventoryItem(**data)
+
+
+def measure(label: str, encode, decode, items: list[InventoryItem]) -> list[InventoryItem]:
+    start = time.perf_counter()
+    encoded = encode(items)
+    encode_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = decode(encoded)
+    decode_seconds = time.perf_counter() - start
+    print(f"{label:>14} {encode_seconds * 1000:>10.0f}ms {decode_seconds * 1000:>10.0f}ms {len(encoded) / 1e6:>8.1f}MB")
+    return decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inventory encodings.")
+    parser.add_argument("--items", type=int, default=100_000, help="Number of synthetic items.")
+    args = parser.parse_args()
+
+    items = make_items(args.items, random.Random(42))
+    expected = [_inventory_item_to_dict(item) for item in items]
+    print(f"{args.items} items. Missing optional encodings: "
+          f"{', '.join(name for name in ('orjson', 'msgpack') if name not in ENCODINGS) or 'none'}")
+    print(f"{'encoding':>14} {'encode':>12} {'decode':>12} {'size':>10}")
+
+    decoded = measure("legacy json", lambda items: json.dumps([legacy_item_to_dict(item) for item in items], indent=4),
+                      lambda text: [legacy_dict_to_item(data) for data in json.loads(text)], items)
+    assert [_inventory_item_to_dict(item) for item in decoded] == expected
+    for name in ENCODINGS:
+        decoded = measure(name, lambda items: encode_inventory(items, name),
+                          lambda data: [_dict_to_inventory_item(item) for item in decode_inventory(data, name)], items)
+        assert [_inventory_item_to_dict(item) for item in decoded] == expected, name
+    print("All encodings round-trip.")
+
+
+if __name__ == "__main__":
+    main()
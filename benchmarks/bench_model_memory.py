@@ -0,0 +1,112 @@
+# benchmarks/bench_model_memory.py
+"""
+Memory benchmark for the recipe model: loads synthetic recipes from JSON (like a
+mirrored catalog) into the current slotted, interned CocktailRecipe objects and
+into a copy of the previous plain-__dict__ model, and reports the bytes each
+loaded recipe keeps alive.
+
+Run from the project root: python benchmarks/bench_model_memory.py [--recipes 100000]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cocktail_manager import _dict_to_cocktail_recipe
+
+CATEGORIES = ["Gin", "Vodka", "Light rum", "Tequila", "Bourbon", "Lime juice", "Lemon juice",
+              "Sugar syrup", "Tonic Water", "Soda Water", "Sweet Vermouth", "Dry Vermouth",
+              "Triple sec", "Angostura bitters", "Orange juice", "Mint"] + [f"Ingredient {i}" for i in range(300)]
+QUANTITIES = ["1 oz", "1/2 oz", "1 1/2 oz", "2 oz", "30ml", "50ml", "2 dashes", "1 tsp", "Top up", "1 slice"]
+
+
+class LegacyIngredientRequirement:
+    """The requirement model before __slots__ and interning."""
+    def __init__(self, category_needed, quantity, specific_brand_optional=None):
+        self.category_needed = category_needed
+        self.quantity = quantity
+        self.specific_brand_optional = specific_brand_optional
+
+
+class LegacyCocktailRecipe:
+    """The recipe model before __slots__ and interning (ingredients kept in a list)."""
+    def __init__(self, name, ingredients, preparation_instructions, garnish_suggestion="",
+                 description="", image_url="", local_image_path=None):
+        self.name = name
+        self.ingredients = ingredients
+        self.preparation_instructions = preparation_instructions
+        self.garnish_suggestion = garnish_suggestion
+        self.description = description
+        self.image_url = image_url
+        self.local_image_path = local_image_path
+
+
+def legacy_dict_to_recipe(data: dict) -> LegacyCocktailRecipe:
+    ingredients = [LegacyIngredientRequirement(req.get("category_needed", ""), req.get("quantity", ""),
+                                               req.get("specific_brand_optional"))
+                   for req in data.get("ingredients", [])]
+    return LegacyCocktailRecipe(data.get("name"), ingredients,
+                                data.get("preparation_instructions", "No instructions provided."),
+                                data.get("garnish_suggestion", ""), data.get("description", ""),
+                                data.get("image_url", ""), data.get("local_image_path"))
+
+
+def make_catalog_json(size: int, rng: random.Random) -> str:
+    records = []
+    for i in range(size):
+        records.append({
+            "name": f"Cocktail {i}",
+            "ingredients": [{"category_needed": category, "quantity": rng.choice(QUANTITIES),
+                             "specific_brand_optional": None}
+                            for category in rng.sample(CATEGORIES[:40] if rng.random() < 0.8 else CATEGORIES,
+                                                       rng.randint(2, 6))],
+            "preparation_instructions": "Shake with ice and strain.",
+            "garnish_suggestion": "",
+            "description": "Cocktail",
+            "image_url": f"https://www.thecocktaildb.com/images/media/drink/{i}.jpg",
+            "local_image_path": None,
+        })
+    return json.dumps(records)
+
+
+def retained_bytes(catalog_json: str, convert) -> tuple[int, list]:
+    """Parses and converts the catalog; returns the memory the converted recipes keep alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = json.loads(catalog_json)
+    recipes = [convert(record) for record in records]
+    del records # Only the recipe objects (and the strings they reference) stay alive
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, recipes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory used per loaded recipe.")
+    parser.add_argument("--recipes", type=int, default=100_000, help="Number of synthetic recipes.")
+    args = parser.parse_args()
+
+    catalog_json = make_catalog_json(args.recipes, random.Random(42))
+    requirement_count = catalog_json.count('"category_needed"')
+    print(f"{args.recipes} recipes, {requirement_count} requirements")
+
+    legacy_bytes, legacy_recipes = retained_bytes(catalog_json, legacy_dict_to_recipe)
+    del legacy_recipes
+    compact_bytes, compact_recipes = retained_bytes(catalog_json, _dict_to_cocktail_recipe)
+    assert len(compact_recipes) == args.recipes
+
+    print(f"{'model':>8} {'total MB':>10} {'bytes/recipe':>13}")
+    print(f"{'before':>8} {legacy_bytes / 1e6:>10.1f} {legacy_bytes / args.recipes:>13.0f}")
+    print(f"{'after':>8} {compact_bytes / 1e6:>10.1f} {compact_bytes / args.recipes:>13.0f}")
+    print(f"Saved {1 - compact_bytes / legacy_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
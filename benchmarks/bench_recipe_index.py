@@ -0,0 +1,74 @@
+# benchmarks/bench_recipe_index.py
+"""
+Scaling benchmark: find_makeable_cocktails vs RecipeIndex.find_makeable on
+synthetic catalogs of growing size, queried repeatedly with a fixed inventory.
+Also checks that both return exactly the same recipes.
+
+Run from the project root: python benchmarks/bench_recipe_index.py
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cocktail_manager import CocktailRecipe, IngredientRequirement, find_makeable_cocktails
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex
+
+CATEGORIES = [f"Ingredient {i}" for i in range(600)]
+# Zipf-like popularity: a few staples (gin, lime, ...) appear in many recipes, most ingredients in few
+CATEGORY_WEIGHTS = [1 / (rank + 1) for rank in range(len(CATEGORIES))]
+BRANDS = [f"Brand {i}" for i in range(20)]
+
+
+def make_catalog(size: int, rng: random.Random) -> list[CocktailRecipe]:
+    recipes = []
+    for i in range(size):
+        ingredients = []
+        for category in set(rng.choices(CATEGORIES, CATEGORY_WEIGHTS, k=rng.randint(2, 6))):
+            brand = rng.choice(BRANDS) if rng.random() < 0.1 else None
+            ingredients.append(IngredientRequirement(category, "30ml", brand))
+        recipes.append(CocktailRecipe(f"Cocktail {i}", ingredients, "Mix."))
+    return recipes
+
+
+def make_inventory(rng: random.Random) -> list[InventoryItem]:
+    return [InventoryItem(f"Bottle {i}", rng.choice(BRANDS), category, "700ml", 20.0)
+            for i, category in enumerate(CATEGORIES[:15] + rng.sample(CATEGORIES[15:150], 25))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the makeable-cocktail index.")
+    parser.add_argument("--queries", type=int, default=20, help="Queries per catalog size.")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    inventory = make_inventory(rng)
+    print(f"{'recipes':>8} {'linear/query':>14} {'index build':>12} {'index/query':>12} {'speedup':>8}")
+    for size in (100, 1_000, 10_000, 50_000):
+        recipes = make_catalog(size, rng)
+
+        start = time.perf_counter()
+        for _ in range(args.queries):
+            expected = find_makeable_cocktails(inventory, recipes)
+        linear = (time.perf_counter() - start) / args.queries
+
+        start = time.perf_counter()
+        index = RecipeIndex(recipes)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.queries):
+            result = index.find_makeable(inventory)
+        indexed = (time.perf_counter() - start) / args.queries
+
+        assert result == expected, "RecipeIndex disagrees with find_makeable_cocktails"
+        print(f"{size:>8} {linear * 1000:>12.2f}ms {build * 1000:>10.1f}ms {indexed * 1000:>10.2f}ms "
+              f"{linear / indexed:>7.1f}x  ({len(result)} makeable)")
+
+
+if __name__ == "__main__":
+    main()
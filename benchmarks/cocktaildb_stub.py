@@ -0,0 +1,106 @@
+# benchmarks/cocktaildb_stub.py
+"""
+A tiny local stand-in for TheCocktailDB API, used by the benchmarks.
+Every `search.php?s=<name>` request returns a synthetic drink after an
+artificial delay, so network latency can be simulated without hitting the real API.
+
+With a fixtures directory (as written by `crawl_cocktails.py --record DIR`),
+`search.php?f=<letter>` requests replay the recorded letter pages instead.
+Run it standalone to point the crawler at it:
+    python benchmarks/cocktaildb_stub.py --fixtures DIR --port 8000
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def make_drink(name: str, drink_id: int = 0) -> dict:
+    """Builds a minimal drink record in TheCocktailDB's format."""
+    return {
+        "idDrink": str(drink_id),
+        "strDrink": name,
+        "strCategory": "Cocktail",
+        "strInstructions": f"Mix the {name}.",
+        "strDrinkThumb": "",
+        "strIngredient1": "Gin",
+        "strMeasure1": "50ml",
+        "strIngredient2": "Tonic Water",
+        "strMeasure2": "100ml",
+    }
+
+
+class StubCocktailDB:
+    """
+    Runs the stub server on a background thread.
+    Use as a context manager; `base_url` is the value to put in api_client.API_BASE_URL.
+    """
+    def __init__(self, latency: float = 0.05, fixtures_dir: str = None, port: int = 0):
+        self.latency = latency
+        self.fixtures_dir = fixtures_dir
+        self.request_count = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" # Keep-alive, so pooled sessions can reuse connections
+
+            def do_GET(self):
+                stub.request_count += 1
+                time.sleep(stub.latency)
+                query = parse_qs(urlparse(self.path).query)
+                if "f" in query and stub.fixtures_dir:
+                    body = stub.letter_page(query["f"][0])
+                else:
+                    name = query.get("s", [""])[0]
+                    body = json.dumps({"drinks": [make_drink(name, stub.request_count)]}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # Keep benchmark output readable
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def letter_page(self, letter: str) -> bytes:
+        """Returns the recorded page for `letter`, or the API's empty result."""
+        fixture_path = os.path.join(self.fixtures_dir, f"search_f_{letter}.json")
+        if not os.path.exists(fixture_path):
+            return b'{"drinks": null}'
+        with open(fixture_path, 'rb') as f:
+            return f.read()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for TheCocktailDB API.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency per request in seconds.")
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded letter pages to replay.")
+    args = parser.parse_args()
+
+    with StubCocktailDB(latency=args.latency, fixtures_dir=args.fixtures, port=args.port) as stub:
+        print(f"Stub CocktailDB listening on {stub.base_url} (Ctrl+C to stop)")
+        try:
+            stub._thread.join()
+        except KeyboardInterrupt:
+            pass
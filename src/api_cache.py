@@ -0,0 +1,286 @@
+# src/api_cache.py
+"""
+Cache backends for API responses.
+
+api_client stores every search result here instead of one JSON file per key.
+Each entry lives under a namespace ("cocktails", "ingredients") and a key, can
+carry its own TTL, and the store is capped at `max_entries` with least-recently-used
+eviction. Backends count hits, misses, expirations and evictions.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by all cache backends.
+    Values are JSON-serializable dicts; get() returns None on a miss or expired entry.
+    A backend that doesn't implement every abstract method can't be instantiated.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> dict | None:
+        ...
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: dict, ttl: float | None = None):
+        """Stores `value`. `ttl` is in seconds; None means the entry never expires."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str):
+        ...
+
+    @abstractmethod
+    def version(self, namespace: str, key: str) -> float | None:
+        """
+        When the entry was last stored (it changes whenever the entry is refreshed), or None
+        if there is no live entry. Doesn't count as a hit or miss, nor touch LRU order.
+        """
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def stats(self) -> dict:
+        """Returns the hit/miss/expiration/eviction counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "entries": len(self),
+        }
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache. Nothing is persisted; useful for tests and benchmarks."""
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict() # (namespace, key) -> (value, expires_at, stored_at)
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[(namespace, key)]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end((namespace, key))
+            self.hits += 1
+            return value
+
+    def set(self, namespace: str, key: str, value: dict, ttl: float | None = None):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[(namespace, key)] = (value, expires_at, now)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+
+    def version(self, namespace: str, key: str) -> float | None:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+        if entry is None or (entry[1] is not None and entry[1] <= time.time()):
+            return None
+        return entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Single-file cache backed by SQLite.
+    Lookups are one indexed query instead of an exists/open/json.load per file.
+    Entries carry an expiry timestamp and a last-access timestamp that drives LRU eviction.
+    """
+    def __init__(self, filepath: str, max_entries: int = 10000):
+        super().__init__()
+        self.filepath = filepath
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False) # Guarded by self._lock
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace   TEXT NOT NULL,
+                key         TEXT NOT NULL,
+                value       TEXT NOT NULL,
+                stored_at   REAL NOT NULL,
+                expires_at  REAL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, namespace: str, key: str) -> dict | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                self._conn.commit()
+                self._count -= 1
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                               (now, namespace, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: dict, ttl: float | None = None):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, encoded, now, expires_at, now))
+            if not existed:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict(self._count - self.max_entries)
+            self._conn.commit()
+
+    def _evict(self, how_many: int):
+        """Deletes the `how_many` least recently used entries. Caller holds the lock."""
+        # Expired entries go first, then the least recently used ones
+        cursor = self._conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                                    (time.time(),))
+        self.expirations += cursor.rowcount
+        self._count -= cursor.rowcount
+        how_many -= cursor.rowcount
+        if how_many > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY last_access LIMIT ?)",
+                (how_many,))
+            self.evictions += cursor.rowcount
+            self._count -= cursor.rowcount
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            self._conn.commit()
+            self._count -= cursor.rowcount
+
+    def version(self, namespace: str, key: str) -> float | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at FROM entries WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)", (namespace, key, time.time())).fetchone()
+        return row[0] if row else None
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_meta(self, name: str) -> str | None:
+        """A value recorded with set_meta (e.g. that a migration finished), or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str):
+        """Records a value about the cache itself, kept apart from the entries (clear() keeps it)."""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_json_cache_dir(cache_dir: str, backend: CacheBackend,
+                           ttl: float | None = None, negative_ttl: float | None = None) -> int:
+    """
+    One-shot import of the old data/api_cache/<namespace>/<key>.json layout into `backend`.
+    The file name (without .json) becomes the key and the sub-directory the namespace.
+    Files holding a "not found" payload ({"drinks": null}) get `negative_ttl`.
+    Keys the backend already holds are skipped, so an interrupted migration can simply be
+    run again. The old files are left in place.
+
+    Returns:
+        int: The number of entries migrated.
+    """
+    migrated = 0
+    for namespace in ("cocktails", "ingredients"):
+        namespace_dir = os.path.join(cache_dir, namespace)
+        if not os.path.isdir(namespace_dir):
+            continue
+        for filename in os.listdir(namespace_dir):
+            if not filename.endswith(".json"):
+                continue
+            key = filename[:-len(".json")]
+            if backend.version(namespace, key) is not None: # Imported before, or fetched since
+                continue
+            try:
+                with open(os.path.join(namespace_dir, filename), 'r') as f:
+                    payload = json.load(f)
+            except (IOError, json.JSONDecodeError) as e:
+                print(f"Skipping unreadable cache file '{filename}': {e}")
+                continue
+            # Only a non-empty payload of nulls is "not found"; all() of {} would be True
+            is_negative = (isinstance(payload, dict) and bool(payload)
+                           and all(value is None for value in payload.values()))
+            backend.set(namespace, key, payload, negative_ttl if is_negative else ttl)
+            migrated += 1
+    if migrated:
+        print(f"Migrated {migrated} cached API responses from '{cache_dir}'.")
+    return migrated
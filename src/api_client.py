@@ -2,61 +2,163 @@
 import requests
 import json
 import os
-import time # For simple rate limiting, if needed
+import threading
+import time # For the token-bucket rate limiter
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from api_cache import CacheBackend, SQLiteCache, migrate_json_cache_dir
 
 API_BASE_URL = "https://www.thecocktaildb.com/api/json/v1/1/"
 CACHE_DIR = "data/api_cache/" # Store API responses here
 
-# Ensure cache directory exists
-os.makedirs(CACHE_DIR + "cocktails/", exist_ok=True)
-os.makedirs(CACHE_DIR + "ingredients/", exist_ok=True)
+# Bulk fetching defaults (see fetch_cocktails)
+DEFAULT_MAX_WORKERS = 8           # Concurrent requests in flight
+DEFAULT_RATE_PER_SECOND = 5.0     # Sustained requests per second across all threads
+DEFAULT_BURST = 5                 # Requests allowed back-to-back before throttling kicks in
+
+# API cache settings (see api_cache.py)
+CACHE_FILENAME = "api_cache.sqlite3"
+CACHE_TTL_SECONDS = 30 * 24 * 3600          # Found results: refresh after 30 days
+NEGATIVE_CACHE_TTL_SECONDS = 24 * 3600      # "Not found" results: retry after a day
+CACHE_MAX_ENTRIES = 10000                   # LRU eviction beyond this many entries
+JSON_CACHE_MIGRATED = "json_cache_migrated" # Meta row set once the old JSON files were imported
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    each API call takes one token and blocks until one is available.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+# One pooled session and one rate limiter shared by every caller in the process,
+# so keep-alive connections are reused and concurrent callers respect a single budget.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_RATE_LIMITER = TokenBucket(DEFAULT_RATE_PER_SECOND, DEFAULT_BURST)
+
+
+def _get_session() -> requests.Session:
+    """Returns the shared, connection-pooled requests session (created on first use)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(DEFAULT_MAX_WORKERS, 10))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_cache() -> CacheBackend:
+    """
+    Returns the cache backend used by the search functions.
+    Defaults to a SQLiteCache in CACHE_DIR, created on first use. Responses from the old
+    per-file JSON cache are migrated into it until a migration completes; completion is
+    recorded in the database, so an interrupted migration resumes on the next start.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            cache = SQLiteCache(os.path.join(CACHE_DIR, CACHE_FILENAME), max_entries=CACHE_MAX_ENTRIES)
+            if cache.get_meta(JSON_CACHE_MIGRATED) is None:
+                migrate_json_cache_dir(CACHE_DIR, cache, ttl=CACHE_TTL_SECONDS,
+                                       negative_ttl=NEGATIVE_CACHE_TTL_SECONDS)
+                cache.set_meta(JSON_CACHE_MIGRATED, repr(time.time()))
+            _CACHE = cache
+        return _CACHE
+
+
+def set_cache_backend(backend: CacheBackend):
+    """Replaces the cache backend (e.g. with a MemoryCache for tests or benchmarks)."""
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = backend
+
+
+def set_rate_limit(rate_per_second: float, burst: int = DEFAULT_BURST):
+    """Replaces the shared rate limiter. A rate of 0 or less disables throttling."""
+    global _RATE_LIMITER
+    _RATE_LIMITER = TokenBucket(rate_per_second, burst) if rate_per_second > 0 else None
+
 
 def _fetch_from_api(endpoint: str, params: dict) -> dict | None:
     """Helper function to fetch data from the API."""
+    if _RATE_LIMITER is not None:
+        _RATE_LIMITER.acquire()
     try:
-        response = requests.get(API_BASE_URL + endpoint, params=params, timeout=10) # 10 second timeout
+        response = _get_session().get(API_BASE_URL + endpoint, params=params, timeout=10) # 10 second timeout
         response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
         return response.json()
     except requests.exceptions.RequestException as e:
         print(f"API request error: {e}")
         return None
 
+def _cache_key(name: str) -> str:
+    """Normalizes a search term into a cache key (same scheme as the old per-file cache)."""
+    return name.lower().replace(' ', '_')
+
+
+def _cached_search(namespace: str, result_field: str, search_param: str, name: str, label: str) -> dict | None:
+    """
+    Looks `name` up in the cache and falls back to the API.
+    Found results are cached for CACHE_TTL_SECONDS and "not found" results
+    ({result_field: None}) for the shorter NEGATIVE_CACHE_TTL_SECONDS.
+    """
+    cache = get_cache()
+    key = _cache_key(name)
+    cached = cache.get(namespace, key)
+    if cached is not None:
+        print(f"Loading {label} '{name}' from cache.")
+        return cached
+
+    print(f"Fetching {label} '{name}' from API...")
+    data = _fetch_from_api("search.php", {search_param: name})
+
+    if data and data.get(result_field): # The API returns {"drinks": null} if not found
+        cache.set(namespace, key, data, ttl=CACHE_TTL_SECONDS)
+        return data
+    elif data and data.get(result_field) is None:
+        print(f"{label.capitalize()} '{name}' not found by API.")
+        # Cache the "not found" result to avoid re-fetching, but only for a while
+        not_found = {result_field: None}
+        cache.set(namespace, key, not_found, ttl=NEGATIVE_CACHE_TTL_SECONDS)
+        return not_found # Explicitly return the "not found" structure
+    return None
+
+
 def search_cocktail_by_name(cocktail_name: str) -> dict | None:
     """
     Searches for a cocktail by its name.
     Caches the result to avoid repeated API calls.
     """
-    cache_file = os.path.join(CACHE_DIR, "cocktails", f"{cocktail_name.lower().replace(' ', '_')}.json")
-
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                print(f"Loading '{cocktail_name}' from cache.")
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
-            print(f"Cache read error for '{cocktail_name}': {e}. Fetching from API.")
-
-    print(f"Fetching '{cocktail_name}' from API...")
-    data = _fetch_from_api("search.php", {"s": cocktail_name})
-
-    if data and data.get("drinks"): # The API returns {"drinks": null} if not found
-        # Save to cache
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            print(f"Cache write error for '{cocktail_name}': {e}")
-        return data
-    elif data and data.get("drinks") is None:
-        print(f"Cocktail '{cocktail_name}' not found by API.")
-        # Cache the "not found" result to avoid re-fetching
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({"drinks": None}, f, indent=4) # Store the null result
-        except IOError as e:
-            print(f"Cache write error for '{cocktail_name}' (not found): {e}")
-        return {"drinks": None} # Explicitly return the "not found" structure
-    return None
+    return _cached_search("cocktails", "drinks", "s", cocktail_name, "cocktail")
 
 
 def search_ingredient_by_name(ingredient_name: str) -> dict | None:
@@ -64,35 +166,51 @@ def search_ingredient_by_name(ingredient_name: str) -> dict | None:
     Searches for an ingredient by its name.
     Caches the result.
     """
-    cache_file = os.path.join(CACHE_DIR, "ingredients", f"{ingredient_name.lower().replace(' ', '_')}.json")
-
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                print(f"Loading ingredient '{ingredient_name}' from cache.")
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
-            print(f"Cache read error for ingredient '{ingredient_name}': {e}. Fetching from API.")
-            
-    print(f"Fetching ingredient '{ingredient_name}' from API...")
-    data = _fetch_from_api("search.php", {"i": ingredient_name})
-
-    if data and data.get("ingredients"):
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            print(f"Cache write error for ingredient '{ingredient_name}': {e}")
-        return data
-    elif data and data.get("ingredients") is None:
-        print(f"Ingredient '{ingredient_name}' not found by API.")
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({"ingredients": None}, f, indent=4)
-        except IOError as e:
-            print(f"Cache write error for ingredient '{ingredient_name}' (not found): {e}")
-        return {"ingredients": None}
-    return None
+    return _cached_search("ingredients", "ingredients", "i", ingredient_name, "ingredient")
+
+
+def get_cached_ingredient(ingredient_name: str) -> dict | None:
+    """
+    Returns the cached search result for an ingredient without calling the API,
+    or None if it isn't cached (or has expired).
+    """
+    return get_cache().get("ingredients", _cache_key(ingredient_name))
+
+
+def get_cached_ingredient_version(ingredient_name: str) -> float | None:
+    """
+    Version of the cached search result for an ingredient (when it was stored), or None if
+    it isn't cached. It changes whenever the entry is refreshed from the API.
+    """
+    return get_cache().version("ingredients", _cache_key(ingredient_name))
+
+
+def list_cocktails_by_first_letter(letter: str) -> dict | None:
+    """
+    Lists every cocktail whose name starts with `letter` (full drink records).
+    Not cached: the catalog crawler uses this to detect new and changed drinks.
+    """
+    return _fetch_from_api("search.php", {"f": letter})
+
+
+def fetch_cocktails(names: list[str], max_workers: int = DEFAULT_MAX_WORKERS) -> dict[str, dict | None]:
+    """
+    Fetches several cocktails concurrently.
+    Each name goes through search_cocktail_by_name (so the cache is still used),
+    with at most `max_workers` requests in flight and the shared rate limiter
+    pacing actual API calls.
+
+    Returns:
+        dict[str, dict | None]: The API payload for each requested name, in the
+                                order given. None if the request failed.
+    """
+    unique_names = list(dict.fromkeys(names)) # Preserve order, drop duplicates
+    if not unique_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_names)))) as executor:
+        payloads = executor.map(search_cocktail_by_name, unique_names)
+        return dict(zip(unique_names, payloads))
+
 
 # Example usage (you can test this by running this file directly: python src/api_client.py)
 if __name__ == "__main__":
@@ -112,4 +230,5 @@ if __name__ == "__main__":
         print(f"\nVodka Data (first result): {vodka_data['ingredients'][0]['strIngredient']}")
         print(f"Description: {vodka_data['ingredients'][0]['strDescription'][:100]}...") # First 100 chars
 
-    gin_data = search_ingredient_by_name("Gin") # Second call, should use cache if run again soon
\ No newline at end of file
+    gin_data = search_ingredient_by_name("Gin") # Second call, should use cache if run again soon
+    print(f"\nCache stats: {get_cache().stats()}")
\ No newline at end of file
@@ -0,0 +1,100 @@
+# src/bitset_matcher.py
+"""
+Vectorized makeable-cocktail matching for many inventories at once (e.g. one per bar).
+
+The recipe catalog is encoded as a packed bit matrix (one row per recipe, one bit per
+ingredient key it needs) and each inventory as a packed bit vector of the keys it has.
+A recipe is makeable from an inventory when none of its bits fall outside the
+inventory's bits, so a whole batch of N inventories against M recipes reduces to a
+handful of NumPy ANDs, one per 64-bit word of the key space.
+
+NumPy is optional: without it, every inventory goes through RecipeIndex instead.
+Results are the same either way, and match find_makeable_cocktails.
+"""
+from cocktail_manager import CocktailRecipe
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; fall back to the pure-Python path
+    np = None
+
+# Upper bound on the temporary (inventories x recipes) arrays built per chunk
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class BitsetMatcher:
+    """
+    Packed recipe-ingredient incidence matrix for a fixed recipe list.
+    Build it once per catalog, then call find_makeable_batch for any number of inventories.
+    """
+    def __init__(self, recipes: list[CocktailRecipe], index: RecipeIndex = None, use_numpy: bool = True):
+        self.index = index if index is not None else RecipeIndex(recipes)
+        self.recipes = self.index.recipes
+        self.use_numpy = use_numpy and np is not None
+        self.key_ids = {key: key_id for key_id, key in enumerate(self.index.recipes_by_key)}
+        self._recipe_words = None
+
+        if self.use_numpy:
+            incidence = np.zeros((len(self.recipes), len(self.key_ids)), dtype=bool)
+            for position, keys in enumerate(self.index.recipe_keys):
+                incidence[position, [self.key_ids[key] for key in keys]] = True
+            # Stored word-major (words x recipes) so each word's column is contiguous
+            self._recipe_words = np.ascontiguousarray(self._pack(incidence).T)
+
+    def _pack(self, bits: "np.ndarray") -> "np.ndarray":
+        """Packs a (rows x keys) bool matrix into (rows x words) uint64, padding to whole words."""
+        packed = np.packbits(bits, axis=1)
+        padding = (-packed.shape[1]) % 8
+        if padding or packed.shape[1] == 0:
+            packed = np.pad(packed, ((0, 0), (0, padding or 8)))
+        return np.ascontiguousarray(packed).view(np.uint64)
+
+    def encode_inventories(self, inventories: list[list[InventoryItem]]) -> "np.ndarray":
+        """Returns the (inventories x words) packed bit vectors of the keys each inventory has."""
+        bits = np.zeros((len(inventories), len(self.key_ids)), dtype=bool)
+        for row, inventory in enumerate(inventories):
+            key_ids = [self.key_ids[key] for key in self.index.inventory_keys(inventory) if key in self.key_ids]
+            bits[row, key_ids] = True
+        return self._pack(bits)
+
+    def find_makeable_batch(self, inventories: list[list[InventoryItem]]) -> list[list[CocktailRecipe]]:
+        """
+        Determines the makeable cocktails for each inventory.
+
+        Returns:
+            list[list[CocktailRecipe]]: One list per inventory, in catalog order.
+        """
+        if not self.use_numpy:
+            return [self.index.find_makeable(inventory) for inventory in inventories]
+        if not inventories:
+            return []
+
+        missing = ~self.encode_inventories(inventories) # Bits each inventory lacks
+        recipe_words = self._recipe_words
+        word_count, recipe_count = recipe_words.shape
+        chunk_size = max(1, MAX_CHUNK_BYTES // max(1, recipe_count * recipe_words.itemsize))
+
+        results = []
+        for start in range(0, len(inventories), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            # A recipe is blocked if any bit it needs is missing from the inventory.
+            # Going word by word keeps the temporary at (inventories x recipes).
+            blocked = np.zeros((len(chunk), recipe_count), dtype=bool)
+            for word in range(word_count):
+                np.logical_or(blocked, (chunk[:, word, None] & recipe_words[word]) != 0, out=blocked)
+            for row in ~blocked:
+                results.append([self.recipes[position] for position in np.flatnonzero(row)])
+        return results
+
+
+def find_makeable_cocktails_batch(inventories: list[list[InventoryItem]], recipes: list[CocktailRecipe],
+                                  use_numpy: bool = True) -> list[list[CocktailRecipe]]:
+    """
+    Determines which cocktails each of several inventories can make.
+    Equivalent to [find_makeable_cocktails(inventory, recipes) for inventory in inventories],
+    but encodes the catalog once and evaluates the whole batch in one vectorized pass
+    when NumPy is available.
+    """
+    return BitsetMatcher(recipes, use_numpy=use_numpy).find_makeable_batch(inventories)
@@ -0,0 +1,233 @@
+# src/catalog_binary.py
+"""
+Compact binary format for the curated cocktail catalog.
+
+The JSON catalog has to be parsed in full on every start. This format is built once from it
+and opened with mmap: a fixed-size header, fixed-width records and a shared string table,
+so a record is found by arithmetic and only the fields that are read get decoded.
+
+Layout (little-endian):
+    header              HEADER (magic, format version, counts, source file stamp, CRC32 of the body)
+    recipe records      recipe_count x RECIPE_RECORD:
+                        string ids of name, source, preparation_instructions, garnish_suggestion,
+                        description, image_url, local_image_path; first ingredient; ingredient count
+    ingredient records  ingredient_count x INGREDIENT_RECORD:
+                        string ids of category_needed, quantity, specific_brand_optional
+    string offsets      (string_count + 1) x uint64, byte offsets into the string data
+    string data         UTF-8 bytes of every distinct string, stored once
+
+String id NO_STRING stands for None. The header records the mtime and size of the JSON file
+the catalog was built from, so readers can tell when it is out of date.
+
+Opening a catalog only checks the header and that the section sizes add up to the file size,
+so it costs the same whatever the catalog size. The CRC32 of the body is checked by
+BinaryCatalogReader.verify(), which the builder runs once after writing.
+
+This module only knows the format. It reads and writes plain records in the JSON catalog's
+dict shape; cocktail_manager turns them into CocktailRecipe objects.
+"""
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from typing import Iterable
+
+MAGIC = b"CKTLCAT\x00"
+FORMAT_VERSION = 2
+
+HEADER = struct.Struct("<8sHxxIIIqQI4x")    # magic, version, recipes, ingredients, strings, source mtime_ns, source size, crc32
+RECIPE_RECORD = struct.Struct("<9I")       # 7 string ids, first ingredient, ingredient count
+INGREDIENT_RECORD = struct.Struct("<3I")   # category, quantity, brand string ids
+STRING_OFFSET = struct.Struct("<Q")
+NO_STRING = 0xFFFFFFFF
+
+RECIPE_STRING_FIELDS = ("name", "source", "preparation_instructions", "garnish_suggestion",
+                        "description", "image_url", "local_image_path")
+INGREDIENT_STRING_FIELDS = ("category_needed", "quantity", "specific_brand_optional")
+
+
+class CatalogFormatError(ValueError):
+    """Raised when a binary catalog is truncated, corrupt or of an unsupported version."""
+
+
+def write_binary_catalog(records: Iterable[dict], filepath: str, source_path: str = None) -> int:
+    """
+    Writes recipe records (dicts in the JSON catalog format) to a binary catalog.
+    The file is written to a unique temporary file in the same directory and renamed into place.
+
+    Args:
+        records (Iterable[dict]): Recipe dicts with the RECIPE_STRING_FIELDS and an "ingredients" list.
+        filepath (str): Where to write the catalog.
+        source_path (str, optional): The JSON file the records come from; its mtime and size
+                                     are stored so stale catalogs can be detected.
+
+    Returns:
+        int: The number of recipes written.
+    """
+    string_ids = {}
+    encoded_strings = []
+
+    def string_id(value) -> int:
+        if value is None:
+            return NO_STRING
+        value = str(value)
+        if value not in string_ids:
+            string_ids[value] = len(encoded_strings)
+            encoded_strings.append(value.encode('utf-8'))
+        return string_ids[value]
+
+    recipe_rows = bytearray()
+    ingredient_rows = bytearray()
+    recipe_count = 0
+    ingredient_count = 0
+    for record in records:
+        ingredients = record.get("ingredients", [])
+        field_ids = [string_id(record.get(field)) for field in RECIPE_STRING_FIELDS]
+        recipe_rows += RECIPE_RECORD.pack(*field_ids, ingredient_count, len(ingredients))
+        for ingredient in ingredients:
+            ingredient_rows += INGREDIENT_RECORD.pack(*(string_id(ingredient.get(field))
+                                                        for field in INGREDIENT_STRING_FIELDS))
+        ingredient_count += len(ingredients)
+        recipe_count += 1
+
+    string_offsets = bytearray()
+    position = 0
+    for encoded in encoded_strings:
+        string_offsets += STRING_OFFSET.pack(position)
+        position += len(encoded)
+    string_offsets += STRING_OFFSET.pack(position)
+
+    sections = [recipe_rows, ingredient_rows, string_offsets] + encoded_strings
+    checksum = 0
+    for section in sections:
+        checksum = zlib.crc32(section, checksum)
+
+    source_mtime_ns, source_size = 0, 0
+    if source_path:
+        source_stat = os.stat(source_path)
+        source_mtime_ns, source_size = source_stat.st_mtime_ns, source_stat.st_size
+
+    # A unique temp file per writer, so concurrent builds can't interleave into one file
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".",
+                                     prefix=os.path.basename(filepath) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, recipe_count, ingredient_count, len(encoded_strings),
+                                source_mtime_ns, source_size, checksum))
+            for section in sections:
+                f.write(section)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return recipe_count
+
+
+class BinaryCatalogReader:
+    """
+    Read-only, memory-mapped view of a binary catalog. Opening it maps the file and checks the
+    header and section sizes (not the checksum, see verify()); records are decoded only when
+    asked for.
+
+    Raises:
+        CatalogFormatError: If the file isn't a valid catalog of this format version.
+        OSError: If the file can't be opened.
+    """
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise CatalogFormatError(f"'{filepath}' is too small to be a binary catalog.")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except CatalogFormatError:
+            self._map.close()
+            raise
+
+    def _read_header(self):
+        (magic, version, self.recipe_count, self.ingredient_count, self.string_count,
+         self.source_mtime_ns, self.source_size, self._checksum) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise CatalogFormatError(f"'{self.filepath}' is not a binary cocktail catalog.")
+        if version != FORMAT_VERSION:
+            raise CatalogFormatError(f"'{self.filepath}' has format version {version}, expected {FORMAT_VERSION}.")
+
+        self._ingredients_start = HEADER.size + self.recipe_count * RECIPE_RECORD.size
+        self._offsets_start = self._ingredients_start + self.ingredient_count * INGREDIENT_RECORD.size
+        self._strings_start = self._offsets_start + (self.string_count + 1) * STRING_OFFSET.size
+        if len(self._map) < self._strings_start:
+            raise CatalogFormatError(f"'{self.filepath}' is truncated.")
+        strings_size = self._string_offset(self.string_count)
+        if len(self._map) != self._strings_start + strings_size:
+            raise CatalogFormatError(f"'{self.filepath}' is truncated or has trailing data.")
+
+    def verify(self):
+        """
+        Checks the CRC32 of the whole body against the header. Reads every page of the file.
+
+        Raises:
+            CatalogFormatError: If the checksum doesn't match.
+        """
+        if zlib.crc32(memoryview(self._map)[HEADER.size:]) != self._checksum:
+            raise CatalogFormatError(f"'{self.filepath}' failed its checksum.")
+
+    def __len__(self) -> int:
+        return self.recipe_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def is_current(self, source_path: str) -> bool:
+        """True if `source_path` still has the mtime and size the catalog was built from."""
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            return True # Source gone: the catalog is all there is
+        return (source_stat.st_mtime_ns, source_stat.st_size) == (self.source_mtime_ns, self.source_size)
+
+    def _string_offset(self, string_id: int) -> int:
+        return STRING_OFFSET.unpack_from(self._map, self._offsets_start + string_id * STRING_OFFSET.size)[0]
+
+    def string(self, string_id: int) -> str | None:
+        """Decodes one entry of the string table (None for NO_STRING)."""
+        if string_id == NO_STRING:
+            return None
+        start, end = struct.unpack_from("<QQ", self._map, self._offsets_start + string_id * STRING_OFFSET.size)
+        return str(self._map[self._strings_start + start:self._strings_start + end], 'utf-8')
+
+    def _recipe_record(self, position: int) -> tuple:
+        if not 0 <= position < self.recipe_count:
+            raise IndexError(f"Recipe position {position} out of range.")
+        return RECIPE_RECORD.unpack_from(self._map, HEADER.size + position * RECIPE_RECORD.size)
+
+    def name(self, position: int) -> str:
+        """The name of the recipe at `position`."""
+        return self.string(self._recipe_record(position)[0])
+
+    def source(self, position: int) -> str | None:
+        """Where the recipe at `position` came from ("curated", "builtin", ...)."""
+        return self.string(self._recipe_record(position)[1])
+
+    def ingredients(self, position: int) -> list[tuple[str, str, str | None]]:
+        """The recipe's ingredients as (category_needed, quantity, specific_brand_optional) tuples."""
+        first, count = self._recipe_record(position)[7:]
+        ingredients = []
+        for offset in range(self._ingredients_start + first * INGREDIENT_RECORD.size,
+                            self._ingredients_start + (first + count) * INGREDIENT_RECORD.size,
+                            INGREDIENT_RECORD.size):
+            ingredients.append(tuple(map(self.string, INGREDIENT_RECORD.unpack_from(self._map, offset))))
+        return ingredients
+
+    def details(self, position: int) -> dict:
+        """The recipe's remaining fields (everything but name, source and ingredients) as a dict."""
+        string_ids = self._recipe_record(position)[2:7]
+        return {field: self.string(string_id) for field, string_id in zip(RECIPE_STRING_FIELDS[2:], string_ids)}
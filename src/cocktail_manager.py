@@ -1,12 +1,27 @@
-import time
-from api_client import search_cocktail_by_name
+from api_client import fetch_cocktails
+from inventory_manager import intern_text
+from catalog_binary import BinaryCatalogReader, CatalogFormatError, write_binary_catalog
+import codecs
+import copy
+import hashlib
 import json
 import os
+import re
+import textwrap
+import threading
+import time
+import unicodedata
+from collections.abc import Sequence
+from typing import Iterable, Iterator
 
 class IngredientRequirement:
     """
     Represents a single ingredient required for a cocktail recipe.
     """
+    # A catalog holds several requirements per recipe: no per-instance __dict__,
+    # and the repetitive strings ("Gin", "1 oz") are interned
+    __slots__ = ("category_needed", "quantity", "specific_brand_optional")
+
     def __init__(self, category_needed: str, quantity: str, specific_brand_optional: str = None):
         """
         Initializes an IngredientRequirement.
@@ -22,9 +37,9 @@ class IngredientRequirement:
                                                      This could also be a specific item name if the brand is intrinsic
                                                      (e.g., "Campari" for Campari).
         """
-        self.category_needed = category_needed
-        self.quantity = quantity
-        self.specific_brand_optional = specific_brand_optional
+        self.category_needed = intern_text(category_needed)
+        self.quantity = intern_text(quantity)
+        self.specific_brand_optional = intern_text(specific_brand_optional)
 
     def __str__(self):
         """Returns a string representation for display."""
@@ -37,27 +52,34 @@ class CocktailRecipe:
     """
     Represents a cocktail recipe.
     """
+    __slots__ = ("name", "ingredients", "preparation_instructions", "garnish_suggestion",
+                 "description", "image_url", "local_image_path", "source")
+
     def __init__(self, name: str, ingredients: list[IngredientRequirement],
                  preparation_instructions: str, garnish_suggestion: str = "",
                  description: str = "", image_url: str = "",
-                 local_image_path: str = None):
+                 local_image_path: str = None, source: str = ""):
         """
         Initializes a CocktailRecipe.
 
         Args:
             name (str): The name of the cocktail (e.g., "Gin & Tonic").
-            ingredients (list[IngredientRequirement]): A list of IngredientRequirement objects.
+            ingredients (list[IngredientRequirement]): The IngredientRequirement objects.
+                                                       Stored as a tuple.
             preparation_instructions (str): How to make the cocktail.
             garnish_suggestion (str, optional): Suggested garnish. Defaults to an empty string.
             description (str, optional): A brief description of the cocktail. Defaults to an empty string.
+            source (str, optional): Where the recipe was loaded from ("curated", "api" or "builtin").
+                                    Set by the catalog merge if left empty.
         """
         self.name = name
-        self.ingredients = ingredients  # This will be a list of IngredientRequirement objects
+        self.ingredients = tuple(ingredients)  # IngredientRequirement objects; a tuple is smaller than a list
         self.preparation_instructions = preparation_instructions
         self.garnish_suggestion = garnish_suggestion
         self.description = description
         self.image_url = image_url  # Optional, can be used for future phases with images
         self.local_image_path = local_image_path  # Optional, for local image storage in future phases
+        self.source = source
 
     def display_recipe(self):
         """Prints the details of the cocktail recipe."""
@@ -121,9 +143,17 @@ COCKTAIL_RECIPES = [
     # Add 5-10 recipes to start
 ]
 
-# You can add a simple function to get all recipes
-def get_all_recipes() -> list[CocktailRecipe]:
-    return COCKTAIL_RECIPES
+def get_builtin_recipes() -> list[CocktailRecipe]:
+    """
+    Returns the built-in example recipes (the fallback when no catalog is available),
+    as copies labelled "builtin", so catalogs built from them never modify COCKTAIL_RECIPES.
+    """
+    recipes = []
+    for recipe in COCKTAIL_RECIPES:
+        recipe = copy.copy(recipe)
+        recipe.source = "builtin"
+        recipes.append(recipe)
+    return recipes
 
 
 # Still in src/cocktail_manager.py
@@ -131,35 +161,45 @@ def get_all_recipes() -> list[CocktailRecipe]:
 # Assuming your InventoryItem and subclasses (Spirit, Mixer, Garnish)
 # are defined in src.inventory_manager (adjust import if different)
 from inventory_manager import InventoryItem # Use a relative import if in the same package
+from taxonomy import Taxonomy
 
-def find_makeable_cocktails(inventory: list[InventoryItem], recipes: list[CocktailRecipe]) -> list[CocktailRecipe]:
+def find_makeable_cocktails(inventory: list[InventoryItem], recipes: list[CocktailRecipe],
+                            taxonomy: Taxonomy = None) -> list[CocktailRecipe]:
     """
     Determines which cocktails can be made from the given inventory.
 
     Args:
         inventory (list[InventoryItem]): A list of items currently in the bar.
         recipes (list[CocktailRecipe]): A list of all known cocktail recipes.
+        taxonomy (Taxonomy, optional): Ingredient taxonomy. When given, categories are matched
+                                       through it (synonyms, parent categories, substitutions),
+                                       so e.g. a "Rum" item satisfies "Light rum". Defaults to
+                                       None (exact, case-insensitive category matching).
 
     Returns:
         list[CocktailRecipe]: A list of cocktail recipes that can be made.
     """
     makeable_cocktails = []
-    inventory_categories = {item.category.lower() for item in inventory} # For quick lookup, case-insensitive
+    inventory_categories = set() # For quick lookup, case-insensitive
     # For brand checking, create a set of (category.lower(), brand.lower()) or (category.lower(), name.lower())
     # This helps if a specific brand is required.
     inventory_category_brands = set()
     for item in inventory:
-        inventory_category_brands.add( (item.category.lower(), item.brand.lower()) )
-        # If brand is often part of the name for unique items like "Campari", also consider adding item.name
-        if item.name.lower() == item.brand.lower() or item.brand.lower() == "n/a": # crude check if name IS the brand
-             inventory_category_brands.add( (item.category.lower(), item.name.lower()) )
+        # With a taxonomy, an item counts for every category it can fill (precomputed, O(1) lookup)
+        item_categories = taxonomy.satisfies(item.category) if taxonomy else (item.category.lower(),)
+        for category in item_categories:
+            inventory_categories.add(category)
+            inventory_category_brands.add( (category, item.brand.lower()) )
+            # If brand is often part of the name for unique items like "Campari", also consider adding item.name
+            if item.name.lower() == item.brand.lower() or item.brand.lower() == "n/a": # crude check if name IS the brand
+                 inventory_category_brands.add( (category, item.name.lower()) )
 
 
     for recipe in recipes:
         can_make_cocktail = True
         for req in recipe.ingredients:
             # Normalize category for comparison
-            required_category_lower = req.category_needed.lower()
+            required_category_lower = taxonomy.canonical(req.category_needed) if taxonomy else req.category_needed.lower()
             
             ingredient_found = False
             if req.specific_brand_optional:
@@ -238,55 +278,264 @@ CLASSIC_COCKTAIL_NAMES = [
     "Screwdriver", "Long Island Iced Tea", "Bellini", "French 75", "Caipirinha",
 ]
 
-_COCKTAIL_RECIPE_CACHE = {} # In-memory cache for CocktailRecipe objects for the current session
+_COCKTAIL_RECIPE_CACHE = {} # Normalized recipe name -> CocktailRecipe (None for API misses) for the current session
+
+# With no catalog files the catalog comes from the API (or just the built-in recipes when it
+# is unreachable). CatalogCache keeps such a fallback catalog only this long, so the API is retried.
+FALLBACK_CATALOG_TTL_SECONDS = 60
+
+# --- Catalog merge ---
+# Sources in priority order: when several sources have the same cocktail, the first one's entry is kept.
+# API recipes beat the built-in examples so the result doesn't change once they are saved to the curated file.
+RECIPE_SOURCES = ("curated", "api", "builtin")
+
+
+def normalize_recipe_name(name: str) -> str:
+    """
+    Normalizes a cocktail name for matching: lowercase, no accents or punctuation,
+    "&" read as "and" ("Gin & Tonic", "Gin and Tonic" -> "gin and tonic").
+    """
+    decomposed = unicodedata.normalize("NFKD", name.replace("&", " and ").lower())
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", without_accents).split())
+
+
+def recipe_content_hash(recipe: CocktailRecipe) -> str:
+    """
+    Canonical content hash of a recipe: its normalized name plus its sorted set of
+    (category, brand) requirements. Quantities, instructions and the like don't count.
+    """
+    requirements = sorted({(" ".join(req.category_needed.lower().split()),
+                            " ".join((req.specific_brand_optional or "").lower().split()))
+                           for req in recipe.ingredients})
+    content = normalize_recipe_name(recipe.name) + "\n" + "\n".join(f"{category}|{brand}" for category, brand in requirements)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def iter_merged_recipes(sources: Iterable[tuple[str, Iterable[CocktailRecipe]]],
+                        stats: dict = None) -> Iterator[CocktailRecipe]:
+    """
+    Merges recipe sources into one catalog with a single entry per cocktail, in one pass.
+
+    Recipes are identified by normalized name. The first recipe seen for a name is kept, so
+    pass sources in priority order (see RECIPE_SOURCES). A later recipe with the same content
+    hash is an exact duplicate and is dropped silently; one with the same name but other
+    ingredients is a conflicting variant, dropped with a warning naming both sources.
+    Kept recipes without a source get the label of theirs.
+
+    Args:
+        sources: (source label, recipes) pairs, highest priority first.
+        stats (dict, optional): Filled with "kept", "duplicates" and "variants" counts, and
+                                "dropped_variants": (name, source) of each dropped variant.
+    """
+    counts = stats if stats is not None else {}
+    counts.update(kept=0, duplicates=0, variants=0, dropped_variants=[])
+    kept = {} # normalized name -> (content hash, source) of the kept recipe
+    for source, recipes in sources:
+        for recipe in recipes:
+            name_key = normalize_recipe_name(recipe.name)
+            content_hash = recipe_content_hash(recipe)
+            if name_key not in kept:
+                if not recipe.source:
+                    recipe.source = source
+                kept[name_key] = (content_hash, recipe.source)
+                counts["kept"] += 1
+                yield recipe
+            elif kept[name_key][0] == content_hash:
+                counts["duplicates"] += 1
+            else:
+                counts["variants"] += 1
+                counts["dropped_variants"].append((recipe.name, recipe.source or source))
+                print(f"Warning: Dropping the {recipe.source or source} recipe for '{recipe.name}': its ingredients "
+                      f"differ from the {kept[name_key][1]} recipe of that name, which is kept.")
+
+
+def merge_recipe_sources(sources: Iterable[tuple[str, Iterable[CocktailRecipe]]]) -> list[CocktailRecipe]:
+    """Merges recipe sources into a deduplicated list (see iter_merged_recipes)."""
+    stats = {}
+    recipes = list(iter_merged_recipes(sources, stats))
+    if stats["duplicates"] or stats["variants"]:
+        print(f"Merged {stats['kept']} recipes; dropped {stats['duplicates']} duplicate(s) "
+              f"and {stats['variants']} conflicting variant(s).")
+    return recipes
+
+
+class CatalogCache:
+    """
+    Keeps the loaded catalog (and anything derived from it, like indexes) in memory for
+    long-lived processes, revalidated against the catalog files on every access.
+
+    Each access stats the curated JSON file and its binary catalog and compares
+    (mtime, size, inode) with what was seen when the catalog was loaded; the catalog is only
+    reloaded when one of them changed (or after invalidate()). A catalog loaded while neither
+    file existed is a fallback and expires after FALLBACK_CATALOG_TTL_SECONDS. Treat the
+    returned recipe list as read-only: it is shared by every caller.
+
+    The loader runs outside the lock, so a slow load (e.g. from the API) doesn't block
+    callers that only need the stamps checked; concurrent misses may load more than once.
+    """
+    def __init__(self, loader):
+        self._loader = loader       # lazy -> recipe list
+        self._lock = threading.Lock()
+        self._recipes = None
+        self._lazy = False          # Whether the cached recipes are lazy stubs
+        self._stamp = None
+        self._expires = None        # time.monotonic() deadline for a fallback catalog
+        self._generation = 0        # Bumped whenever the cached catalog is replaced or dropped
+        self._derived = {}          # key -> value built from the cached recipes
+        self.hits = 0
+        self.reloads = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _file_stamp(filepath: str) -> tuple[int, int, int] | None:
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def _current_stamp(self) -> tuple:
+        return (self._file_stamp(CURATED_COCKTAILS_FILE),
+                self._file_stamp(binary_catalog_path(CURATED_COCKTAILS_FILE)))
+
+    def get(self, lazy: bool = False) -> list[CocktailRecipe]:
+        """Returns the catalog, reloading it only if the files changed since it was loaded."""
+        stamp = self._current_stamp()
+        with self._lock:
+            # Full recipes can serve lazy requests, but not the other way round
+            if (self._recipes is not None and stamp == self._stamp and (lazy or not self._lazy)
+                    and (self._expires is None or time.monotonic() < self._expires)):
+                self.hits += 1
+                return self._recipes
+            generation = self._generation
+        recipes = self._loader(lazy)
+        after = self._current_stamp()
+        with self._lock:
+            self.reloads += 1
+            if self._generation != generation: # Replaced or invalidated while loading; don't clobber it
+                return recipes
+            # If the JSON file didn't change while loading, any binary catalog change was the
+            # rebuild done by this load; otherwise keep the earlier stamp and reload next time
+            self._stamp = after if after[0] == stamp[0] else stamp
+            self._expires = time.monotonic() + FALLBACK_CATALOG_TTL_SECONDS if self._stamp == (None, None) else None
+            self._recipes = recipes
+            self._lazy = lazy
+            self._derived = {}
+            self._generation += 1
+            return recipes
+
+    def derived(self, key, build, lazy: bool = True):
+        """
+        Returns build(recipes) for the current catalog, memoized under `key` until the catalog
+        is reloaded. Use it for indexes and other structures computed from the catalog.
+        """
+        recipes = self.get(lazy)
+        with self._lock:
+            if self._recipes is recipes and key in self._derived:
+                return self._derived[key]
+        value = build(recipes)
+        with self._lock:
+            if self._recipes is recipes: # Don't cache against a catalog reloaded meanwhile
+                self._derived[key] = value
+        return value
+
+    def invalidate(self):
+        """Drops the cached catalog and derived values; the next access reloads."""
+        with self._lock:
+            self._recipes = None
+            self._stamp = None
+            self._expires = None
+            self._derived = {}
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "reloads": self.reloads, "invalidations": self.invalidations}
+
+
+def get_all_recipes(lazy: bool = False) -> list[CocktailRecipe]:
+    """
+    Returns all cocktail recipes, from CATALOG_CACHE: the catalog is loaded once (see
+    _load_all_recipes) and reloaded only when its files change. Treat the list as read-only.
+
+    Args:
+        lazy (bool): Allow LazyCocktailRecipe stubs, which keep only names and ingredients
+                     in memory. Use it when only matching is needed.
+    """
+    return CATALOG_CACHE.get(lazy)
+
 
-def get_all_recipes() -> list[CocktailRecipe]:
+def _load_all_recipes(lazy: bool = False) -> list[CocktailRecipe]:
     """
     Fetches all cocktail recipes.
-    Prioritizes loading from CURATED_COCKTAILS_FILE.
-    If not found, fetches a predefined list of classics from TheCocktailDB API,
-    saves them to CURATED_COCKTAILS_FILE, and returns them.
-    Uses an in-memory cache for the session.
+    Prioritizes the binary catalog built by `populate_cocktails.py --binary` (memory-mapped,
+    rebuilt automatically when CURATED_COCKTAILS_FILE is newer), then CURATED_COCKTAILS_FILE.
+    If neither is found, fetches a predefined list of classics from TheCocktailDB API
+    and saves them to CURATED_COCKTAILS_FILE.
+    The built-in recipes are merged in behind those (see iter_merged_recipes), so every
+    cocktail appears once. Uses an in-memory cache for the session.
+
+    Args:
+        lazy (bool): Load recipes from the file as LazyCocktailRecipe stubs, which keep only
+                     names and ingredients in memory (from a binary catalog: a MappedRecipeList).
+                     Use it when only matching is needed. Otherwise every recipe is decoded in full.
     """
     global _COCKTAIL_RECIPE_CACHE # In-memory cache for the session
 
-    # Try loading from the curated JSON file first
-    loaded_recipes = load_curated_cocktail_recipes(CURATED_COCKTAILS_FILE)
+    # A binary catalog opens in constant time and decodes recipes on access.
+    # It was merged with the built-in recipes when it was built.
+    mapped_recipes = load_binary_cocktail_recipes(CURATED_COCKTAILS_FILE)
+    if mapped_recipes:
+        if lazy:
+            return mapped_recipes
+        recipes = mapped_recipes.materialize()
+        mapped_recipes.catalog.close()
+        return recipes
+
+    # Otherwise load from the curated JSON file
+    loaded_recipes = load_curated_cocktail_recipes(CURATED_COCKTAILS_FILE, lazy)
     if loaded_recipes:
+        recipes = merge_recipe_sources([("curated", loaded_recipes), ("builtin", get_builtin_recipes())])
         # Populate in-memory cache from file for consistency if needed by other parts
-        for recipe in loaded_recipes:
-            if recipe.name not in _COCKTAIL_RECIPE_CACHE:
-                 _COCKTAIL_RECIPE_CACHE[recipe.name] = recipe
-        return loaded_recipes
+        for recipe in recipes:
+            _COCKTAIL_RECIPE_CACHE.setdefault(normalize_recipe_name(recipe.name), recipe)
+        return recipes
 
     # If curated file not found or empty, fetch from API, save, and return
     print(f"'{CURATED_COCKTAILS_FILE}' not found or empty. Fetching classics from API...")
     api_fetched_recipes = []
+    names_to_fetch = [name for name in CLASSIC_COCKTAIL_NAMES if normalize_recipe_name(name) not in _COCKTAIL_RECIPE_CACHE]
+    api_results = fetch_cocktails(names_to_fetch) # Concurrent, pooled and rate-limited
+
     for name in CLASSIC_COCKTAIL_NAMES: #
-        if name in _COCKTAIL_RECIPE_CACHE: # Should be empty if file wasn't loaded
-            recipe_obj = _COCKTAIL_RECIPE_CACHE[name]
-            if recipe_obj: # Make sure it's not None if cache was somehow populated with a miss
+        name_key = normalize_recipe_name(name)
+        if name_key in _COCKTAIL_RECIPE_CACHE: # Fetched earlier this session
+            recipe_obj = _COCKTAIL_RECIPE_CACHE[name_key]
+            if recipe_obj: # None marks a cached miss
                  api_fetched_recipes.append(recipe_obj)
             continue
 
-        api_data = search_cocktail_by_name(name) #
+        api_data = api_results.get(name)
         if api_data and api_data.get("drinks"):
             # The _parse_api_cocktail_data function needs to create CocktailRecipe objects
             # Ensure it's using the updated CocktailRecipe constructor (with local_image_path=None)
             parsed_recipe = _parse_api_cocktail_data(api_data["drinks"][0]) #
             if parsed_recipe:
                 api_fetched_recipes.append(parsed_recipe)
-                _COCKTAIL_RECIPE_CACHE[name] = parsed_recipe
-                time.sleep(0.2) 
+                # Keyed on the name the API returned, so "Gin and Tonic" and "Gin & Tonic" share an entry
+                _COCKTAIL_RECIPE_CACHE[normalize_recipe_name(parsed_recipe.name)] = parsed_recipe
         else:
             print(f"Could not fetch or parse recipe for: {name} from API.")
-            _COCKTAIL_RECIPE_CACHE[name] = None # Cache the miss to avoid re-fetching in this session
+            if api_data is not None: # Not found; a failed request (None) is retried next time
+                _COCKTAIL_RECIPE_CACHE[name_key] = None # Cache the miss to avoid re-fetching in this session
 
+    api_fetched_recipes = merge_recipe_sources([("api", api_fetched_recipes)])
     if api_fetched_recipes:
         print(f"Saving {len(api_fetched_recipes)} API-fetched recipes to '{CURATED_COCKTAILS_FILE}'...")
         save_cocktail_recipes_to_json(api_fetched_recipes, CURATED_COCKTAILS_FILE)
     
-    return api_fetched_recipes
+    return merge_recipe_sources([("api", api_fetched_recipes), ("builtin", get_builtin_recipes())])
 
 
 def _ingredient_req_to_dict(req: IngredientRequirement) -> dict:
@@ -333,7 +582,8 @@ def _dict_to_cocktail_recipe(data: dict) -> CocktailRecipe | None:
             garnish_suggestion=data.get("garnish_suggestion", ""),
             description=data.get("description", ""),
             image_url=data.get("image_url", ""),
-            local_image_path=data.get("local_image_path") # Will be added in Step 2
+            local_image_path=data.get("local_image_path"), # Will be added in Step 2
+            source=data.get("source", "")
         )
     except Exception as e:
         print(f"Error converting dict to CocktailRecipe for '{data.get('name')}': {e}")
@@ -344,38 +594,356 @@ CURATED_COCKTAILS_FILE = "data/cocktails.json"
 
 # In src/cocktail_manager.py (continued)
 
-def load_curated_cocktail_recipes(filepath: str = CURATED_COCKTAILS_FILE) -> list[CocktailRecipe]:
-    """Loads cocktail recipes from a JSON file."""
+# Bytes read from the catalog file at a time by the streaming loader
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Fields a LazyCocktailRecipe leaves on disk until first access, with their defaults
+LAZY_RECIPE_FIELDS = {
+    "preparation_instructions": "No instructions provided.",
+    "garnish_suggestion": "",
+    "description": "",
+    "image_url": "",
+    "local_image_path": None,
+}
+
+
+class LazyCocktailRecipe(CocktailRecipe):
+    """
+    A CocktailRecipe stub that holds only the name and ingredients (all the matcher needs).
+    The heavy fields (instructions, garnish, description, image metadata) stay in the catalog
+    file; the first access to any of them re-reads this recipe's record, using the byte
+    offset and length remembered at load time, and fills them all in.
+    """
+    __slots__ = ("_source_path", "_source_offset", "_source_length")
+
+    def __init__(self, name: str, ingredients: list[IngredientRequirement],
+                 source_path: str, source_offset: int, source_length: int, source: str = ""):
+        # Heavy slots are deliberately left unset: reading one calls __getattr__
+        self.name = name
+        self.ingredients = tuple(ingredients)
+        self.source = source
+        self._source_path = source_path
+        self._source_offset = source_offset
+        self._source_length = source_length
+
+    def __getattr__(self, attribute: str):
+        # Only called for unset slots; anything else is a genuine missing attribute
+        if attribute not in LAZY_RECIPE_FIELDS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute}'")
+        self._hydrate()
+        return getattr(self, attribute)
+
+    def _hydrate(self):
+        """Fills in all heavy fields from the recipe's source."""
+        data = self._read_details()
+        for field, default in LAZY_RECIPE_FIELDS.items():
+            setattr(self, field, data.get(field, default))
+
+    def _read_details(self) -> dict:
+        """Reads this recipe's record from the JSON catalog; {} if it can't be read."""
+        data = {}
+        try:
+            with open(self._source_path, 'rb') as f:
+                f.seek(self._source_offset)
+                data = json.loads(f.read(self._source_length).decode('utf-8'))
+            if not isinstance(data, dict) or data.get("name") != self.name:
+                print(f"Warning: '{self._source_path}' changed since '{self.name}' was loaded; details unavailable.")
+                data = {}
+        except (IOError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            print(f"Error loading details for '{self.name}' from {self._source_path}: {e}")
+        return data
+
+
+def _iter_json_array(filepath: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[tuple[int, int, dict]]:
+    """
+    Parses a file holding a JSON array incrementally, one element at a time.
+    Only the current chunk and the element being decoded are held in memory.
+
+    Yields:
+        (byte offset, byte length, parsed element) for each element of the array.
+
+    Raises:
+        json.JSONDecodeError: If the file isn't a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    with open(filepath, 'rb') as f:
+        buffer = ""
+        position = 0        # Parse position within buffer
+        byte_offset = 0     # File offset of buffer[position]
+        at_eof = False
+        started = False
+
+        def skip(characters: str):
+            # Advances past the given (ASCII) separator characters
+            nonlocal position, byte_offset
+            while position < len(buffer) and buffer[position] in characters:
+                position += 1
+                byte_offset += 1
+
+        while True:
+            skip(" \t\r\n," if started else " \t\r\n")
+            if position < len(buffer):
+                if not started:
+                    if buffer[position] != "[":
+                        raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+                    started = True
+                    position += 1
+                    byte_offset += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_eof:
+                        raise
+                else:
+                    length = len(buffer[position:end].encode('utf-8'))
+                    yield byte_offset, length, element
+                    byte_offset += length
+                    position = end
+                    continue
+            elif at_eof:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+
+            # Need more input (empty buffer or an element continuing in the next chunk):
+            # drop the consumed prefix and read the next chunk
+            chunk = f.read(chunk_size)
+            at_eof = not chunk
+            buffer = buffer[position:] + utf8.decode(chunk, final=at_eof)
+            position = 0
+
+
+def iter_cocktail_recipes(filepath: str = CURATED_COCKTAILS_FILE, lazy: bool = False) -> Iterator[CocktailRecipe]:
+    """
+    Streams recipes from a JSON catalog file without loading the whole file.
+    Records that can't be converted are skipped (with a warning).
+
+    Args:
+        filepath (str): The catalog file.
+        lazy (bool): Yield LazyCocktailRecipe stubs (name and ingredients only; the other
+                     fields are read from the file on first access) instead of full recipes.
+
+    Raises:
+        IOError, json.JSONDecodeError: If the file can't be read or isn't a JSON array.
+    """
+    for offset, length, data in _iter_json_array(filepath):
+        if not lazy:
+            recipe = _dict_to_cocktail_recipe(data)
+        else:
+            recipe = _dict_to_lazy_cocktail_recipe(data, filepath, offset, length)
+        if recipe: # Only yield if parsing was successful
+            yield recipe
+
+
+def _dict_to_lazy_cocktail_recipe(data: dict, filepath: str, offset: int, length: int) -> LazyCocktailRecipe | None:
+    """Converts a catalog record to a LazyCocktailRecipe stub pointing back at the record."""
+    try:
+        ingredients = [_dict_to_ingredient_req(req_data) for req_data in data.get("ingredients", [])]
+        if not data.get("name") or not ingredients:
+            print(f"Warning: Skipping recipe due to missing name or ingredients. Data: {data.get('name')}")
+            return None
+        return LazyCocktailRecipe(data["name"], ingredients, os.path.abspath(filepath), offset, length)
+    except Exception as e:
+        print(f"Error converting dict to CocktailRecipe for '{data.get('name')}': {e}")
+        return None
+
+
+def load_curated_cocktail_recipes(filepath: str = CURATED_COCKTAILS_FILE, lazy: bool = False) -> list[CocktailRecipe]:
+    """
+    Loads cocktail recipes from a JSON file.
+    The file is parsed incrementally; with lazy=True only names and ingredients are
+    kept in memory (see LazyCocktailRecipe).
+    """
     if not os.path.exists(filepath):
         print(f"Info: Curated cocktails file '{filepath}' not found.")
         return []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            list_of_dicts = json.load(f)
-        
-        recipes = []
-        for data in list_of_dicts:
-            recipe = _dict_to_cocktail_recipe(data)
-            if recipe: # Only add if parsing was successful
-                recipes.append(recipe)
+        recipes = list(iter_cocktail_recipes(filepath, lazy))
         print(f"Loaded {len(recipes)} recipes from {filepath}")
         return recipes
     except (IOError, json.JSONDecodeError) as e:
         print(f"Error loading or parsing {filepath}: {e}")
         return []
 
+# In-process catalog cache used by get_all_recipes
+CATALOG_CACHE = CatalogCache(_load_all_recipes)
+
+
+# --- Binary catalog (see catalog_binary.py) ---
+
+def binary_catalog_path(json_path: str = CURATED_COCKTAILS_FILE) -> str:
+    """The binary catalog built from a JSON catalog lives next to it ("cocktails.json" -> "cocktails.bin")."""
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+class MappedCocktailRecipe(LazyCocktailRecipe):
+    """
+    A recipe backed by a record of a memory-mapped binary catalog. Name and ingredients are
+    decoded when the recipe is first taken from the catalog; the heavy fields on first access.
+    Pickles as a plain CocktailRecipe (a memory map can't be sent to another process).
+    """
+    __slots__ = ("_catalog", "_position")
+
+    def __init__(self, name: str, ingredients: list[IngredientRequirement],
+                 catalog: BinaryCatalogReader, position: int, source: str = ""):
+        self.name = name
+        self.ingredients = tuple(ingredients)
+        self.source = source
+        self._catalog = catalog
+        self._position = position
+
+    def _read_details(self) -> dict:
+        return self._catalog.details(self._position)
+
+    def __reduce__(self):
+        return (CocktailRecipe, (self.name, list(self.ingredients), self.preparation_instructions,
+                                 self.garnish_suggestion, self.description, self.image_url, self.local_image_path,
+                                 self.source))
+
+
+class MappedRecipeList(Sequence):
+    """
+    Read-only list of the recipes in a binary catalog. Opening it costs the same whatever
+    the catalog size; each recipe is decoded the first time it is accessed and then reused.
+    """
+    def __init__(self, catalog: BinaryCatalogReader):
+        self.catalog = catalog
+        self._recipes = [None] * len(catalog)
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        recipe = self._recipes[index]
+        if recipe is None:
+            position = range(len(self))[index] # Normalizes negative indices, raises IndexError
+            ingredients = [IngredientRequirement(category, quantity, brand)
+                           for category, quantity, brand in self.catalog.ingredients(position)]
+            recipe = self._recipes[position] = MappedCocktailRecipe(self.catalog.name(position), ingredients,
+                                                                    self.catalog, position,
+                                                                    self.catalog.source(position) or "")
+        return recipe
+
+    def materialize(self) -> list[CocktailRecipe]:
+        """Decodes every recipe in full into plain CocktailRecipe objects, which don't need the catalog."""
+        recipes = []
+        for position in range(len(self)):
+            ingredients = [IngredientRequirement(category, quantity, brand)
+                           for category, quantity, brand in self.catalog.ingredients(position)]
+            recipes.append(CocktailRecipe(self.catalog.name(position), ingredients,
+                                          source=self.catalog.source(position) or "", **self.catalog.details(position)))
+        return recipes
+
+
+def build_binary_catalog(json_path: str = CURATED_COCKTAILS_FILE, binary_path: str = None) -> int:
+    """
+    Builds the binary catalog for a JSON catalog (by default next to it, see binary_catalog_path).
+    The JSON recipes are merged with the built-in ones, as get_all_recipes does. The written
+    file is checked against its checksum once here, so opening it later needn't read it all.
+
+    Returns:
+        int: The number of recipes written, or 0 if the JSON catalog couldn't be read or the
+             written catalog failed its checksum (it is then removed).
+    """
+    binary_path = binary_path or binary_catalog_path(json_path)
+    source_stat = os.stat(json_path)
+    try:
+        merged = iter_merged_recipes([("curated", iter_cocktail_recipes(json_path)), ("builtin", get_builtin_recipes())])
+        count = write_binary_catalog((dict(_cocktail_recipe_to_dict(recipe), source=recipe.source) for recipe in merged),
+                                     binary_path, json_path)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Error building binary catalog {binary_path} from {json_path}: {e}")
+        return 0
+    try:
+        with BinaryCatalogReader(binary_path) as catalog:
+            catalog.verify()
+    except (OSError, CatalogFormatError) as e:
+        print(f"Error: The binary catalog just built is unusable ({e}). Removing it.")
+        os.remove(binary_path)
+        return 0
+    if os.stat(json_path).st_mtime_ns != source_stat.st_mtime_ns:
+        print(f"Warning: {json_path} changed while {binary_path} was being built; it will be rebuilt on next load.")
+    print(f"Built binary catalog {binary_path} with {count} recipes")
+    return count
+
+
+def load_binary_cocktail_recipes(json_path: str = CURATED_COCKTAILS_FILE) -> MappedRecipeList | None:
+    """
+    Opens the binary catalog next to `json_path`, rebuilding it first if the JSON catalog
+    has changed since it was built (or if its header or size is invalid).
+
+    Returns:
+        MappedRecipeList, or None if there is no binary catalog or it can't be used
+        (callers then load the JSON catalog).
+    """
+    binary_path = binary_catalog_path(json_path)
+    if not os.path.exists(binary_path):
+        return None
+    try:
+        catalog = BinaryCatalogReader(binary_path)
+        if catalog.is_current(json_path):
+            return MappedRecipeList(catalog)
+        catalog.close()
+        print(f"{json_path} is newer than {binary_path}. Rebuilding the binary catalog...")
+    except CatalogFormatError as e:
+        print(f"Binary catalog unusable: {e} Rebuilding it...")
+    except OSError as e:
+        print(f"Error opening binary catalog {binary_path}: {e}")
+        return None
+
+    if not os.path.exists(json_path) or not build_binary_catalog(json_path, binary_path):
+        return None
+    try:
+        return MappedRecipeList(BinaryCatalogReader(binary_path))
+    except (OSError, CatalogFormatError) as e:
+        print(f"Error opening rebuilt binary catalog {binary_path}: {e}")
+        return None
+
+
 def save_cocktail_recipes_to_json(recipes: list[CocktailRecipe], filepath: str = CURATED_COCKTAILS_FILE):
     """Saves a list of CocktailRecipe objects to a JSON file."""
     try:
-        # Ensure the directory exists
-        directory = os.path.dirname(filepath)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Created directory: {directory}")
-
-        list_of_dicts = [_cocktail_recipe_to_dict(recipe) for recipe in recipes]
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(list_of_dicts, f, indent=4)
-        print(f"Saved {len(recipes)} recipes to {filepath}")
+        stream_cocktail_recipes_to_json(recipes, filepath)
     except IOError as e:
-        print(f"Error saving recipes to {filepath}: {e}")
\ No newline at end of file
+        print(f"Error saving recipes to {filepath}: {e}")
+
+def stream_cocktail_recipes_to_json(recipes: Iterable[CocktailRecipe], filepath: str = CURATED_COCKTAILS_FILE) -> int:
+    """
+    Writes recipes to a JSON file one at a time, so `recipes` can be a generator
+    and the full list never has to be held in memory. The output matches
+    json.dump(..., indent=4). The file is written to a temporary path and renamed
+    into place, so readers never see a half-written catalog.
+
+    Returns:
+        int: The number of recipes written.
+
+    Raises:
+        IOError: If the file can't be written. The temporary file is removed and the
+                 previous file (if any) is left as it was.
+    """
+    count = 0
+    temp_path = filepath + ".tmp"
+    # Ensure the directory exists
+    directory = os.path.dirname(filepath)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+        print(f"Created directory: {directory}")
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write("[")
+            for recipe in recipes:
+                f.write(",\n" if count else "\n")
+                f.write(textwrap.indent(json.dumps(_cocktail_recipe_to_dict(recipe), indent=4), "    "))
+                count += 1
+            f.write("\n]" if count else "]")
+        os.replace(temp_path, filepath)
+    except IOError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    print(f"Saved {count} recipes to {filepath}")
+    return count
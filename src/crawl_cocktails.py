@@ -0,0 +1,183 @@
+# src/crawl_cocktails.py
+"""
+Mirrors the whole TheCocktailDB catalog into CURATED_COCKTAILS_FILE.
+
+The catalog is enumerated by first letter (a-z, 0-9). A small state file remembers
+a fingerprint of every letter page and every drink seen, so a re-run only parses
+and rewrites the drinks that are new or changed; when nothing changed the curated
+file is not touched at all.
+
+Usage (from the project root):
+    python src/crawl_cocktails.py                 # incremental refresh
+    python src/crawl_cocktails.py --full          # ignore the saved state
+    python src/crawl_cocktails.py --base-url http://127.0.0.1:8000/ --record fixtures/
+"""
+import argparse
+import hashlib
+import json
+import os
+import string
+from concurrent.futures import ThreadPoolExecutor
+
+import api_client
+from api_client import list_cocktails_by_first_letter
+from cocktail_manager import (CURATED_COCKTAILS_FILE, CocktailRecipe, _parse_api_cocktail_data,
+                              iter_cocktail_recipes, stream_cocktail_recipes_to_json)
+
+CRAWL_STATE_FILE = "data/crawl_state.json"
+CATALOG_LETTERS = string.ascii_lowercase + string.digits
+
+
+def _fingerprint(data) -> str:
+    """Stable hash of a JSON-serializable value."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_state(state_file: str) -> dict:
+    """Loads the crawl state: {"pages": {letter: hash}, "drinks": {idDrink: {"name", "hash"}}}."""
+    if not os.path.exists(state_file):
+        return {"pages": {}, "drinks": {}}
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return {"pages": state.get("pages", {}), "drinks": state.get("drinks", {})}
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not read crawl state '{state_file}' ({e}). Doing a full crawl.")
+        return {"pages": {}, "drinks": {}}
+
+
+def _save_state(state: dict, state_file: str):
+    directory = os.path.dirname(state_file)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    temp_path = state_file + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(temp_path, state_file)
+
+
+def _read_curated(curated_file: str) -> list[CocktailRecipe] | None:
+    """The recipes in the curated file, or None if it is missing or can't be read."""
+    if not os.path.exists(curated_file):
+        print(f"Info: '{curated_file}' not found.")
+        return None
+    try:
+        return list(iter_cocktail_recipes(curated_file))
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Error: Could not read '{curated_file}' ({e}).")
+        return None
+
+
+def _fetch_pages(letters: str, max_workers: int, record_dir: str = None) -> dict:
+    """Fetches the letter pages concurrently (paced by api_client's rate limiter)."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pages = dict(zip(letters, executor.map(list_cocktails_by_first_letter, letters)))
+
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+        for letter, page in pages.items():
+            if page is not None:
+                with open(os.path.join(record_dir, f"search_f_{letter}.json"), 'w', encoding='utf-8') as f:
+                    json.dump(page, f)
+        print(f"Recorded {sum(page is not None for page in pages.values())} letter pages to {record_dir}")
+    return pages
+
+
+def crawl_catalog(curated_file: str = CURATED_COCKTAILS_FILE, state_file: str = CRAWL_STATE_FILE,
+                  full: bool = False, max_workers: int = api_client.DEFAULT_MAX_WORKERS,
+                  record_dir: str = None) -> dict:
+    """
+    Crawls the catalog and merges new or changed drinks into `curated_file`.
+
+    Recipes already in the curated file that the API doesn't know about (e.g. hand-added
+    ones) are kept. Letter pages that fail to download leave their drinks untouched.
+    The saved state describes what is in the curated file, so if that file is missing or
+    can't be read the crawl is a full one.
+
+    The crawl state is saved only once the curated file is safely in place: if writing it
+    fails, the file and the state are both left as they were, and the next run retries.
+
+    Returns:
+        dict: Counts of "new", "changed", "unchanged" and "failed_pages", plus "written"
+              (recipes in the curated file, or 0 if it was left untouched) and
+              "write_failed" (True if the curated file could not be written).
+    """
+    state = {"pages": {}, "drinks": {}} if full else _load_state(state_file)
+    existing_recipes = _read_curated(curated_file)
+    if existing_recipes is None and (state["pages"] or state["drinks"]):
+        print("The crawl state doesn't match the curated file. Doing a full crawl.")
+        state = {"pages": {}, "drinks": {}}
+    summary = {"new": 0, "changed": 0, "unchanged": 0, "failed_pages": 0, "written": 0, "write_failed": False}
+
+    pages = _fetch_pages(CATALOG_LETTERS, max_workers, record_dir)
+
+    updated_recipes = {} # name -> CocktailRecipe for new/changed drinks
+    renamed_from = set() # old names of drinks whose strDrink changed
+    for letter, page in pages.items():
+        if page is None:
+            summary["failed_pages"] += 1
+            continue
+        page_hash = _fingerprint(page)
+        if state["pages"].get(letter) == page_hash:
+            summary["unchanged"] += len(page.get("drinks") or [])
+            continue # Whole page unchanged; nothing to parse
+        state["pages"][letter] = page_hash
+
+        for drink in page.get("drinks") or []:
+            drink_id = drink.get("idDrink")
+            drink_hash = _fingerprint(drink)
+            previous = state["drinks"].get(drink_id)
+            if previous and previous["hash"] == drink_hash:
+                summary["unchanged"] += 1
+                continue
+            recipe = _parse_api_cocktail_data(drink)
+            if not recipe:
+                continue
+            summary["changed" if previous else "new"] += 1
+            if previous and previous["name"] != recipe.name:
+                renamed_from.add(previous["name"])
+            updated_recipes[recipe.name] = recipe
+            state["drinks"][drink_id] = {"name": recipe.name, "hash": drink_hash}
+
+    if updated_recipes or renamed_from:
+        def merged_recipes():
+            # Existing order first (with updated entries swapped in), then the new drinks
+            for recipe in existing_recipes or []:
+                if recipe.name in renamed_from:
+                    continue
+                yield updated_recipes.pop(recipe.name, recipe)
+            yield from updated_recipes.values()
+
+        try:
+            summary["written"] = stream_cocktail_recipes_to_json(merged_recipes(), curated_file)
+        except IOError as e:
+            print(f"Error: Could not write '{curated_file}' ({e}). Crawl state not saved.")
+            summary["write_failed"] = True
+            return summary
+    else:
+        print(f"No new or changed drinks; '{curated_file}' left untouched.")
+
+    _save_state(state, state_file)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mirror TheCocktailDB catalog into the curated cocktails file.")
+    parser.add_argument("--full", action="store_true", help="Ignore the saved crawl state and re-parse everything.")
+    parser.add_argument("--curated-file", default=CURATED_COCKTAILS_FILE, help="Output catalog JSON file.")
+    parser.add_argument("--state-file", default=CRAWL_STATE_FILE, help="Crawl state file for incremental refreshes.")
+    parser.add_argument("--workers", type=int, default=api_client.DEFAULT_MAX_WORKERS, help="Concurrent page requests.")
+    parser.add_argument("--base-url", default=None,
+                        help="API base URL, e.g. a local fixture server (default: TheCocktailDB).")
+    parser.add_argument("--record", dest="record_dir", default=None,
+                        help="Save the raw letter pages to this directory (for replay with a fixture server).")
+    args = parser.parse_args()
+
+    if args.base_url:
+        api_client.API_BASE_URL = args.base_url
+
+    result = crawl_catalog(args.curated_file, args.state_file, full=args.full,
+                           max_workers=args.workers, record_dir=args.record_dir)
+    print(f"Crawl finished: {result['new']} new, {result['changed']} changed, "
+          f"{result['unchanged']} unchanged, {result['failed_pages']} failed pages"
+          f"{' (the curated file could not be written)' if result['write_failed'] else ''}.")
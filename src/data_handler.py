@@ -1,77 +1,267 @@
 # src/data_handler.py
 import json
 import os
+import sqlite3
 
 # Import your inventory classes. Adjust the path if your structure is different.
 # If data_handler.py is in the same 'src' directory as inventory_manager.py:
 from inventory_manager import InventoryItem, Spirit, Mixer, Garnish
+from description_store import DescriptionStore, is_shareable_description
 
 # Define a default filepath (can be overridden)
 # It's good practice to put data files in a subdirectory like 'data/'
 DEFAULT_INVENTORY_FILE = "data/inventory.json"
 
+# Single-item changes are appended to "<inventory file>.journal" (one JSON record per line)
+# instead of rewriting the inventory file. The inventory file is the snapshot; loading replays
+# the journal on top of it. Once the journal grows past this size it is compacted into a new
+# snapshot.
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# Inventory files with these extensions are SQLite databases (see inventory_repository)
+SQLITE_INVENTORY_EXTENSIONS = (".sqlite3", ".sqlite", ".db")
+
+# --- Item codecs ---
+# Every item type is registered under a type tag (stored as "_type") with its field table:
+# the constructor arguments, in order, that are saved for it. A new InventoryItem subclass
+# only needs a register_item_type() call.
+
+# Version of the saved inventory format. Version 1 files are a bare list of item dicts;
+# from version 2 on the list is wrapped: {"schema_version": 2, "items": [...]}. Version 3
+# adds a "descriptions" table ({content hash: text}); long texts are stored there once and
+# item fields refer to them as {"$description": <hash>}.
+INVENTORY_SCHEMA_VERSION = 3
+
+
+class InventorySchemaError(Exception):
+    """
+    Raised when an inventory file was written by a newer version of this program.
+    Deliberately not a ValueError: callers that treat undecodable files as empty must not
+    catch it, so a file this program can't fully understand is never overwritten.
+    """
+
+_COMMON_ITEM_FIELDS = ("name", "brand", "category", "quantity", "price", "user_notes")
+
+ITEM_TYPES = {} # type tag -> (class, field table)
+_ITEM_TAGS = {} # class -> type tag
+
+
+def register_item_type(item_class: type, fields: tuple[str, ...], tag: str = None):
+    """
+    Registers an InventoryItem class for saving and loading.
+
+    Args:
+        item_class (type): The class; its constructor must accept every field as a keyword.
+        fields (tuple[str, ...]): The attributes saved for it (and passed back to the constructor).
+        tag (str, optional): The "_type" value in saved files. Defaults to the class name.
+    """
+    tag = tag or item_class.__name__
+    ITEM_TYPES[tag] = (item_class, tuple(fields))
+    _ITEM_TAGS[item_class] = tag
+
+
+register_item_type(InventoryItem, _COMMON_ITEM_FIELDS)
+register_item_type(Spirit, _COMMON_ITEM_FIELDS + ("type_of_liquor", "abv", "origin", "tasting_notes", "suggested_pairings_raw"))
+register_item_type(Mixer, _COMMON_ITEM_FIELDS + ("mixer_type",))
+register_item_type(Garnish, _COMMON_ITEM_FIELDS + ("garnish_type",))
+
+
+def _item_tag(item_class: type) -> str:
+    """The type tag of a class, or of its nearest registered base class."""
+    for klass in item_class.__mro__:
+        if klass in _ITEM_TAGS:
+            return _ITEM_TAGS[klass]
+    raise ValueError(f"Unregistered inventory item type: {item_class.__name__}")
+
+
 def _inventory_item_to_dict(item: InventoryItem) -> dict:
     """
     Converts an InventoryItem object (and its subclasses) to a dictionary
-    suitable for JSON serialization.
-    """
-    data = {
-        "_type": item.__class__.__name__,  # Stores the class name (e.g., "Spirit")
-        "name": item.name,
-        "brand": item.brand,
-        "category": item.category,
-        "quantity": item.quantity,
-        "price": item.price, # You added price, which is good!
-        "user_notes": item.user_notes
-    }
-
-    # Add subclass-specific attributes
-    if isinstance(item, Spirit):
-        data["type_of_liquor"] = item.type_of_liquor
-        data["abv"] = item.abv
-        data["origin"] = item.origin
-        data["tasting_notes"] = item.tasting_notes
-        data["suggested_pairings_raw"] = item.suggested_pairings_raw
-    elif isinstance(item, Mixer):
-        data["mixer_type"] = item.mixer_type # You used mixer_type
-    elif isinstance(item, Garnish):
-        data["garnish_type"] = item.garnish_type # You used garnish_type
-    
+    suitable for serialization, using the registered field table of its type.
+    """
+    tag = _item_tag(type(item))
+    data = {"_type": tag}
+    for field in ITEM_TYPES[tag][1]:
+        data[field] = getattr(item, field)
+    if item.enrichment is not None: # Lets later runs skip enhancing this item again
+        data["_enrichment"] = item.enrichment
     return data
 
 def _dict_to_inventory_item(data: dict) -> InventoryItem:
     """
-    Converts a dictionary (from JSON) back to an appropriate InventoryItem subclass instance.
-    """
-    item_type_str = data.pop("_type", None) # Get and remove the _type field
-
-    # The **data syntax unpacks the dictionary `data` into keyword arguments
-    # for the class constructors. This assumes your constructor arguments
-    # match the keys in the dictionary (after _type is removed).
-    if item_type_str == "Spirit":
-        return Spirit(**data)
-    elif item_type_str == "Mixer":
-        return Mixer(**data)
-    elif item_type_str == "Garnish":
-        return Garnish(**data)
-    elif item_type_str == "InventoryItem": # Fallback for generic items if ever needed
-        return InventoryItem(**data)
-    else:
-        # Handle unknown types or corrupted data
-        # You might want to log this error or handle it more gracefully
+    Converts a dictionary (from a saved inventory) back to an appropriate InventoryItem
+    subclass instance. `data` is not modified; keys outside the type's field table are ignored.
+
+    Raises:
+        ValueError: If the type tag is unknown or required fields are missing.
+    """
+    item_type_str = data.get("_type")
+    if item_type_str not in ITEM_TYPES:
         raise ValueError(f"Unknown inventory item type: {item_type_str}")
+    item_class, fields = ITEM_TYPES[item_type_str]
+    try:
+        item = item_class(**{field: data[field] for field in fields if field in data})
+    except TypeError as e: # Missing required fields
+        raise ValueError(f"Invalid {item_type_str} data: {e}") from e
+    item.enrichment = data.get("_enrichment")
+    return item
+
+
+# --- Encodings ---
+# How a saved inventory is turned into bytes. "json" is indented for hand editing;
+# "json-compact" drops the whitespace; "orjson" and "msgpack" are used when installed.
+
+class InventoryEncoding:
+    """
+    A named way to encode the saved inventory (the schema-versioned envelope) to bytes.
+
+    Args:
+        name (str): The name used by save_inventory(encoding=...).
+        dumps (callable): Encodes a JSON-compatible object to bytes.
+        loads (callable): Decodes bytes back; raises ValueError on malformed input.
+        extensions (tuple[str, ...]): File extensions that default to this encoding.
+    """
+    def __init__(self, name: str, dumps, loads, extensions: tuple[str, ...] = ()):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.extensions = extensions
+
+
+ENCODINGS = {} # name -> InventoryEncoding
+
+
+def register_encoding(encoding: InventoryEncoding):
+    """Makes an encoding available to save_inventory and load_inventory."""
+    ENCODINGS[encoding.name] = encoding
+
+
+register_encoding(InventoryEncoding("json", lambda obj: json.dumps(obj, indent=4).encode('utf-8'), json.loads, (".json",)))
+register_encoding(InventoryEncoding("json-compact",
+                                    lambda obj: json.dumps(obj, separators=(",", ":")).encode('utf-8'), json.loads))
+
+try:
+    import orjson
+except ImportError: # orjson is optional
+    orjson = None
+if orjson is not None:
+    register_encoding(InventoryEncoding("orjson", orjson.dumps, orjson.loads))
+    # Every JSON variant reads faster through orjson
+    ENCODINGS["json"].loads = ENCODINGS["json-compact"].loads = orjson.loads
+
+try:
+    import msgpack
+except ImportError: # msgpack is optional
+    msgpack = None
+if msgpack is not None:
+    register_encoding(InventoryEncoding("msgpack", msgpack.packb, lambda data: msgpack.unpackb(data, raw=False),
+                                        (".msgpack", ".mpk")))
+
+
+def _encoding_for(filepath: str, name: str = None) -> InventoryEncoding:
+    """The named encoding, or the one matching the file's extension (JSON by default)."""
+    if name is not None:
+        if name not in ENCODINGS:
+            raise ValueError(f"Unknown or unavailable inventory encoding: {name}. Available: {', '.join(ENCODINGS)}")
+        return ENCODINGS[name]
+    extension = os.path.splitext(filepath)[1].lower()
+    for encoding in ENCODINGS.values():
+        if extension in encoding.extensions:
+            return encoding
+    return ENCODINGS["json"]
+
+
+def encode_inventory(inventory_list: list[InventoryItem], encoding: str = "json") -> bytes:
+    """
+    Encodes items as a schema-versioned inventory document. Long texts (enrichment
+    descriptions repeated across a category) are written once, to the descriptions table.
+    """
+    descriptions = DescriptionStore()
+    item_dicts = []
+    for item in inventory_list:
+        data = _inventory_item_to_dict(item)
+        for field, value in data.items():
+            if is_shareable_description(value):
+                data[field] = {"$description": descriptions.add(value)}
+        item_dicts.append(data)
+    envelope = {"schema_version": INVENTORY_SCHEMA_VERSION, "descriptions": descriptions.to_dict(), "items": item_dicts}
+    return _encoding_for("", encoding).dumps(envelope)
+
+
+def decode_inventory(data: bytes, encoding: str = "json") -> list[dict]:
+    """
+    Decodes an inventory document to its item dicts, accepting every schema version up to
+    INVENTORY_SCHEMA_VERSION. Description references are resolved; items sharing a text
+    get the same string object (one store per document, not the process-wide DESCRIPTIONS, so
+    the texts are freed with the items).
+
+    Raises:
+        ValueError: If the document is malformed.
+        InventorySchemaError: If the document is from a newer schema version.
+    """
+    document = _encoding_for("", encoding).loads(data)
+    if isinstance(document, list): # Version 1: a bare list
+        return document
+    if not isinstance(document, dict) or not isinstance(document.get("items"), list):
+        raise ValueError("Not an inventory document.")
+    if not isinstance(document.get("schema_version", 0), int):
+        raise ValueError(f"Bad inventory schema version {document.get('schema_version')!r}.")
+    if document.get("schema_version", 0) > INVENTORY_SCHEMA_VERSION:
+        raise InventorySchemaError(f"Inventory schema version {document.get('schema_version')} is newer than "
+                         f"this program's ({INVENTORY_SCHEMA_VERSION}).")
+    descriptions = document.get("descriptions")
+    if descriptions:
+        if not isinstance(descriptions, dict) or not all(isinstance(text, str) for text in descriptions.values()):
+            raise ValueError("Malformed descriptions table.")
+        store = DescriptionStore()
+        shared = {key: store.shared(text) for key, text in descriptions.items()}
+        for data in document["items"]:
+            for field, value in data.items():
+                if type(value) is dict and "$description" in value:
+                    if value["$description"] not in shared:
+                        print(f"Warning: Missing description {value['$description']} for {data.get('name')}.")
+                    data[field] = shared.get(value["$description"], "")
+    return document["items"]
     
     
 # Still in src/data_handler.py
 
-def save_inventory(inventory_list: list[InventoryItem], filepath: str = DEFAULT_INVENTORY_FILE):
+def journal_path(filepath: str = DEFAULT_INVENTORY_FILE) -> str:
+    """The journal of pending single-item changes for an inventory file."""
+    return filepath + ".journal"
+
+
+def inventory_item_key(item: InventoryItem) -> str:
+    """Identifies an item across saves: its normalized category, brand and name."""
+    return "|".join(" ".join(str(value).lower().split()) for value in (item.category, item.brand, item.name))
+
+
+def is_sqlite_inventory(filepath: str) -> bool:
+    """True if the inventory file is a SQLite database rather than JSON."""
+    return filepath.lower().endswith(SQLITE_INVENTORY_EXTENSIONS)
+
+
+def open_inventory_repository(filepath: str):
+    """Opens a SQLite inventory (InventoryRepository) for indexed queries."""
+    from inventory_repository import InventoryRepository # Imported here: it builds on this module
+    return InventoryRepository(filepath)
+
+
+def save_inventory(inventory_list: list[InventoryItem], filepath: str = DEFAULT_INVENTORY_FILE,
+                   encoding: str = None):
     """
-    Saves the current inventory list to a JSON file.
+    Saves the current inventory list to a file (a full snapshot), as a schema-versioned document.
+    The file is written to a temporary path and renamed into place, so a crash mid-write
+    leaves the previous snapshot intact. The journal is cleared, since the snapshot now
+    contains every change. A SQLite inventory is replaced in one transaction.
 
     Args:
         inventory_list (list[InventoryItem]): The list of inventory items to save.
-        filepath (str, optional): The path to the JSON file.
+        filepath (str, optional): The path to the inventory file.
                                    Defaults to DEFAULT_INVENTORY_FILE.
+        encoding (str, optional): A name from ENCODINGS ("json", "json-compact", "orjson",
+                                  "msgpack"). Defaults to the one matching the file extension,
+                                  else indented JSON.
     """
     # Ensure the 'data' directory exists
     # os.path.dirname(filepath) gets the directory part of the path
@@ -80,50 +270,245 @@ def save_inventory(inventory_list: list[InventoryItem], filepath: str = DEFAULT_
         os.makedirs(directory) # Create the directory if it doesn't exist
         print(f"Created directory: {directory}")
 
-    list_of_dicts = [_inventory_item_to_dict(item) for item in inventory_list]
-    
+    if is_sqlite_inventory(filepath):
+        try:
+            with open_inventory_repository(filepath) as repository:
+                repository.replace_all(inventory_list)
+            print(f"Inventory successfully saved to {filepath}")
+        except sqlite3.Error as e:
+            print(f"Error: Could not write to database {filepath}. {e}")
+        return
+
+    temp_path = filepath + ".tmp"
     try:
-        with open(filepath, 'w') as f:
-            json.dump(list_of_dicts, f, indent=4) # indent=4 makes the JSON file human-readable
+        encoded = encode_inventory(inventory_list, _encoding_for(filepath, encoding).name)
+        with open(temp_path, 'wb') as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+        # Safe even if we crash before this: replaying the journal onto the new snapshot changes nothing
+        if os.path.exists(journal_path(filepath)):
+            os.remove(journal_path(filepath))
         print(f"Inventory successfully saved to {filepath}")
     except IOError as e:
         print(f"Error: Could not write to file {filepath}. {e}")
-    except TypeError as e:
+    except (TypeError, ValueError) as e:
         print(f"Error: Could not serialize inventory data. {e}")
 
 
-def load_inventory(filepath: str = DEFAULT_INVENTORY_FILE) -> list[InventoryItem]:
+def _append_journal_record(record: dict, filepath: str):
+    """Appends one change record to the journal (O(1) I/O) and compacts it once it is large."""
+    directory = os.path.dirname(filepath)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+        print(f"Created directory: {directory}")
+    with open(journal_path(filepath), 'a') as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+        journal_size = f.tell()
+    if journal_size > JOURNAL_COMPACT_BYTES:
+        try:
+            compact_inventory(filepath)
+        except (IOError, ValueError) as e: # The record is journaled either way
+            print(f"Warning: Could not compact {filepath}; keeping its journal. {e}")
+
+
+def save_inventory_item(item: InventoryItem, filepath: str = DEFAULT_INVENTORY_FILE):
+    """
+    Saves one new or changed item without rewriting the inventory file: the change is
+    appended to the journal. An existing item with the same inventory_item_key is replaced.
+    """
+    if is_sqlite_inventory(filepath):
+        try:
+            with open_inventory_repository(filepath) as repository:
+                repository.put(item)
+        except sqlite3.Error as e:
+            print(f"Error: Could not write to database {filepath}. {e}")
+        return
+    try:
+        _append_journal_record({"op": "put", "key": inventory_item_key(item), "item": _inventory_item_to_dict(item)},
+                               filepath)
+    except IOError as e:
+        print(f"Error: Could not write to journal {journal_path(filepath)}. {e}")
+
+
+def remove_inventory_item(item: InventoryItem, filepath: str = DEFAULT_INVENTORY_FILE):
+    """Records that an item is gone (by inventory_item_key) without rewriting the inventory file."""
+    if is_sqlite_inventory(filepath):
+        try:
+            with open_inventory_repository(filepath) as repository:
+                repository.remove(item)
+        except sqlite3.Error as e:
+            print(f"Error: Could not write to database {filepath}. {e}")
+        return
+    try:
+        _append_journal_record({"op": "remove", "key": inventory_item_key(item)}, filepath)
+    except IOError as e:
+        print(f"Error: Could not write to journal {journal_path(filepath)}. {e}")
+
+
+def compact_inventory(filepath: str = DEFAULT_INVENTORY_FILE) -> int:
     """
-    Loads the inventory list from a JSON file.
+    Folds the journal into a new snapshot (written atomically) and clears the journal.
+    A SQLite inventory has no journal; it is left as is.
+
+    The snapshot is read with read_inventory, so a snapshot or journal that can't be read
+    completely aborts the compaction with both files untouched.
+
+    Returns:
+        int: The number of items in the new snapshot.
+
+    Raises:
+        IOError: If the snapshot or journal can't be read.
+        ValueError: If the snapshot can't be decoded, or items in it or the journal can't be loaded.
+        InventorySchemaError: If the snapshot is from a newer schema version.
+    """
+    if is_sqlite_inventory(filepath):
+        with open_inventory_repository(filepath) as repository:
+            return len(repository)
+    inventory_list, skipped = read_inventory(filepath)
+    if skipped:
+        raise ValueError(f"{skipped} item(s) in {filepath} or its journal could not be loaded; "
+                         f"not compacting, so they are kept.")
+    save_inventory(inventory_list, filepath)
+    return len(inventory_list)
+
+
+def _replay_journal(inventory_list: list[InventoryItem], filepath: str) -> tuple[list[InventoryItem], int]:
+    """
+    Applies the journal's changes, in order, to a loaded snapshot.
+
+    Returns:
+        tuple[list[InventoryItem], int]: The resulting items, and the number of bad records
+                                         skipped (an incomplete last record isn't counted:
+                                         it is a write that never finished).
+    """
+    if not os.path.exists(journal_path(filepath)):
+        return inventory_list, 0
+    items = list(inventory_list)
+    positions = {} # key -> position of the first item with that key
+    for position, item in enumerate(items):
+        positions.setdefault(inventory_item_key(item), position)
+
+    with open(journal_path(filepath), 'r') as f:
+        lines = f.readlines()
+    skipped = 0
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            record = json.loads(line)
+            key = record["key"]
+            if not isinstance(key, str):
+                raise ValueError(f"Bad key {key!r}.")
+            if record["op"] == "put":
+                item = _dict_to_inventory_item(record["item"])
+            elif record["op"] == "remove":
+                item = None
+            else:
+                raise ValueError(f"Unknown operation {record['op']!r}.")
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            if line_number == len(lines) and not line.endswith("\n"):
+                print(f"Warning: Ignoring incomplete last journal record in {journal_path(filepath)}.")
+            else:
+                skipped += 1
+                print(f"Warning: Skipping bad journal record {line_number} in {journal_path(filepath)}: {e}")
+            continue
+        position = positions.get(key)
+        if item is not None:
+            if position is None:
+                positions[key] = len(items)
+                items.append(item)
+            else:
+                items[position] = item
+        elif position is not None:
+            items[position] = None
+            del positions[key]
+    return [item for item in items if item is not None], skipped
+
+
+def read_inventory(filepath: str = DEFAULT_INVENTORY_FILE, encoding: str = None) -> tuple[list[InventoryItem], int]:
+    """
+    Reads an inventory like load_inventory, but raises instead of returning an empty list
+    when the file can't be read, and reports how many items had to be skipped. Use it
+    before writing an inventory back, so nothing that failed to load gets overwritten.
 
     Args:
-        filepath (str, optional): The path to the JSON file.
+        filepath (str, optional): The path to the inventory file.
                                    Defaults to DEFAULT_INVENTORY_FILE.
+        encoding (str, optional): The file's encoding; by default guessed from its extension.
+
+    Returns:
+        tuple[list[InventoryItem], int]: The loaded items (an empty list if neither the file
+                                         nor its journal exists), and the number of items
+                                         or journal records that were skipped.
+
+    Raises:
+        IOError: If the file or its journal can't be read.
+        ValueError: If the file can't be decoded (includes json.JSONDecodeError).
+        InventorySchemaError: If the file is from a newer schema version.
+        sqlite3.Error: If a SQLite inventory can't be read.
+    """
+    if not os.path.exists(filepath):
+        return _replay_journal([], filepath)
+
+    if is_sqlite_inventory(filepath):
+        with open_inventory_repository(filepath) as repository:
+            inventory_list = repository.all()
+            return inventory_list, len(repository) - len(inventory_list)
+
+    with open(filepath, 'rb') as f:
+        list_of_dicts = decode_inventory(f.read(), _encoding_for(filepath, encoding).name)
+
+    inventory_list = []
+    skipped = 0
+    for item_data in list_of_dicts:
+        try:
+            inventory_list.append(_dict_to_inventory_item(item_data))
+        except ValueError as e: # Catch errors from _dict_to_inventory_item
+            skipped += 1
+            print(f"Warning: Skipping item due to error: {e}. Data: {item_data}")
+
+    inventory_list, skipped_records = _replay_journal(inventory_list, filepath)
+    return inventory_list, skipped + skipped_records
+
+
+def load_inventory(filepath: str = DEFAULT_INVENTORY_FILE, encoding: str = None) -> list[InventoryItem]:
+    """
+    Loads the inventory list from a file (any encoding and schema version save_inventory
+    writes, or a version 1 bare JSON list), then replays any journaled
+    single-item changes (see save_inventory_item) on top of it.
+    Files with a SQLITE_INVENTORY_EXTENSIONS extension are read from SQLite instead.
+
+    Args:
+        filepath (str, optional): The path to the inventory file.
+                                   Defaults to DEFAULT_INVENTORY_FILE.
+        encoding (str, optional): The file's encoding; by default guessed from its extension.
+                                  All JSON encodings read each other's files.
 
     Returns:
         list[InventoryItem]: The loaded list of inventory items, or an empty list if
                              the file doesn't exist or an error occurs.
+
+    Raises:
+        InventorySchemaError: If the file is from a newer schema version. It is not
+                              treated as empty, so it can't be overwritten by a save.
     """
-    if not os.path.exists(filepath):
+    if not os.path.exists(filepath) and not os.path.exists(journal_path(filepath)):
         print(f"Info: Inventory file '{filepath}' not found. Starting with an empty inventory.")
         return []
 
     try:
-        with open(filepath, 'r') as f:
-            list_of_dicts = json.load(f)
-        
-        inventory_list = []
-        for item_data in list_of_dicts:
-            try:
-                inventory_list.append(_dict_to_inventory_item(item_data))
-            except ValueError as e: # Catch errors from _dict_to_inventory_item
-                print(f"Warning: Skipping item due to error: {e}. Data: {item_data}")
-        
-        print(f"Inventory successfully loaded from {filepath}")
+        inventory_list, _ = read_inventory(filepath, encoding)
+        if os.path.exists(filepath):
+            print(f"Inventory successfully loaded from {filepath}")
         return inventory_list
-    except json.JSONDecodeError as e:
-        print(f"Error: Could not decode JSON from {filepath}. File might be corrupted. {e}")
+    except sqlite3.Error as e:
+        print(f"Error: Could not read database {filepath}. {e}")
+        return []
+    except ValueError as e: # Includes json.JSONDecodeError
+        print(f"Error: Could not decode inventory from {filepath}. File might be corrupted. {e}")
         return [] # Return empty list on error
     except IOError as e:
         print(f"Error: Could not read file {filepath}. {e}")
-        return [] # Return empty list on error
\ No newline at end of file
+        return [] # Return empty list on error
@@ -0,0 +1,63 @@
+# src/description_store.py
+"""
+Content-addressed storage for long description texts.
+
+Enrichment copies TheCocktailDB's multi-paragraph ingredient description into every item
+of a category, so the same text would otherwise be written once per bottle to inventory
+files and menus. A DescriptionStore keeps each distinct text once, under the SHA-1 of its
+content:
+
+- saved inventories (data_handler) hold a "descriptions" table and refer to it from items,
+- loading hands every item that refers to a text the same string object,
+- renderers print a description once and refer back to it afterwards.
+
+DESCRIPTIONS is the process-wide store; enrichment registers API texts there so all items
+share one copy in memory. Decoding a saved inventory uses a store of its own, so texts read
+from files are freed along with the items that use them.
+"""
+import hashlib
+
+# Shorter texts (user notes like "Top shelf.") are cheaper to repeat than to refer to
+DESCRIPTION_MIN_LENGTH = 80
+
+
+def description_key(text: str) -> str:
+    """The content address of a text: the SHA-1 hex digest of its UTF-8 bytes."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def is_shareable_description(value) -> bool:
+    """True for texts long enough to be stored once and referenced."""
+    return type(value) is str and len(value) >= DESCRIPTION_MIN_LENGTH
+
+
+class DescriptionStore:
+    """
+    Texts keyed by their content hash. Adding the same text twice stores it once.
+
+    Args:
+        texts (dict[str, str], optional): An existing key -> text table (e.g. from a saved
+                                          file). Keys are trusted, not re-hashed.
+    """
+    def __init__(self, texts: dict[str, str] = None):
+        self._texts = dict(texts or {})
+        self._keys = {} # text -> key, for texts added in this process
+
+    def add(self, text: str) -> str:
+        """Stores a text (once) and returns its key."""
+        key = self._keys.get(text)
+        if key is None:
+            key = description_key(text)
+            text = self._texts.setdefault(key, text)
+            self._keys[text] = key
+        return key
+
+    def shared(self, text: str) -> str:
+        """The stored string equal to `text` (adding it first), so equal texts are one object."""
+        return self._texts[self.add(text)]
+
+    def to_dict(self) -> dict[str, str]:
+        return dict(self._texts)
+
+
+DESCRIPTIONS = DescriptionStore()
@@ -0,0 +1,271 @@
+# src/event_planner.py
+"""
+Event/party planner: can the bar serve a list of expected orders?
+
+Given an order list ({"Gin & Tonic": 40, "Negroni": 25, ...}), the inventory and the
+recipe catalog, the planner allocates the shared stock across recipes, aiming to fulfil
+many orders, then reports what is left and the shortfall per ingredient.
+
+Allocation is a packing problem (an integer program): several recipes draw on the same
+bottles. The planner uses a greedy primal-dual heuristic, so it is fast but not
+guaranteed optimal; it can serve a few orders fewer than the best allocation. Each recipe
+is priced by how much of its ingredients' *remaining* stock one serving uses, and the
+cheapest recipe is served first, in chunks of at most ALLOCATION_CHUNK of what it could
+still take. Prices only rise as stock is used, so a lazily updated heap always yields the
+current cheapest recipe without re-pricing the others. Hundreds of recipe types and
+thousands of orders take milliseconds.
+
+Stock is modelled as pools: inventory items with the same ingredient keys and unit kind
+are pooled together (all bottles of one gin brand, say). A requirement draws from any
+pool that provides its key, least-contested pools first, so generic "Gin" orders don't
+use up the bottle a brand-specific recipe needs. A recipe's requirements are checked
+together, so two of them drawing on the same pool can't both count its stock.
+
+Usage (from the project root):
+    python src/event_planner.py --order "Gin & Tonic=40" --order "Negroni=25" --order "Screwdriver=30"
+    python src/event_planner.py --orders-file orders.json --inventory data/inventory.json
+"""
+import argparse
+import heapq
+import json
+import math
+
+from cocktail_manager import CocktailRecipe, get_all_recipes
+from data_handler import load_inventory, DEFAULT_INVENTORY_FILE
+from inventory_manager import InventoryItem
+from quantities import parse_quantity, recipe_needs
+from recipe_index import item_keys, requirement_key
+from shopping_optimizer import describe_key
+from taxonomy import Taxonomy, load_taxonomy
+
+# Largest fraction of a recipe's remaining feasible servings allocated in one step
+ALLOCATION_CHUNK = 0.1
+
+
+def plan_event(orders: dict[str, int], inventory: list[InventoryItem], recipes: list[CocktailRecipe],
+               taxonomy: Taxonomy = None) -> dict:
+    """
+    Allocates the inventory across the requested orders with a greedy heuristic (see the
+    module docstring); the result is feasible but not necessarily the largest possible.
+
+    Args:
+        orders (dict[str, int]): Number of servings wanted per recipe name (case-insensitive).
+        inventory (list[InventoryItem]): The bar's stock. Items with unparseable quantities
+                                         count as present but unlimited.
+        recipes (list[CocktailRecipe]): The recipe catalog.
+        taxonomy (Taxonomy, optional): Used to match inventory categories to requirements.
+
+    Returns:
+        dict with:
+            "fulfilled":   {recipe name: servings allocated}
+            "unfulfilled": {recipe name: servings that can't be made}
+            "shortfall":   {ingredient: (extra amount needed, unit kind)} to serve everything;
+                           unit kind is "missing" for ingredients not in stock at all
+            "remaining":   {ingredient: (amount left, unit kind)}
+            "unknown_recipes": order names not found in the catalog
+    """
+    recipes_by_name = {recipe.name.lower(): recipe for recipe in recipes}
+    result = {"fulfilled": {}, "unfulfilled": {}, "shortfall": {}, "remaining": {}, "unknown_recipes": []}
+
+    # --- Stock pools ---
+    present_keys = set()
+    pools = {} # (frozenset of keys, kind) -> pool id
+    pool_remaining = []
+    pool_keys = []
+    pool_kinds = []
+    for item in inventory:
+        keys = frozenset(item_keys(item, taxonomy))
+        present_keys |= keys
+        quantity = parse_quantity(item.quantity)
+        if quantity is None:
+            continue # Present, but no measurable amount: never limits
+        pool_id = pools.setdefault((keys, quantity.kind), len(pool_remaining))
+        if pool_id == len(pool_remaining):
+            pool_remaining.append(0.0)
+            pool_keys.append(keys)
+            pool_kinds.append(quantity.kind)
+        pool_remaining[pool_id] += quantity.amount
+
+    # --- Orders -> per-recipe needs ---
+    order_recipes = [] # (recipe, demand, needs as [(key, kind, amount)])
+    demanded_keys = set()
+    for name, count in orders.items():
+        recipe = recipes_by_name.get(name.lower())
+        if recipe is None:
+            result["unknown_recipes"].append(name)
+            continue
+        if count <= 0:
+            continue
+        required = {requirement_key(req, taxonomy) for req in recipe.ingredients}
+        missing = [key for key in required if key not in present_keys]
+        if missing:
+            result["fulfilled"][recipe.name] = 0
+            result["unfulfilled"][recipe.name] = count
+            for key in missing:
+                result["shortfall"][describe_key(key)] = (None, "missing")
+            continue
+        needs = [(key, kind, amount) for (key, kind), amount in recipe_needs(recipe, taxonomy).items()]
+        order_recipes.append((recipe, count, needs))
+        demanded_keys.update(key for key, _, _ in needs)
+
+    # Pools serving a key, least contested first (fewest other demanded keys drawing on them)
+    pools_for_need = {}
+    for _, _, needs in order_recipes:
+        for key, kind, _ in needs:
+            if (key, kind) not in pools_for_need:
+                eligible = [pool_id for pool_id, keys in enumerate(pool_keys)
+                            if key in keys and pool_kinds[pool_id] == kind]
+                eligible.sort(key=lambda pool_id: len(pool_keys[pool_id] & demanded_keys))
+                pools_for_need[(key, kind)] = eligible
+
+    def available(key, kind) -> float:
+        eligible = pools_for_need[(key, kind)]
+        if not eligible:
+            return math.inf # Present only with unmeasurable/other-unit stock: unlimited
+        return sum(pool_remaining[pool_id] for pool_id in eligible)
+
+    def price(needs) -> float:
+        total = 0.0
+        for key, kind, amount in needs:
+            left = available(key, kind)
+            if left < amount:
+                return math.inf
+            total += amount / left
+        if draws(needs, 1) is None: # Each need fits alone, but not together
+            return math.inf
+        return total
+
+    def draws(needs, servings: int) -> dict[int, float] | None:
+        """
+        How much each pool gives for `servings` of a recipe, drawing all its needs from the
+        current stock together; None if they can't all be met. Needs with the fewest pools
+        draw first, each from its least contested pools first.
+        """
+        drawn = {}
+        for key, kind, amount in sorted(needs, key=lambda need: len(pools_for_need[need[:2]])):
+            to_draw = amount * servings
+            for pool_id in pools_for_need[(key, kind)]:
+                if to_draw <= 1e-9:
+                    break
+                taken = min(pool_remaining[pool_id] - drawn.get(pool_id, 0.0), to_draw)
+                if taken > 0:
+                    drawn[pool_id] = drawn.get(pool_id, 0.0) + taken
+                    to_draw -= taken
+            if to_draw > 1e-9 and pools_for_need[(key, kind)]: # No eligible pools: unlimited
+                return None
+        return drawn
+
+    def feasible(needs) -> int | float:
+        """Most servings the current stock allows; inf if no need is limited."""
+        upper = min((available(key, kind) / amount for key, kind, amount in needs), default=math.inf)
+        if upper == math.inf:
+            return math.inf
+        # Each need alone allows `upper`; shared pools may allow fewer. Drawing is monotone
+        # in the number of servings, so binary search for the largest feasible count.
+        low, high = 0, int(upper + 1e-9)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if draws(needs, middle) is None:
+                high = middle - 1
+            else:
+                low = middle
+        return low
+
+    def consume(needs, servings: int):
+        for pool_id, amount in draws(needs, servings).items():
+            pool_remaining[pool_id] -= amount
+
+    # --- Greedy primal-dual allocation ---
+    demand_left = [count for _, count, _ in order_recipes]
+    fulfilled = [0] * len(order_recipes)
+    heap = [(price(needs), position) for position, (_, _, needs) in enumerate(order_recipes)]
+    heapq.heapify(heap)
+    while heap:
+        stored_price, position = heapq.heappop(heap)
+        needs = order_recipes[position][2]
+        current_price = price(needs)
+        if current_price == math.inf:
+            continue # Out of some ingredient
+        if current_price > stored_price + 1e-12:
+            heapq.heappush(heap, (current_price, position)) # Stale; re-queue at its real price
+            continue
+        max_servings = feasible(needs)
+        if max_servings == math.inf:
+            servings = demand_left[position]
+        else:
+            servings = min(demand_left[position], int(max_servings + 1e-9),
+                           max(1, int(max_servings * ALLOCATION_CHUNK)))
+        if servings <= 0:
+            continue
+        consume(needs, servings)
+        fulfilled[position] += servings
+        demand_left[position] -= servings
+        if demand_left[position]:
+            heapq.heappush(heap, (price(needs), position))
+
+    # --- Report ---
+    extra_needed = {}
+    for position, (recipe, _, needs) in enumerate(order_recipes):
+        result["fulfilled"][recipe.name] = fulfilled[position]
+        if demand_left[position]:
+            result["unfulfilled"][recipe.name] = demand_left[position]
+            for key, kind, amount in needs:
+                extra_needed[(key, kind)] = extra_needed.get((key, kind), 0.0) + amount * demand_left[position]
+    for (key, kind), amount in extra_needed.items():
+        shortfall = amount - available(key, kind)
+        if shortfall > 1e-9:
+            result["shortfall"][describe_key(key)] = (round(shortfall, 1), kind)
+    for (keys, kind), pool_id in pools.items():
+        if keys & demanded_keys:
+            label = ", ".join(sorted(describe_key(key) for key in keys & demanded_keys))
+            left, _ = result["remaining"].get(label, (0.0, kind))
+            result["remaining"][label] = (round(left + pool_remaining[pool_id], 1), kind)
+    return result
+
+
+def _parse_order_arguments(order_args: list[str]) -> dict[str, int]:
+    """Parses ["Gin & Tonic=40", ...] into {"Gin & Tonic": 40, ...}."""
+    orders = {}
+    for order in order_args:
+        name, _, count = order.rpartition("=")
+        if not name or not count.strip().isdigit():
+            raise ValueError(f"Invalid order '{order}'. Use NAME=COUNT, e.g. \"Negroni=25\".")
+        orders[name.strip()] = orders.get(name.strip(), 0) + int(count)
+    return orders
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check whether the bar can serve an event's expected orders.")
+    parser.add_argument("--order", action="append", default=[], help="An order as NAME=COUNT (repeatable).")
+    parser.add_argument("--orders-file", default=None, help='JSON file with {"Recipe name": count, ...}.')
+    parser.add_argument("--inventory", default=DEFAULT_INVENTORY_FILE, help="Inventory JSON file.")
+    parser.add_argument("--no-taxonomy", action="store_false", dest="use_taxonomy",
+                        help="Match categories exactly instead of through the ingredient taxonomy.")
+    args = parser.parse_args()
+
+    event_orders = _parse_order_arguments(args.order)
+    if args.orders_file:
+        with open(args.orders_file, 'r', encoding='utf-8') as f:
+            for order_name, order_count in json.load(f).items():
+                event_orders[order_name] = event_orders.get(order_name, 0) + int(order_count)
+    if not event_orders:
+        parser.error("No orders given. Use --order NAME=COUNT or --orders-file.")
+
+    plan = plan_event(event_orders, load_inventory(args.inventory), get_all_recipes(lazy=True),
+                      load_taxonomy() if args.use_taxonomy else None)
+
+    total_ordered = sum(plan["fulfilled"].values()) + sum(plan["unfulfilled"].values())
+    print(f"\n--- Event plan: {sum(plan['fulfilled'].values())} of {total_ordered} orders can be served ---")
+    for recipe_name, servings in sorted(plan["fulfilled"].items()):
+        short = plan["unfulfilled"].get(recipe_name, 0)
+        print(f"- {recipe_name}: {servings} served" + (f", {short} short" if short else ""))
+    if plan["unknown_recipes"]:
+        print(f"\nUnknown recipes (not in catalog): {', '.join(plan['unknown_recipes'])}")
+    if plan["shortfall"]:
+        print("\n--- Shortfall per ingredient ---")
+        for ingredient, (amount, kind) in sorted(plan["shortfall"].items()):
+            print(f"- {ingredient}: " + ("not in stock" if kind == "missing" else f"{amount:g} {kind} more needed"))
+    if plan["remaining"]:
+        print("\n--- Remaining stock ---")
+        for ingredient, (amount, kind) in sorted(plan["remaining"].items()):
+            print(f"- {ingredient}: {amount:g} {kind}")
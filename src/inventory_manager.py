@@ -1,9 +1,26 @@
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
-from api_client import search_ingredient_by_name
+from api_client import get_cached_ingredient, get_cached_ingredient_version, search_ingredient_by_name
+from description_store import DESCRIPTIONS
+
+
+def intern_text(value):
+    """
+    Interns a string so equal values loaded from different records share one object
+    ("Gin", "700ml", "1 oz" repeat across thousands of items and requirements).
+    Non-string values (None, numbers) are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
 
 
 class InventoryItem:
+    # Slots instead of a per-instance __dict__: items are created in bulk when loading
+    __slots__ = ("name", "brand", "category", "quantity", "price", "user_notes", "enrichment")
+
     def __init__(self, name: str, brand: str, category: str, quantity: str, price: float, user_notes: str = ""): 
         """
         Initializes an InventoryItem instance.
@@ -18,11 +35,17 @@ class InventoryItem:
         """
         
         self.name = name
-        self.brand = brand
-        self.category = category
-        self.quantity = quantity
+        self.brand = intern_text(brand)
+        self.category = intern_text(category)
+        self.quantity = intern_text(quantity)
         self.price = price
         self.user_notes = user_notes
+        self.enrichment = None # Fingerprint of the API data last merged in (see enrichment_fingerprint)
+
+    @property
+    def _type(self) -> str:
+        """The item's class name ("Spirit", "Mixer", ...), as stored in the inventory file."""
+        return self.__class__.__name__
         
     def display_details(self):
         """
@@ -33,14 +56,16 @@ class InventoryItem:
             
             
 class Spirit(InventoryItem):
+    __slots__ = ("type_of_liquor", "abv", "origin", "tasting_notes", "suggested_pairings_raw")
+
     def __init__(self, name: str, brand: str, category: str, quantity: str, price: float, type_of_liquor: str, abv: float, origin: str,
                  tasting_notes: str = "", suggested_pairings_raw: str = "", user_notes: str = ""):
         
         super().__init__(name, brand, category, quantity, price, user_notes)
         
-        self.type_of_liquor = type_of_liquor  # e.g., "London Dry Gin", "Highland Single Malt Scotch"
+        self.type_of_liquor = intern_text(type_of_liquor)  # e.g., "London Dry Gin", "Highland Single Malt Scotch"
         self.abv = abv  # Alcohol By Volume, e.g., 40.0
-        self.origin = origin  # Country/Region of origin
+        self.origin = intern_text(origin)  # Country/Region of origin
         self.tasting_notes = tasting_notes  # Flavor profile
         self.suggested_pairings_raw = suggested_pairings_raw  # Simple text for pairings
         
@@ -55,10 +80,12 @@ class Spirit(InventoryItem):
 
 
 class Mixer(InventoryItem):
+    __slots__ = ("mixer_type",)
+
     def __init__(self, name: str, brand: str, category: str, quantity: str, price: float, mixer_type: str, user_notes: str = ""):
         super().__init__(name, brand, category, quantity, price, user_notes)
         
-        self.mixer_type = mixer_type  # e.g., "Tonic Water", "Soda Water", "Juice"
+        self.mixer_type = intern_text(mixer_type)  # e.g., "Tonic Water", "Soda Water", "Juice"
         
     def display_details(self):
         """
@@ -69,10 +96,12 @@ class Mixer(InventoryItem):
         return mixer_details
     
 class Garnish(InventoryItem):
+    __slots__ = ("garnish_type",)
+
     def __init__(self, name: str, brand: str, category: str, quantity: str, price: float, garnish_type: str, user_notes: str = ""):
         super().__init__(name, brand, category, quantity, price, user_notes)
         
-        self.garnish_type = garnish_type  # e.g., "Lemon", "Olive", "Mint"
+        self.garnish_type = intern_text(garnish_type)  # e.g., "Lemon", "Olive", "Mint"
         
     def display_details(self):
         """
@@ -83,30 +112,193 @@ class Garnish(InventoryItem):
         return garnish_details
     
 
+# In-process memo of ingredient lookups: normalized category -> Future holding the
+# API's first ingredient record (or None). The Future gives single-flight semantics:
+# concurrent callers asking for the same category wait on the first caller's lookup.
+_INGREDIENT_INFO_MEMO = {}
+_INGREDIENT_INFO_MEMO_LOCK = threading.Lock()
+
+# Concurrent category lookups when enhancing a whole inventory. API calls are still paced
+# by api_client's shared rate limiter, whatever the number of workers.
+DEFAULT_ENHANCE_WORKERS = 8
+
+
+def _category_key(category: str) -> str:
+    """Normalizes a category for memo lookups ("Gin", " gin " -> "gin")."""
+    return category.strip().lower()
+
+
+def lookup_ingredient_info(category: str, timeout: float | None = None) -> dict | None:
+    """
+    Returns TheCocktailDB ingredient record for `category`, or None if unknown.
+    Each distinct category is looked up once per process; failed requests
+    are not memoized so a later call can retry them.
+
+    Args:
+        category (str): The inventory category to look up.
+        timeout (float, optional): Seconds to wait for a lookup of the same category that
+                                   another thread already started. Defaults to no limit.
+
+    Raises:
+        concurrent.futures.TimeoutError: If that lookup didn't finish within `timeout`.
+    """
+    key = _category_key(category)
+    with _INGREDIENT_INFO_MEMO_LOCK:
+        future = _INGREDIENT_INFO_MEMO.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _INGREDIENT_INFO_MEMO[key] = future
+
+    if is_owner:
+        try:
+            api_data = search_ingredient_by_name(category)
+        except Exception as e:
+            with _INGREDIENT_INFO_MEMO_LOCK:
+                _INGREDIENT_INFO_MEMO.pop(key, None)
+            future.set_exception(e)
+            raise
+        if api_data is None: # Request failed; let the next caller retry
+            with _INGREDIENT_INFO_MEMO_LOCK:
+                _INGREDIENT_INFO_MEMO.pop(key, None)
+        future.set_result(_first_ingredient(api_data))
+
+    return future.result(timeout=timeout)
+
+
+def enrichment_fingerprint(category: str) -> str | None:
+    """
+    Identifies the API data enrichment would merge into an item of `category`: the category
+    key plus the version of its cached API entry. None if nothing is cached for it.
+    An item whose `enrichment` matches is up to date and needs no lookup.
+    """
+    version = get_cached_ingredient_version(category)
+    return None if version is None else f"{_category_key(category)}@{version!r}"
+
+
+def _first_ingredient(api_data: dict | None) -> dict | None:
+    """The first ingredient record of an ingredient search result, if any."""
+    ingredients = api_data.get("ingredients") if api_data else None
+    return ingredients[0] if ingredients else None
+
+
+def clear_ingredient_info_memo():
+    """Forgets all memoized ingredient lookups (e.g. after the API cache was refreshed)."""
+    with _INGREDIENT_INFO_MEMO_LOCK:
+        _INGREDIENT_INFO_MEMO.clear()
+
+
+def _apply_ingredient_info(item, ing_info: dict):
+    """Merges an API ingredient record into an item's empty fields."""
+    # Update description if available and yours is empty/generic
+    if ing_info.get("strDescription") and (not hasattr(item, 'tasting_notes') or not item.tasting_notes):
+        # One shared copy of the text for every item that uses it
+        description = DESCRIPTIONS.shared(ing_info["strDescription"])
+        if hasattr(item, 'tasting_notes'):
+            item.tasting_notes = description
+            print(f"  Updated tasting notes for {item.name} from API.")
+        elif hasattr(item, 'user_notes') and not item.user_notes: # fallback to user_notes
+            item.user_notes = description
+            print(f"  Updated user_notes for {item.name} with API description.")
+
+    # Update ABV if it's a Spirit and ABV is available/missing
+    if isinstance(item, Spirit) and ing_info.get("strABV") and item.abv == 0: # Assuming 0 means not set
+        try:
+            item.abv = float(ing_info["strABV"])
+            print(f"  Updated ABV for {item.name} to {item.abv}% from API.")
+        except ValueError:
+            print(f"  Could not parse ABV '{ing_info.get('strABV')}' for {item.name}.")
+    # You could also update item.category with ing_info.get("strType") if it's more accurate
+
+
 def enhance_inventory_item_with_api_data(item): # item is Spirit, Mixer, etc.
     if hasattr(item, 'category'): # Or check item.name
         print(f"Attempting to enhance: {item.name} (Category: {item.category})")
-        api_data = search_ingredient_by_name(item.category) # Or item.name
-        
-        if api_data and api_data.get("ingredients"):
-            ing_info = api_data["ingredients"][0]
-            
-            # Update description if available and yours is empty/generic
-            if ing_info.get("strDescription") and (not hasattr(item, 'tasting_notes') or not item.tasting_notes):
-                if hasattr(item, 'tasting_notes'):
-                    item.tasting_notes = ing_info["strDescription"]
-                    print(f"  Updated tasting notes for {item.name} from API.")
-                elif hasattr(item, 'user_notes') and not item.user_notes: # fallback to user_notes
-                    item.user_notes = ing_info["strDescription"]
-                    print(f"  Updated user_notes for {item.name} with API description.")
-
-            # Update ABV if it's a Spirit and ABV is available/missing
-            if isinstance(item, Spirit) and ing_info.get("strABV") and item.abv == 0: # Assuming 0 means not set
-                try:
-                    item.abv = float(ing_info["strABV"])
-                    print(f"  Updated ABV for {item.name} to {item.abv}% from API.")
-                except ValueError:
-                    print(f"  Could not parse ABV '{ing_info.get('strABV')}' for {item.name}.")
-            # You could also update item.category with ing_info.get("strType") if it's more accurate
-    # Small delay
-    time.sleep(0.1)
+        ing_info = lookup_ingredient_info(item.category) # Or item.name
+        if ing_info:
+            _apply_ingredient_info(item, ing_info)
+    # No per-item delay needed: api_client rate-limits the actual API calls
+
+
+def enhance_inventory_items_with_api_data(items: list[InventoryItem], max_workers: int = DEFAULT_ENHANCE_WORKERS,
+                                          deadline: float | None = None, force: bool = False) -> int:
+    """
+    Enhances a whole inventory with API data.
+    Items are grouped by category so each distinct category is looked up once,
+    and the result is applied to every item in that category. Lookups run on a
+    bounded thread pool; results are applied (on this thread) as they arrive.
+    Enhanced items record an enrichment fingerprint; items whose fingerprint still
+    matches (same category, same cached API entry) are skipped.
+
+    Args:
+        items (list[InventoryItem]): The items to enhance (modified in place).
+        max_workers (int): Maximum concurrent lookups.
+        deadline (float, optional): Seconds the whole run may take. Categories still
+                                    pending by then use the cached API result if there
+                                    is one and are otherwise left as they are; the
+                                    unfinished lookups are abandoned, not waited for.
+                                    This bounds the run, not the process: an abandoned
+                                    request keeps its (non-daemon) thread until it
+                                    finishes or hits api_client's request timeout.
+        force (bool): Enhance every item, even those already up to date.
+
+    Returns:
+        int: The number of distinct categories looked up (0 if everything was up to date).
+    """
+    items_by_category = {}
+    for item in items:
+        items_by_category.setdefault(_category_key(item.category), []).append(item)
+    skipped = 0
+    for key, category_items in list(items_by_category.items()):
+        fingerprint = None if force else enrichment_fingerprint(category_items[0].category)
+        stale_items = [item for item in category_items if fingerprint is None or item.enrichment != fingerprint]
+        skipped += len(category_items) - len(stale_items)
+        if stale_items:
+            items_by_category[key] = stale_items
+        else:
+            del items_by_category[key]
+    if skipped:
+        print(f"Skipping {skipped} item(s) already enhanced from the current API data.")
+    if not items_by_category:
+        return 0
+
+    def apply(category_items: list[InventoryItem], ing_info: dict | None):
+        if ing_info:
+            for item in category_items:
+                _apply_ingredient_info(item, ing_info)
+        # Recorded once the API answered, found or not (a failed request caches nothing)
+        fingerprint = enrichment_fingerprint(category_items[0].category)
+        if fingerprint is not None:
+            for item in category_items:
+                item.enrichment = fingerprint
+
+    started = time.monotonic()
+
+    def lookup(category: str) -> dict | None:
+        # Waits for another run's lookup of the same category only until our deadline
+        remaining = None if deadline is None else max(0.0, started + deadline - time.monotonic())
+        try:
+            return lookup_ingredient_info(category, timeout=remaining)
+        except FuturesTimeoutError:
+            return _first_ingredient(get_cached_ingredient(category))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items_by_category))))
+    pending = {}
+    for category_items in items_by_category.values():
+        print(f"Attempting to enhance {len(category_items)} item(s) in category: {category_items[0].category}")
+        pending[executor.submit(lookup, category_items[0].category)] = category_items
+    try:
+        for future in as_completed(pending, timeout=deadline):
+            category_items = pending.pop(future)
+            try:
+                apply(category_items, future.result())
+            except Exception as e:
+                print(f"Could not enhance category {category_items[0].category}: {e}")
+    except FuturesTimeoutError:
+        print(f"Enhancement deadline of {deadline:g}s reached after {time.monotonic() - started:.1f}s; "
+              f"{len(pending)} categor{'y' if len(pending) == 1 else 'ies'} fall back to cached data.")
+        for category_items in pending.values():
+            apply(category_items, _first_ingredient(get_cached_ingredient(category_items[0].category)))
+    finally:
+        executor.shutdown(wait=not pending, cancel_futures=True)
+    return len(items_by_category)
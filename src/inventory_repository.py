@@ -0,0 +1,293 @@
+# src/inventory_repository.py
+"""
+SQLite-backed inventory store.
+
+load_inventory() hands every consumer a flat list that it then re-scans to group by
+category or brand. For large (multi-bar) inventories this module keeps the items in one
+SQLite table instead: the fields every item has are columns, indexed on category, brand and
+item type, and the subclass-specific fields (abv, mixer_type, ...) sit in a JSON column.
+Long texts (enrichment descriptions repeated across a category) are stored once, in a
+`descriptions` table keyed by content hash, and item rows refer to them as in saved JSON
+inventories ({"$description": <hash>} in the JSON column).
+Queries such as items_by_category(), categories() and price_range() run in SQLite and only
+build InventoryItem objects for the rows they return.
+
+data_handler uses this store for inventory files ending in .sqlite3/.sqlite/.db, so
+load_inventory()/save_inventory() work the same with either format.
+
+Usage (from the project root):
+    python src/inventory_repository.py import data/inventory.json data/inventory.sqlite3
+    python src/inventory_repository.py categories data/inventory.sqlite3
+    python src/inventory_repository.py category data/inventory.sqlite3 Gin
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+from data_handler import _dict_to_inventory_item, _inventory_item_to_dict, inventory_item_key, journal_path, read_inventory
+from description_store import DescriptionStore, is_shareable_description
+from inventory_manager import InventoryItem
+
+# Fields every InventoryItem has; they get their own columns. Anything else goes in `details`.
+COMMON_FIELDS = ("name", "brand", "category", "quantity", "price", "user_notes")
+_ITEM_COLUMNS = "type, " + ", ".join(COMMON_FIELDS) + ", details"
+_ROW_COLUMNS = ("item_key", "type") + COMMON_FIELDS + ("details",)
+_INSERT_ITEM = f"INSERT INTO items ({', '.join(_ROW_COLUMNS)}) VALUES ({', '.join('?' * len(_ROW_COLUMNS))})"
+_UPDATE_ITEM = f"UPDATE items SET {', '.join(column + ' = ?' for column in _ROW_COLUMNS)} WHERE id = ?"
+_INSERT_DESCRIPTION = "INSERT OR IGNORE INTO descriptions (key, text) VALUES (?, ?)"
+_DESCRIPTION_BATCH = 500 # Keys per SELECT ... IN (...), well below SQLite's variable limit
+
+
+class InventoryRepository:
+    """
+    An inventory stored in a SQLite file. Items keep the order they were added in.
+
+    Args:
+        filepath (str): The database file; created (with its directory) if missing.
+    """
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False) # Guarded by self._lock
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS items (
+                id         INTEGER PRIMARY KEY,
+                item_key   TEXT NOT NULL,
+                type       TEXT NOT NULL,
+                name       TEXT NOT NULL,
+                brand      TEXT NOT NULL,
+                category   TEXT NOT NULL,
+                quantity   TEXT,
+                price      REAL,
+                user_notes TEXT,
+                details    TEXT NOT NULL
+            )""")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                key  TEXT PRIMARY KEY,
+                text TEXT NOT NULL
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_key ON items (item_key)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_category ON items (category COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_brand ON items (brand COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_type ON items (type)")
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row(item: InventoryItem, descriptions: DescriptionStore) -> tuple:
+        """The item's row. Long texts are added to `descriptions` and referred to by key."""
+        data = _inventory_item_to_dict(item)
+        item_type = data.pop("_type")
+        common = [data.pop(field, None) for field in COMMON_FIELDS]
+        for position, value in enumerate(common):
+            if is_shareable_description(value): # e.g. an API description in user_notes
+                data[COMMON_FIELDS[position]] = value
+                common[position] = None
+        for field, value in data.items():
+            if is_shareable_description(value):
+                data[field] = {"$description": descriptions.add(value)}
+        return (inventory_item_key(item), item_type, *common, json.dumps(data, separators=(",", ":")))
+
+    @staticmethod
+    def _item(row: tuple, details: dict, texts: dict[str, str]) -> InventoryItem:
+        item_type, *common = row
+        data = dict(zip(COMMON_FIELDS, common))
+        for field, value in details.items():
+            if type(value) is dict and "$description" in value:
+                if value["$description"] not in texts:
+                    print(f"Warning: Missing description {value['$description']} for {data.get('name')}.")
+                value = texts.get(value["$description"], "")
+            data[field] = value
+        data["_type"] = item_type
+        return _dict_to_inventory_item(data)
+
+    def _store_descriptions(self, descriptions: DescriptionStore):
+        """Adds texts to the descriptions table (call with self._lock held, inside a transaction)."""
+        self._conn.executemany(_INSERT_DESCRIPTION, descriptions.to_dict().items())
+
+    def _load_descriptions(self, keys: set[str]) -> dict[str, str]:
+        """Key -> text for the given keys (call with self._lock held)."""
+        keys = list(keys)
+        texts = {}
+        for start in range(0, len(keys), _DESCRIPTION_BATCH):
+            batch = keys[start:start + _DESCRIPTION_BATCH]
+            texts.update(self._conn.execute(
+                f"SELECT key, text FROM descriptions WHERE key IN ({', '.join('?' * len(batch))})", batch).fetchall())
+        return texts
+
+    def _query(self, where: str = "", parameters: tuple = ()) -> list[InventoryItem]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_ITEM_COLUMNS} FROM items {where}", parameters).fetchall()
+            parsed = []
+            keys = set()
+            for row in rows:
+                try:
+                    details = json.loads(row[-1])
+                except ValueError as e:
+                    print(f"Warning: Skipping stored item '{row[1]}' due to error: {e}")
+                    continue
+                keys.update(value["$description"] for value in details.values()
+                            if type(value) is dict and "$description" in value)
+                parsed.append((row[:-1], details))
+            texts = self._load_descriptions(keys) # Each text is one string, shared by its items
+        items = []
+        for row, details in parsed:
+            try:
+                items.append(self._item(row, details, texts))
+            except (ValueError, TypeError) as e:
+                print(f"Warning: Skipping stored item '{row[1]}' due to error: {e}")
+        return items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def all(self) -> list[InventoryItem]:
+        """Every item, in the order they were added."""
+        return self._query("ORDER BY id")
+
+    def items_by_category(self, category: str) -> list[InventoryItem]:
+        """Items of one category (case-insensitive), sorted by name."""
+        return self._query("WHERE category = ? COLLATE NOCASE ORDER BY name", (category,))
+
+    def items_by_brand(self, brand: str) -> list[InventoryItem]:
+        """Items of one brand (case-insensitive), sorted by name."""
+        return self._query("WHERE brand = ? COLLATE NOCASE ORDER BY name", (brand,))
+
+    def items_by_type(self, item_type: str | type) -> list[InventoryItem]:
+        """Items of one class ("Spirit" or Spirit), in the order they were added."""
+        type_name = item_type if isinstance(item_type, str) else item_type.__name__
+        return self._query("WHERE type = ? ORDER BY id", (type_name,))
+
+    def categories(self) -> dict[str, int]:
+        """
+        Category -> number of items, sorted by category. Categories differing only in case
+        are one category (as in items_by_category); it is listed under its first spelling
+        in sort order.
+        """
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT MIN(category), COUNT(*) FROM items GROUP BY category COLLATE NOCASE "
+                "ORDER BY category COLLATE NOCASE").fetchall())
+
+    def price_range(self, category: str = None) -> tuple[float, float] | None:
+        """(lowest, highest) price, optionally within one category; None if no item has a price."""
+        where, parameters = ("WHERE category = ? COLLATE NOCASE", (category,)) if category else ("", ())
+        with self._lock:
+            lowest, highest = self._conn.execute(
+                f"SELECT MIN(price), MAX(price) FROM items {where}", parameters).fetchone()
+        return None if lowest is None else (lowest, highest)
+
+    def put(self, item: InventoryItem):
+        """Adds an item, or replaces the (first) stored item with the same inventory_item_key."""
+        descriptions = DescriptionStore()
+        row = self._row(item, descriptions)
+        with self._lock:
+            self._store_descriptions(descriptions)
+            existing = self._conn.execute("SELECT id FROM items WHERE item_key = ? ORDER BY id LIMIT 1",
+                                          (row[0],)).fetchone()
+            if existing:
+                self._conn.execute(_UPDATE_ITEM, (*row, existing[0]))
+            else:
+                self._conn.execute(_INSERT_ITEM, row)
+            self._conn.commit()
+
+    def remove(self, item: InventoryItem) -> bool:
+        """Removes the (first) stored item with the same inventory_item_key. Returns False if there was none."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM items WHERE id = (SELECT id FROM items WHERE item_key = ? ORDER BY id LIMIT 1)",
+                (inventory_item_key(item),))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def replace_all(self, items: Iterable[InventoryItem]) -> int:
+        """
+        Replaces the whole inventory in one transaction. Returns the number of items stored.
+        Texts no longer referred to (e.g. left behind by put/remove) are dropped here.
+        """
+        descriptions = DescriptionStore()
+        rows = [self._row(item, descriptions) for item in items]
+        with self._lock:
+            with self._conn: # Commits, or rolls back on error
+                self._conn.execute("DELETE FROM items")
+                self._conn.execute("DELETE FROM descriptions")
+                self._store_descriptions(descriptions)
+                self._conn.executemany(_INSERT_ITEM, rows)
+        return len(rows)
+
+
+def import_json_inventory(json_path: str, db_path: str) -> int:
+    """
+    Imports a JSON inventory file (and its journal, see data_handler) into a SQLite
+    inventory, replacing what the database held. The JSON file is left in place.
+    Nothing is imported unless the whole file loads, so a missing or damaged file can't
+    empty the database.
+
+    Returns:
+        int: The number of items imported.
+
+    Raises:
+        IOError: If the JSON file doesn't exist or can't be read.
+        ValueError: If it can't be decoded, or some of its items can't be loaded.
+    """
+    if not os.path.exists(json_path) and not os.path.exists(journal_path(json_path)):
+        raise FileNotFoundError(f"Inventory file '{json_path}' not found.")
+    items, skipped = read_inventory(json_path)
+    if skipped:
+        raise ValueError(f"{skipped} item(s) in {json_path} could not be loaded; not importing, "
+                         f"so {db_path} is left as it was.")
+    with InventoryRepository(db_path) as repository:
+        count = repository.replace_all(items)
+    print(f"Imported {count} items from {json_path} into {db_path}")
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage and query a SQLite inventory.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="Import a JSON inventory file.")
+    import_parser.add_argument("json_path", help="JSON inventory file, e.g. data/inventory.json.")
+    import_parser.add_argument("db_path", help="SQLite inventory file, e.g. data/inventory.sqlite3.")
+    categories_parser = commands.add_parser("categories", help="List categories with item counts and prices.")
+    categories_parser.add_argument("db_path", help="SQLite inventory file.")
+    category_parser = commands.add_parser("category", help="List the items of one category.")
+    category_parser.add_argument("db_path", help="SQLite inventory file.")
+    category_parser.add_argument("category", help='Category name, e.g. "Gin".')
+    args = parser.parse_args()
+
+    if args.command == "import":
+        try:
+            import_json_inventory(args.json_path, args.db_path)
+        except (IOError, ValueError) as e:
+            print(f"Error: Could not import {args.json_path}. {e}")
+    elif args.command == "categories":
+        with InventoryRepository(args.db_path) as repository:
+            print(f"\n--- {len(repository)} items ---")
+            for category_name, count in repository.categories().items():
+                prices = repository.price_range(category_name)
+                price_display = f", €{prices[0]:.2f}-€{prices[1]:.2f}" if prices else ""
+                print(f"- {category_name}: {count} item(s){price_display}")
+    else:
+        with InventoryRepository(args.db_path) as repository:
+            for item in repository.items_by_category(args.category):
+                print(item.display_details())
@@ -1,4 +1,4 @@
-from inventory_manager import InventoryItem, Spirit, Mixer, Garnish, enhance_inventory_item_with_api_data
+from inventory_manager import InventoryItem, Spirit, Mixer, Garnish, enhance_inventory_items_with_api_data
 from cocktail_manager import get_all_recipes, find_makeable_cocktails, CocktailRecipe # Import cocktail related things
 from data_handler import save_inventory, load_inventory, DEFAULT_INVENTORY_FILE
 from api_client import search_ingredient_by_name # Import API handler for ingredient data
@@ -92,10 +92,11 @@ def run_bar_program():
 
     # Example of when you might save again (e.g., after adding/modifying items - not implemented yet)
     # For now, we're just loading and potentially creating an initial file.
-    # If you had a function to add items to current_inventory, you'd call save_inventory() after.
-    # save_inventory(current_inventory, DEFAULT_INVENTORY_FILE)
+    # After adding or changing a single item, call save_inventory_item() (cheap journal append);
+    # save_inventory() rewrites the whole file and is only needed for bulk changes.
+    # save_inventory_item(new_item, DEFAULT_INVENTORY_FILE)
     
-    for item in current_inventory: enhance_inventory_item_with_api_data(item)
+    enhance_inventory_items_with_api_data(current_inventory)
 
 
 
@@ -0,0 +1,107 @@
+# src/makeable_tracker.py
+"""
+Keeps the makeable-cocktail set up to date as stock changes during the day.
+
+MakeableTracker is seeded once with an inventory and a recipe list (or a prebuilt
+RecipeIndex). After that, add_item/remove_item events return only the recipes that
+became makeable or unmakeable. Each event touches only the recipes that use the
+item's ingredient keys, and only when a key appears or disappears entirely
+(a second bottle of gin changes nothing), so its cost does not depend on catalog size.
+"""
+from cocktail_manager import CocktailRecipe
+from data_handler import inventory_item_key
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex, item_keys
+from taxonomy import Taxonomy
+
+
+class MakeableTracker:
+    """
+    Incrementally maintained makeable set for one inventory.
+
+    Args:
+        inventory (list[InventoryItem]): The starting inventory.
+        recipes (list[CocktailRecipe], optional): The catalog. Not needed if `index` is given.
+        index (RecipeIndex, optional): A prebuilt index to share with other queries.
+        taxonomy (Taxonomy, optional): Used when building the index from `recipes`.
+    """
+    def __init__(self, inventory: list[InventoryItem], recipes: list[CocktailRecipe] = None,
+                 index: RecipeIndex = None, taxonomy: Taxonomy = None):
+        self.index = index if index is not None else RecipeIndex(recipes or [], taxonomy)
+        self._key_counts = {}                   # key -> number of tracked items providing it
+        self._items = {}                        # inventory_item_key -> keys of each tracked copy
+        self._hits = [0] * len(self.index)      # position -> distinct required keys available
+        self._makeable = {position for position, count in enumerate(self.index.required_counts) if count == 0}
+        for item in inventory:
+            self.add_item(item)
+
+    def _keys(self, item: InventoryItem) -> set:
+        return set(item_keys(item, self.index.taxonomy))
+
+    def add_item(self, item: InventoryItem) -> tuple[list[CocktailRecipe], list[CocktailRecipe]]:
+        """
+        Records a new item in stock.
+
+        Returns:
+            (became_makeable, became_unmakeable): Recipes whose status changed. Adding an
+            item never makes a recipe unmakeable, so the second list is always empty.
+        """
+        keys = self._keys(item)
+        self._items.setdefault(inventory_item_key(item), []).append(keys)
+        became_makeable = []
+        recipes_by_key = self.index.recipes_by_key
+        required_counts = self.index.required_counts
+        for key in keys:
+            count = self._key_counts.get(key, 0)
+            self._key_counts[key] = count + 1
+            if count: # Key was already available; nothing changes
+                continue
+            for position in recipes_by_key.get(key, ()):
+                self._hits[position] += 1
+                if self._hits[position] == required_counts[position]:
+                    self._makeable.add(position)
+                    became_makeable.append(position)
+        return self._recipes(became_makeable), []
+
+    def remove_item(self, item: InventoryItem) -> tuple[list[CocktailRecipe], list[CocktailRecipe]]:
+        """
+        Records that an item ran out or was removed. The item is matched to a tracked one by
+        inventory_item_key (category, brand and name), so it needn't be the same object.
+
+        Returns:
+            (became_makeable, became_unmakeable): Recipes whose status changed. Removing an
+            item never makes a recipe makeable, so the first list is always empty.
+
+        Raises:
+            ValueError: If the item isn't part of the tracked inventory.
+        """
+        item_key = inventory_item_key(item)
+        tracked = self._items.get(item_key)
+        if not tracked:
+            raise ValueError(f"Item '{item.name}' is not in the tracked inventory.")
+        keys = tracked.pop() # The keys it was added with
+        if not tracked:
+            del self._items[item_key]
+
+        became_unmakeable = []
+        recipes_by_key = self.index.recipes_by_key
+        required_counts = self.index.required_counts
+        for key in keys:
+            count = self._key_counts[key] - 1
+            if count:
+                self._key_counts[key] = count
+                continue
+            del self._key_counts[key] # Last item providing this key is gone
+            for position in recipes_by_key.get(key, ()):
+                if self._hits[position] == required_counts[position]:
+                    self._makeable.discard(position)
+                    became_unmakeable.append(position)
+                self._hits[position] -= 1
+        return [], self._recipes(became_unmakeable)
+
+    def makeable(self) -> list[CocktailRecipe]:
+        """Returns the currently makeable recipes in catalog order."""
+        return self._recipes(self._makeable)
+
+    def _recipes(self, positions) -> list[CocktailRecipe]:
+        return [self.index.recipes[position] for position in sorted(positions)]
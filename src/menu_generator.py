@@ -1,22 +1,35 @@
 # src/menu_generator.py
 import os
 import argparse # For command-line arguments
+import json
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
 from jinja2 import Environment, FileSystemLoader
 from xhtml2pdf import pisa
 
 # Import necessary functions and classes from your other modules
-from inventory_manager import InventoryItem, Spirit, Mixer, Garnish, enhance_inventory_item_with_api_data
+from inventory_manager import (InventoryItem, Spirit, Mixer, Garnish, enhance_inventory_items_with_api_data,
+                               DEFAULT_ENHANCE_WORKERS)
+from api_client import set_rate_limit, DEFAULT_RATE_PER_SECOND
 from cocktail_manager import get_all_recipes, find_makeable_cocktails, CocktailRecipe
-from data_handler import load_inventory # DEFAULT_INVENTORY_FILE will be used from this script's global
+from data_handler import load_inventory, read_inventory, save_inventory, is_sqlite_inventory # DEFAULT_INVENTORY_FILE will be used from this script's global
+from recipe_index import get_catalog_index
+from bitset_matcher import BitsetMatcher
+from taxonomy import load_taxonomy, TAXONOMY_FILE
+from description_store import is_shareable_description
 
 # Project root and default inventory file (respecting your specific JSON file)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__)) # This gives the parent of 'src'
 DEFAULT_INVENTORY_FILE = os.path.join(PROJECT_ROOT, "data", "inventory_VD85.json")
+TAXONOMY_PATH = os.path.join(PROJECT_ROOT, TAXONOMY_FILE) # Falls back to the built-in taxonomy if missing
 
 
 def format_inventory_markdown(inventory_list: list[InventoryItem], show_prices: bool, show_descriptions: bool) -> str:
     """
     Formats the inventory into a Markdown string, grouped by category.
+    A long description shared by several items (e.g. the API text for a category) is
+    printed once; later items refer back to the first one.
     (Your existing function - no changes needed here for HTML output, it's Markdown specific)
     """
     if not inventory_list:
@@ -30,6 +43,7 @@ def format_inventory_markdown(inventory_list: list[InventoryItem], show_prices:
             inventory_by_category[item.category] = []
         inventory_by_category[item.category].append(item)
 
+    first_item_by_description = {} # long description -> name of the item it was printed for
     for category, items in sorted(inventory_by_category.items()):
         markdown_parts.append(f"\n## {category}\n")
         for item in sorted(items, key=lambda x: x.name):
@@ -44,7 +58,11 @@ def format_inventory_markdown(inventory_list: list[InventoryItem], show_prices:
                 elif item.user_notes:
                     description = item.user_notes
                 
-                if description:
+                if description in first_item_by_description:
+                    markdown_parts.append(f"  - *See {first_item_by_description[description]}.*")
+                elif description:
+                    if is_shareable_description(description):
+                        first_item_by_description[description] = item.name
                     desc_lines = description.split('\n')
                     for line in desc_lines:
                         markdown_parts.append(f"  - *{line.strip()}*")
@@ -131,7 +149,7 @@ def generate_html_menu(context: dict, output_html_path: str): # <<< CORRECTED SI
     # "makeable_cocktails",
     # "show_prices", 
     # "show_descriptions"
-    # The item._type was also set in main_orchestrator for items in these categories.
+    # Every item also exposes item._type (its class name) for the template.
 
     html_output = template.render(context) # Use the pre-prepared context
 
@@ -181,31 +199,71 @@ def convert_html_to_pdf(html_filepath: str, pdf_filepath: str, css_filepath: str
         print(f"An unexpected error occurred with xhtml2pdf: {e}")
         return False
 
+def _load_inventory_for_update(inventory_path: str) -> tuple[list[InventoryItem], bool]:
+    """
+    Loads an inventory that may be saved back after enhancement.
+
+    Returns:
+        tuple[list[InventoryItem], bool]: The items, and whether every item loaded. Only a
+                                          complete inventory may be saved back; otherwise the
+                                          items that failed to load would be lost.
+    """
+    if not os.path.exists(inventory_path):
+        return load_inventory(inventory_path), True
+    try:
+        inventory_list, skipped = read_inventory(inventory_path)
+    except (IOError, ValueError, sqlite3.Error) as e:
+        print(f"Error: Could not load inventory from {inventory_path}. {e}")
+        return [], False
+    print(f"Inventory successfully loaded from {inventory_path}")
+    return inventory_list, not skipped
+
+
+def _save_enriched_inventory(inventory: list[InventoryItem], inventory_path: str, complete: bool):
+    """Saves an enhanced inventory with its enrichment fingerprints, unless it didn't load completely."""
+    if complete:
+        save_inventory(inventory, inventory_path)
+    else:
+        print(f"Warning: Not saving the enhanced inventory to {inventory_path}: "
+              f"some of its items could not be loaded and would be lost.")
+
+
 def main_orchestrator(output_path: str, output_format: str,
                       show_prices: bool, show_descriptions: bool, 
                       enhance_inventory: bool, bar_name: str,
-                      pdf_output_path: str = None): # <<< Added pdf_output_path
+                      pdf_output_path: str = None, # <<< Added pdf_output_path
+                      enhance_workers: int = DEFAULT_ENHANCE_WORKERS, enhance_deadline: float = None,
+                      force_enhance: bool = False, inventory_path: str = DEFAULT_INVENTORY_FILE,
+                      save_enriched: bool = True):
     # ... (Existing data loading and preparation logic as in your latest script)
     # ... (This includes loading inventory, enhancing, getting recipes, finding makeable,
     #      separating spirits and mixers, sorting them, and creating html_context)
     print(f"Starting menu generation for format: {output_format.upper()}...")
 
     # 1. Load Inventory
-    print(f"Loading inventory from: {DEFAULT_INVENTORY_FILE}")
-    current_inventory = load_inventory(DEFAULT_INVENTORY_FILE)
+    print(f"Loading inventory from: {inventory_path}")
+    if save_enriched:
+        current_inventory, complete = _load_inventory_for_update(inventory_path)
+    else:
+        current_inventory = load_inventory(inventory_path)
     
     if not current_inventory:
-        print(f"Inventory is empty or could not be loaded from {DEFAULT_INVENTORY_FILE}.")
+        print(f"Inventory is empty or could not be loaded from {inventory_path}.")
     
     # 2. (Optional) Enhance Inventory
     if enhance_inventory and current_inventory:
         print("Enhancing inventory with API data...")
-        for item in current_inventory:
-            enhance_inventory_item_with_api_data(item)
+        # Bounded: after enhance_deadline seconds, pending lookups fall back to cached data
+        categories_looked_up = enhance_inventory_items_with_api_data(current_inventory, max_workers=enhance_workers,
+                                                                     deadline=enhance_deadline, force=force_enhance)
+        if categories_looked_up and save_enriched:
+            # Saved with their enrichment fingerprints, so the next run skips them
+            _save_enriched_inventory(current_inventory, inventory_path, complete)
     
     # 3. Get Cocktail Recipes
     print("Fetching cocktail recipes...")
-    all_recipes = get_all_recipes()
+    all_recipes = get_all_recipes(lazy=True) # Only the makeable recipes are hydrated, when rendered
+    taxonomy = load_taxonomy(TAXONOMY_PATH) # Matches e.g. a "Rum" bottle to "Light rum" recipes
     
     makeable_cocktails = []
     if not all_recipes:
@@ -214,17 +272,35 @@ def main_orchestrator(output_path: str, output_format: str,
         print("Inventory is empty, no cocktails can be made.")
     else:
         print("Finding makeable cocktails...")
-        makeable_cocktails = find_makeable_cocktails(current_inventory, all_recipes)
+        makeable_cocktails = find_makeable_cocktails(current_inventory, all_recipes, taxonomy)
+
+    render_bar_menu(current_inventory, makeable_cocktails, taxonomy, output_path, output_format,
+                    show_prices, show_descriptions, bar_name, pdf_output_path)
+
+def render_bar_menu(current_inventory: list[InventoryItem], makeable_cocktails: list[CocktailRecipe], taxonomy,
+                    output_path: str, output_format: str, show_prices: bool, show_descriptions: bool,
+                    bar_name: str, pdf_output_path: str = None, temp_html_path: str = None):
+    """
+    Renders one bar's menu (HTML or Markdown, optionally converted to PDF) from its
+    inventory and makeable cocktails. Shared by single-bar and batch generation.
 
+    Args:
+        temp_html_path (str, optional): Intermediate HTML file when only a PDF is wanted.
+                                        Defaults to temp_menu_for_pdf.html in the project root.
+    """
+    temp_html_path = temp_html_path or os.path.join(PROJECT_ROOT, "temp_menu_for_pdf.html")
     # Prepare data for HTML template (separated and sorted)
     spirits_and_liqueurs_by_cat = {}
     mixers_by_cat = {}
+    # Keyword fallback for categories the taxonomy doesn't know
     MIXER_CATEGORIES = ["Tonic Water", "Soda Water", "Juice", "Syrup", "Cola", "Ginger Ale", "Ginger Beer", "Mixer", "Soft Drink"] 
 
     if current_inventory:
         for item in current_inventory:
-            item._type = item.__class__.__name__
-            is_mixer = any(mixer_cat_keyword.lower() in item.category.lower() for mixer_cat_keyword in MIXER_CATEGORIES)
+            if taxonomy.knows(item.category):
+                is_mixer = taxonomy.is_a(item.category, "mixer")
+            else:
+                is_mixer = any(mixer_cat_keyword.lower() in item.category.lower() for mixer_cat_keyword in MIXER_CATEGORIES)
             target_dict = mixers_by_cat if is_mixer else spirits_and_liqueurs_by_cat
             if item.category not in target_dict:
                 target_dict[item.category] = []
@@ -248,7 +324,7 @@ def main_orchestrator(output_path: str, output_format: str,
         
         # Determine HTML output path
         # If only PDF is requested, we can use a temporary HTML file or a fixed name
-        current_html_output_path = output_path if output_format.lower() == 'html' else os.path.join(PROJECT_ROOT, "temp_menu_for_pdf.html")
+        current_html_output_path = output_path if output_format.lower() == 'html' else temp_html_path
         
         generate_html_menu(html_context, current_html_output_path)
         html_generated_path = current_html_output_path # Store path if HTML was generated
@@ -281,7 +357,7 @@ def main_orchestrator(output_path: str, output_format: str,
         convert_html_to_pdf(html_generated_path, pdf_output_path, css_filepath=css_file_path)
         
         # Clean up temporary HTML file if it was created only for PDF
-        if output_format.lower() != 'html' and html_generated_path == os.path.join(PROJECT_ROOT, "temp_menu_for_pdf.html"):
+        if output_format.lower() != 'html' and html_generated_path == temp_html_path:
             try:
                 os.remove(html_generated_path)
                 print(f"Removed temporary HTML file: {html_generated_path}")
@@ -291,6 +367,149 @@ def main_orchestrator(output_path: str, output_format: str,
         print("Error: PDF output requested, but HTML generation failed or was skipped.")
 
 
+
+# --- Batch mode: many bars per run ---
+
+def load_batch_manifest(source: str) -> list[dict]:
+    """
+    Lists the bars of a batch run.
+
+    Args:
+        source (str): A directory (every .json or SQLite inventory file in it is a bar, named
+                      after the file) or a JSON manifest: a list of {"inventory": path,
+                      "bar_name": ..., "output": file stem}, paths relative to the manifest.
+
+    Returns:
+        list[dict]: One {"inventory", "bar_name", "output"} dict per bar.
+
+    Raises:
+        ValueError: If two bars would write the same output files (e.g. "bar.json" and
+                    "bar.sqlite3" in one directory).
+    """
+    if os.path.isdir(source):
+        filenames = sorted(filename for filename in os.listdir(source)
+                           if filename.lower().endswith(".json") or is_sqlite_inventory(filename))
+        entries = [{"inventory": os.path.join(source, filename)} for filename in filenames]
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        base_dir = os.path.dirname(os.path.abspath(source))
+        entries = [dict(entry, inventory=os.path.join(base_dir, entry["inventory"])) for entry in entries]
+
+    bars = []
+    seen_stems = {} # lowercased stem -> inventory, since some file systems ignore case
+    for entry in entries:
+        stem = entry.get("output") or os.path.splitext(os.path.basename(entry["inventory"]))[0]
+        if stem.lower() in seen_stems:
+            raise ValueError(f"'{entry['inventory']}' and '{seen_stems[stem.lower()]}' would both write the menu "
+                             f"'{stem}'. Give one of them a different \"output\" in a manifest.")
+        seen_stems[stem.lower()] = entry["inventory"]
+        bars.append({"inventory": entry["inventory"], "bar_name": entry.get("bar_name") or stem, "output": stem})
+    return bars
+
+
+def _render_bar_job(job: dict) -> tuple[str, float, str | None]:
+    """Renders one bar in a worker process. Returns (bar name, seconds, error or None)."""
+    start = time.perf_counter()
+    try:
+        render_bar_menu(job["inventory"], job["makeable"], job["taxonomy"], job["output_path"], job["output_format"],
+                        job["show_prices"], job["show_descriptions"], job["bar_name"],
+                        job["pdf_output_path"], job["temp_html_path"])
+        error = None
+    except Exception as e: # One bad bar shouldn't sink the batch
+        error = f"{type(e).__name__}: {e}"
+    return job["bar_name"], time.perf_counter() - start, error
+
+
+def generate_menus_batch(bars: list[dict], output_dir: str, output_format: str,
+                         show_prices: bool, show_descriptions: bool, enhance_inventory: bool,
+                         make_pdf: bool = False, workers: int = None,
+                         enhance_workers: int = DEFAULT_ENHANCE_WORKERS, enhance_deadline: float = None,
+                         force_enhance: bool = False, save_enriched: bool = True) -> dict:
+    """
+    Generates menus for several bars in one run. The catalog, its index and the taxonomy are
+    loaded once; enhancement looks each category up once across all bars; makeable cocktails
+    are computed for all bars in one batched pass (BitsetMatcher); rendering is spread over a
+    process pool.
+
+    Args:
+        bars (list[dict]): From load_batch_manifest.
+        output_dir (str): Where each bar's <output>.html/.md (and .pdf) is written.
+        make_pdf (bool): Also convert each bar's menu to PDF.
+        workers (int, optional): Rendering processes. Defaults to the CPU count; 1 renders in-process.
+        save_enriched (bool): Save each completely loaded inventory that enhancement changed
+                              back to its file, so later runs skip the enhanced items (default).
+
+    Returns:
+        dict: Timings in seconds: "load", "enhance", "catalog", "match", "render", "total",
+              and "bars" ({output stem: render seconds}; bar names needn't be unique).
+    """
+    timings = {}
+    run_start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+
+    phase_start = time.perf_counter()
+    loaded = [_load_inventory_for_update(bar["inventory"]) if save_enriched else (load_inventory(bar["inventory"]), False)
+              for bar in bars]
+    inventories = [inventory for inventory, _ in loaded]
+    timings["load"] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    if enhance_inventory:
+        before = [[item.enrichment for item in inventory] for inventory in inventories]
+        all_items = [item for inventory in inventories for item in inventory]
+        if enhance_inventory_items_with_api_data(all_items, max_workers=enhance_workers,
+                                                 deadline=enhance_deadline, force=force_enhance) and save_enriched:
+            for bar, (inventory, complete), fingerprints in zip(bars, loaded, before):
+                if fingerprints != [item.enrichment for item in inventory]:
+                    _save_enriched_inventory(inventory, bar["inventory"], complete)
+    timings["enhance"] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    taxonomy = load_taxonomy(TAXONOMY_PATH)
+    index = get_catalog_index(taxonomy) # The lazy catalog, loaded once for every bar
+    matcher = BitsetMatcher(index.recipes, index=index)
+    timings["catalog"] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    makeable_sets = matcher.find_makeable_batch(inventories)
+    timings["match"] = time.perf_counter() - phase_start
+
+    jobs = []
+    extension = "html" if output_format.lower() == 'html' else "md"
+    for bar, inventory, makeable in zip(bars, inventories, makeable_sets):
+        base_path = os.path.join(output_dir, bar["output"])
+        jobs.append({"inventory": inventory, "makeable": makeable, "taxonomy": taxonomy,
+                     "output_path": f"{base_path}.{extension}", "output_format": output_format,
+                     "show_prices": show_prices, "show_descriptions": show_descriptions, "bar_name": bar["bar_name"],
+                     "pdf_output_path": f"{base_path}.pdf" if make_pdf else None,
+                     "temp_html_path": f"{base_path}.pdf.html"})
+
+    phase_start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        results = [_render_bar_job(job) for job in jobs]
+    else:
+        # Workers import jinja2/xhtml2pdf once each and render bars as they free up
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(executor.map(_render_bar_job, jobs))
+    timings["render"] = time.perf_counter() - phase_start
+    timings["bars"] = {}
+    for bar, (bar_name, seconds, error) in zip(bars, results):
+        timings["bars"][bar["output"]] = seconds
+        if error:
+            print(f"Error rendering the menu for {bar_name}: {error}")
+    timings["total"] = time.perf_counter() - run_start
+
+    print(f"\n--- Batch summary: {len(bars)} bar(s) in {timings['total']:.2f}s ---")
+    for phase in ("load", "enhance", "catalog", "match", "render"):
+        print(f"{phase:>8}: {timings[phase]:.2f}s")
+    for bar, makeable, (bar_name, seconds, error) in zip(bars, makeable_sets, results):
+        status = "FAILED" if error else f"{len(makeable)} cocktails"
+        print(f"  - {bar_name}: {status}, rendered in {seconds:.2f}s")
+    return timings
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate a bar menu in HTML, Markdown, or PDF format.")
     parser.add_argument("--output", 
@@ -307,52 +526,89 @@ if __name__ == "__main__":
     parser.add_argument("--no-enhance", action="store_false", dest="enhance_inventory", 
                         help="Do not attempt to enhance inventory with API data.")
     parser.add_argument("--bar-name", default="The Home Bar", help="Name of the bar for the menu title.")
+    parser.add_argument("--inventory", default=DEFAULT_INVENTORY_FILE,
+                        help="Inventory file (JSON or SQLite) for a single-bar menu.")
+    parser.add_argument("--batch", default=None,
+                        help="Generate menus for many bars: a directory of inventory files or a JSON manifest "
+                             '([{"inventory": ..., "bar_name": ..., "output": ...}]).')
+    parser.add_argument("--batch-output-dir", default=os.path.join(PROJECT_ROOT, "menus"),
+                        help="Batch mode: directory for the per-bar menus (default: menus/).")
+    parser.add_argument("--batch-pdf", action="store_true", help="Batch mode: also convert each menu to PDF.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Batch mode: rendering processes (default: CPU count).")
+    parser.add_argument("--enhance-workers", type=int, default=DEFAULT_ENHANCE_WORKERS,
+                        help=f"Concurrent API lookups when enhancing (default: {DEFAULT_ENHANCE_WORKERS}).")
+    parser.add_argument("--enhance-deadline", type=float, default=None,
+                        help="Seconds enhancement may take; later lookups fall back to cached data (default: no limit).")
+    parser.add_argument("--force-enhance", action="store_true",
+                        help="Enhance every item, even those already enhanced from the current cached API data.")
+    parser.add_argument("--no-save-enriched", action="store_false", dest="save_enriched",
+                        help="Don't save enhanced inventories back to their files. By default they are saved "
+                             "(in the current format) so the next run skips the enhanced items; inventories "
+                             "with items that failed to load are never saved.")
+    parser.add_argument("--enhance-rate", type=float, default=DEFAULT_RATE_PER_SECOND,
+                        help=f"Maximum API requests per second across all workers (default: {DEFAULT_RATE_PER_SECOND:g}).")
     
-    parser.set_defaults(show_prices=True, show_descriptions=True, enhance_inventory=True)
+    parser.set_defaults(show_prices=True, show_descriptions=True, enhance_inventory=True, save_enriched=True)
     args = parser.parse_args()
+    set_rate_limit(args.enhance_rate)
 
-    output_filename_arg = args.output
-    if not output_filename_arg and not args.pdf_output : # If no output specified at all
-        output_filename_arg = "menu.html" if args.format.lower() == 'html' else "menu.md"
-    elif not output_filename_arg and args.pdf_output and args.format.lower() != 'html':
-        # If only --pdf is given, and --format isn't html, we still need an html output name for the intermediate step
-         output_filename_arg = "temp_menu_for_pdf.html" # Default name for intermediate HTML if not specified
-
-    # Determine absolute path for primary output (HTML/MD)
-    primary_output_abs_path = None
-    if output_filename_arg:
-        if os.path.isabs(output_filename_arg):
-            primary_output_abs_path = output_filename_arg
-        else:
-            primary_output_abs_path = os.path.join(PROJECT_ROOT, output_filename_arg)
+    if args.batch:
+        try:
+            batch_bars = load_batch_manifest(args.batch)
+        except ValueError as e:
+            parser.error(str(e))
+        generate_menus_batch(batch_bars, args.batch_output_dir, args.format,
+                             args.show_prices, args.show_descriptions, args.enhance_inventory,
+                             make_pdf=args.batch_pdf, workers=args.workers,
+                             enhance_workers=args.enhance_workers, enhance_deadline=args.enhance_deadline,
+                             force_enhance=args.force_enhance, save_enriched=args.save_enriched)
+    else:
+        output_filename_arg = args.output
+        if not output_filename_arg and not args.pdf_output : # If no output specified at all
+            output_filename_arg = "menu.html" if args.format.lower() == 'html' else "menu.md"
+        elif not output_filename_arg and args.pdf_output and args.format.lower() != 'html':
+            # If only --pdf is given, and --format isn't html, we still need an html output name for the intermediate step
+             output_filename_arg = "temp_menu_for_pdf.html" # Default name for intermediate HTML if not specified
+
+        # Determine absolute path for primary output (HTML/MD)
+        primary_output_abs_path = None
+        if output_filename_arg:
+            if os.path.isabs(output_filename_arg):
+                primary_output_abs_path = output_filename_arg
+            else:
+                primary_output_abs_path = os.path.join(PROJECT_ROOT, output_filename_arg)
         
-        output_dir_for_file = os.path.dirname(primary_output_abs_path)
-        if output_dir_for_file and not os.path.exists(output_dir_for_file):
-            os.makedirs(output_dir_for_file)
-            print(f"Created output directory: {output_dir_for_file}")
-
-    # Determine absolute path for PDF output
-    pdf_abs_path = None
-    if args.pdf_output:
-        if os.path.isabs(args.pdf_output):
-            pdf_abs_path = args.pdf_output
-        else:
-            pdf_abs_path = os.path.join(PROJECT_ROOT, args.pdf_output)
+            output_dir_for_file = os.path.dirname(primary_output_abs_path)
+            if output_dir_for_file and not os.path.exists(output_dir_for_file):
+                os.makedirs(output_dir_for_file)
+                print(f"Created output directory: {output_dir_for_file}")
+
+        # Determine absolute path for PDF output
+        pdf_abs_path = None
+        if args.pdf_output:
+            if os.path.isabs(args.pdf_output):
+                pdf_abs_path = args.pdf_output
+            else:
+                pdf_abs_path = os.path.join(PROJECT_ROOT, args.pdf_output)
         
-        pdf_output_dir = os.path.dirname(pdf_abs_path)
-        if pdf_output_dir and not os.path.exists(pdf_output_dir):
-            os.makedirs(pdf_output_dir)
-            print(f"Created PDF output directory: {pdf_output_dir}")
-
-    # If only --pdf is specified, the primary output format for the intermediate step is HTML.
-    effective_output_format = args.format
-    if args.pdf_output and not primary_output_abs_path:
-        effective_output_format = 'html' # Intermediate must be HTML for PDF conversion
-        primary_output_abs_path = os.path.join(PROJECT_ROOT, "temp_menu_for_pdf.html")
-
-
-    main_orchestrator(primary_output_abs_path, effective_output_format, 
-                      args.show_prices, args.show_descriptions, 
-                      args.enhance_inventory, args.bar_name,
-                      pdf_output_path=pdf_abs_path)
+            pdf_output_dir = os.path.dirname(pdf_abs_path)
+            if pdf_output_dir and not os.path.exists(pdf_output_dir):
+                os.makedirs(pdf_output_dir)
+                print(f"Created PDF output directory: {pdf_output_dir}")
+
+        # If only --pdf is specified, the primary output format for the intermediate step is HTML.
+        effective_output_format = args.format
+        if args.pdf_output and not primary_output_abs_path:
+            effective_output_format = 'html' # Intermediate must be HTML for PDF conversion
+            primary_output_abs_path = os.path.join(PROJECT_ROOT, "temp_menu_for_pdf.html")
+
+
+        main_orchestrator(primary_output_abs_path, effective_output_format, 
+                          args.show_prices, args.show_descriptions, 
+                          args.enhance_inventory, args.bar_name,
+                          pdf_output_path=pdf_abs_path,
+                          enhance_workers=args.enhance_workers, enhance_deadline=args.enhance_deadline,
+                          force_enhance=args.force_enhance, inventory_path=args.inventory,
+                          save_enriched=args.save_enriched)
 
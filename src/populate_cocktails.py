@@ -1,11 +1,13 @@
+import argparse
 import os
 # Import from cocktail_manager:
 # - get_all_recipes: to get the list of CocktailRecipe objects.
 # - save_cocktail_recipes_to_json: to save them using the centralized logic.
 # - CURATED_COCKTAILS_FILE: to use the consistent file path.
-from cocktail_manager import get_all_recipes, save_cocktail_recipes_to_json, CURATED_COCKTAILS_FILE
+# - build_binary_catalog: to emit the memory-mapped catalog next to the JSON file.
+from cocktail_manager import get_all_recipes, save_cocktail_recipes_to_json, build_binary_catalog, CURATED_COCKTAILS_FILE
 
-def main():
+def main(binary: bool = False):
     print(f"Attempting to populate/refresh {CURATED_COCKTAILS_FILE}...")
     # This will either load from CURATED_COCKTAILS_FILE if it exists and is valid,
     # or fetch from API and save to CURATED_COCKTAILS_FILE if it doesn't exist/is empty.
@@ -28,8 +30,14 @@ def main():
             
         save_cocktail_recipes_to_json(recipes, out_file_path)
         print(f"Finished populating. {len(recipes)} recipes are in {out_file_path}")
+        if binary:
+            build_binary_catalog(out_file_path)
     else:
         print(f"No recipes were found or fetched. {CURATED_COCKTAILS_FILE} might be empty or there was an issue.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=f"Populate/refresh {CURATED_COCKTAILS_FILE}.")
+    parser.add_argument("--binary", action="store_true",
+                        help="Also build the binary catalog (cocktails.bin) that get_all_recipes memory-maps.")
+    args = parser.parse_args()
+    main(binary=args.binary)
@@ -0,0 +1,179 @@
+# src/quantities.py
+"""
+Quantity parsing and servings-capacity computation.
+
+parse_quantity turns the free-text amounts used by inventory items ("700ml", "6x200ml",
+"5 units") and recipe requirements ("50ml", "1 1/2 oz", "2 dashes") into a Quantity with
+a normalized unit: millilitres for volumes, a plain count for everything else. Results
+are cached per distinct string, so a catalog full of "1 oz" parses it once.
+
+CapacityEngine builds on that to report how many servings of each makeable cocktail
+the current stock supports.
+"""
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from cocktail_manager import CocktailRecipe
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex, item_keys, requirement_key
+
+# amount: float, kind: "ml" (volume, normalized to millilitres) or "count"
+Quantity = namedtuple("Quantity", ["amount", "kind"])
+
+# Volume units -> millilitres
+VOLUME_UNITS = {
+    "ml": 1.0, "milliliter": 1.0, "millilitre": 1.0,
+    "cl": 10.0, "centiliter": 10.0, "centilitre": 10.0,
+    "dl": 100.0,
+    "l": 1000.0, "liter": 1000.0, "litre": 1000.0, "ltr": 1000.0,
+    "oz": 29.5735, "fl oz": 29.5735, "ounce": 29.5735,
+    "shot": 44.36, "jigger": 44.36,
+    "tsp": 4.93, "teaspoon": 4.93,
+    "tbsp": 14.79, "tblsp": 14.79, "tablespoon": 14.79,
+    "cup": 236.6,
+    "pint": 473.2,
+    "dash": 0.92,
+    "splash": 5.0,
+    "drop": 0.05,
+}
+
+# Units that just count things (a missing unit counts too: "3" limes)
+COUNT_UNITS = {
+    "", "unit", "piece", "whole", "slice", "wedge", "twist", "wheel", "leaf", "sprig",
+    "cube", "bottle", "can", "lemon", "lime", "orange", "egg", "cherry", "olive",
+}
+
+UNICODE_FRACTIONS = {"½": " 1/2", "⅓": " 1/3", "⅔": " 2/3", "¼": " 1/4", "¾": " 3/4"}
+
+_QUANTITY_PATTERN = re.compile(
+    r"^(?:(?P<multiplier>\d+)\s*x\s*)?"                        # "6x" in "6x200ml"
+    r"(?P<number>\d+(?:[.,]\d+)?(?:\s+\d+/\d+)?|\d+/\d+)"       # "1", "1.5", "1 1/2", "1/2"
+    r"(?:\s*-\s*(?:\d+(?:[.,]\d+)?(?:\s+\d+/\d+)?|\d+/\d+))?"   # range upper bound "-3" (ignored)
+    r"\s*(?P<unit>[a-z][a-z. ]*?)?\.?\s*$"
+)
+
+
+def _parse_number(text: str) -> float:
+    total = 0.0
+    for part in text.split():
+        if "/" in part:
+            numerator, denominator = part.split("/")
+            total += float(numerator) / float(denominator)
+        else:
+            total += float(part.replace(",", "."))
+    return total
+
+
+def _unit_factor(unit: str) -> tuple[float, str] | None:
+    """Returns (factor, kind) for a unit word, accepting plurals ("dashes", "units")."""
+    unit = unit.strip()
+    for candidate in (unit, unit[:-1] if unit.endswith("s") else None, unit[:-2] if unit.endswith("es") else None):
+        if candidate is None:
+            continue
+        if candidate in VOLUME_UNITS:
+            return VOLUME_UNITS[candidate], "ml"
+        if candidate in COUNT_UNITS:
+            return 1.0, "count"
+    return None
+
+
+@lru_cache(maxsize=None)
+def parse_quantity(text: str) -> Quantity | None:
+    """
+    Parses a quantity string into a normalized Quantity.
+    Returns None for amounts that can't be measured ("a bit", "top up", "juice of 1").
+    Ranges ("2-3 oz") use their lower bound.
+    """
+    if not text:
+        return None
+    normalized = text.strip().lower()
+    for symbol, replacement in UNICODE_FRACTIONS.items():
+        normalized = normalized.replace(symbol, replacement)
+    match = _QUANTITY_PATTERN.match(" ".join(normalized.split()))
+    if not match:
+        return None
+
+    unit = _unit_factor(match.group("unit") or "")
+    if unit is None:
+        return None
+    factor, kind = unit
+    amount = _parse_number(match.group("number")) * factor
+    if match.group("multiplier"):
+        amount *= int(match.group("multiplier"))
+    return Quantity(amount, kind)
+
+
+def recipe_needs(recipe: CocktailRecipe, taxonomy=None) -> dict[tuple, float]:
+    """
+    Returns the measurable needs of one serving as {(ingredient key, unit kind): amount}.
+    Amounts for the same key are summed; unmeasurable requirements ("a bit") are left out.
+    """
+    needs = {}
+    for req in recipe.ingredients:
+        quantity = parse_quantity(req.quantity)
+        if quantity is None or quantity.amount <= 0:
+            continue # Unmeasurable amounts ("a bit") never limit servings
+        need_key = (requirement_key(req, taxonomy), quantity.kind)
+        needs[need_key] = needs.get(need_key, 0.0) + quantity.amount
+    return needs
+
+
+class CapacityEngine:
+    """
+    Servings-capacity calculator for a fixed catalog.
+
+    Every requirement is parsed once, when the engine is built, into one flat table of
+    (recipe position, ingredient key, amount needed, unit kind); amounts for the same key
+    within a recipe are summed. capacity() then totals stock per ingredient key once and
+    makes a single pass over that table, keeping the running minimum per recipe.
+    """
+    def __init__(self, index: RecipeIndex):
+        self.index = index
+        self._needs = [] # (position, key, amount, kind)
+        for position, recipe in enumerate(index.recipes):
+            for (key, kind), amount in recipe_needs(recipe, index.taxonomy).items():
+                self._needs.append((position, key, amount, kind))
+
+    def stock_by_key(self, inventory: list[InventoryItem]) -> dict:
+        """Totals the measurable stock per (ingredient key, unit kind)."""
+        stock = {}
+        for item in inventory:
+            quantity = parse_quantity(item.quantity)
+            if quantity is None:
+                continue
+            for key in set(item_keys(item, self.index.taxonomy)):
+                stock_key = (key, quantity.kind)
+                stock[stock_key] = stock.get(stock_key, 0.0) + quantity.amount
+        return stock
+
+    def capacity(self, inventory: list[InventoryItem]) -> dict[str, int | None]:
+        """
+        Returns {recipe name: servings} for every makeable recipe.
+        Servings is None when no requirement can be measured against the stock
+        (e.g. the recipe only says "a bit", or bottles have no parseable size).
+        """
+        makeable = self.index.makeable_positions(self.index.inventory_keys(inventory))
+        limits = dict.fromkeys(makeable, math.inf)
+        stock = self.stock_by_key(inventory)
+
+        for position, key, amount, kind in self._needs:
+            current = limits.get(position)
+            if current is None:
+                continue # Not makeable
+            available = stock.get((key, kind))
+            if available is None:
+                continue # Stock of this unit kind unknown; can't limit
+            servings = available / amount
+            if servings < current:
+                limits[position] = servings
+
+        return {self.index.recipes[position].name: (None if limit == math.inf else int(limit + 1e-9))
+                for position, limit in limits.items()}
+
+
+def servings_capacity(inventory: list[InventoryItem], recipes: list[CocktailRecipe],
+                      taxonomy=None) -> dict[str, int | None]:
+    """Convenience wrapper: servings per makeable recipe for one inventory."""
+    return CapacityEngine(RecipeIndex(recipes, taxonomy)).capacity(inventory)
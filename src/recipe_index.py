@@ -0,0 +1,118 @@
+# src/recipe_index.py
+"""
+Inverted index over a recipe catalog for fast "what can I make?" queries.
+
+find_makeable_cocktails checks every requirement of every recipe on each call.
+RecipeIndex is built once from the recipe list: it maps each normalized ingredient
+key to the recipes that use it and remembers how many distinct keys each recipe
+needs. Each recipe is also filed under its rarest key (its "anchor"): a query only looks at
+recipes whose anchor the inventory has, then checks their remaining keys with set
+lookups. Recipes built around an ingredient the bar lacks are never touched, which
+keeps queries fast even when staples like gin or lime appear in thousands of recipes.
+
+Results are identical to find_makeable_cocktails (same recipes, same order).
+"""
+from itertools import chain
+
+from cocktail_manager import CATALOG_CACHE, CocktailRecipe, IngredientRequirement
+from inventory_manager import InventoryItem
+from taxonomy import Taxonomy
+
+
+def requirement_key(req: IngredientRequirement, taxonomy: Taxonomy = None) -> str | tuple[str, str]:
+    """
+    Normalizes a requirement to the inventory key that satisfies it.
+    Plain requirements map to the lowercase category (canonical name, with a taxonomy).
+    Brand-specific ones map to a (category, brand) pair, except when brand and category
+    are the same (e.g. "Campari"/"Campari"), which any item of that category satisfies.
+    """
+    category = taxonomy.canonical(req.category_needed) if taxonomy else req.category_needed.lower()
+    if req.specific_brand_optional:
+        brand = req.specific_brand_optional.lower()
+        if brand != category:
+            return (category, brand)
+    return category
+
+
+def item_keys(item: InventoryItem, taxonomy: Taxonomy = None) -> list[str | tuple[str, str]]:
+    """
+    Returns every key an inventory item satisfies: its category and (category, brand) pairs.
+    With a taxonomy, that is repeated for every category the item can fill.
+    """
+    brand = item.brand.lower()
+    # If the name IS the brand (e.g. "Campari"), a requirement may name the item instead
+    name_is_brand = item.name.lower() == brand or brand == "n/a"
+    keys = []
+    for category in (taxonomy.satisfies(item.category) if taxonomy else (item.category.lower(),)):
+        keys.append(category)
+        keys.append((category, brand))
+        if name_is_brand:
+            keys.append((category, item.name.lower()))
+    return keys
+
+
+class RecipeIndex:
+    """
+    Ingredient-key -> recipes index for a fixed recipe list.
+    Build it once per catalog and reuse it for every inventory you query.
+    Pass a Taxonomy to match categories through it, as find_makeable_cocktails(..., taxonomy) does.
+    """
+    def __init__(self, recipes: list[CocktailRecipe], taxonomy: Taxonomy = None):
+        self.recipes = list(recipes)
+        self.taxonomy = taxonomy
+        self.recipes_by_key = {}   # key -> list of recipe positions using it
+        self.recipe_keys = []      # position -> tuple of distinct keys the recipe needs
+        self.required_counts = []  # position -> len(recipe_keys[position])
+        self._no_requirements = [] # positions of recipes without ingredients (always makeable)
+
+        for position, recipe in enumerate(self.recipes):
+            keys = tuple(dict.fromkeys(requirement_key(req, taxonomy) for req in recipe.ingredients))
+            self.recipe_keys.append(keys)
+            self.required_counts.append(len(keys))
+            if not keys:
+                self._no_requirements.append(position)
+            for key in keys:
+                self.recipes_by_key.setdefault(key, []).append(position)
+
+        # File each recipe under its rarest key, with its other keys alongside for the check
+        self._recipes_by_anchor = {} # key -> list of (position, other keys)
+        for position, keys in enumerate(self.recipe_keys):
+            if keys:
+                anchor = min(keys, key=lambda key: len(self.recipes_by_key[key]))
+                others = tuple(key for key in keys if key != anchor)
+                self._recipes_by_anchor.setdefault(anchor, []).append((position, others))
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def inventory_keys(self, inventory: list[InventoryItem]) -> set:
+        """Returns the set of keys the inventory satisfies."""
+        return set(chain.from_iterable(item_keys(item, self.taxonomy) for item in inventory))
+
+    def makeable_positions(self, available_keys: set) -> list[int]:
+        """Returns the (sorted) positions of recipes whose keys are all in `available_keys`."""
+        positions = list(self._no_requirements)
+        recipes_by_anchor = self._recipes_by_anchor
+        for key in available_keys:
+            for position, others in recipes_by_anchor.get(key, ()):
+                if all(other in available_keys for other in others):
+                    positions.append(position)
+        positions.sort()
+        return positions
+
+    def find_makeable(self, inventory: list[InventoryItem]) -> list[CocktailRecipe]:
+        """
+        Determines which indexed cocktails can be made from the given inventory.
+        Same result as find_makeable_cocktails(inventory, recipes, taxonomy).
+        """
+        return [self.recipes[position] for position in self.makeable_positions(self.inventory_keys(inventory))]
+
+
+def get_catalog_index(taxonomy: Taxonomy = None) -> RecipeIndex:
+    """
+    Returns a RecipeIndex over get_all_recipes(), built once and kept until the catalog
+    changes (see cocktail_manager.CatalogCache). Indexes are kept per taxonomy spec
+    (Taxonomy.fingerprint), so callers that load a fresh Taxonomy each run share one.
+    """
+    key = ("recipe_index", taxonomy.fingerprint if taxonomy is not None else None)
+    return CATALOG_CACHE.derived(key, lambda recipes: RecipeIndex(recipes, taxonomy))
@@ -0,0 +1,268 @@
+# src/recipe_search.py
+"""
+Full-text and typo-tolerant recipe search.
+
+RecipeSearchIndex indexes recipe names, ingredients (categories and brands), garnishes,
+descriptions and instructions. Every word is normalized (lowercase, accents removed, so
+"Piña" matches "pina") and gets a weight per recipe from the fields it appears in; names
+count most. A query word matches index words in three ways:
+
+- exactly,
+- as a prefix ("marg" -> "margarita"), via binary search over the sorted vocabulary,
+- fuzzily ("negorni" -> "negroni"): words sharing the most trigrams with the query word are
+  checked with a bounded edit distance (adjacent swaps count as one edit).
+
+Recipes are ranked by the sum, over query words, of their best match:
+word weight x idf x match quality.
+
+The index is built once from the curated catalog and persisted next to it
+(data/cocktails.search.json); it is rebuilt when the catalog file changes.
+
+Usage (from the project root):
+    python src/recipe_search.py build
+    python src/recipe_search.py query "negorni"
+"""
+import argparse
+import bisect
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+from collections import namedtuple
+
+from cocktail_manager import CocktailRecipe, CURATED_COCKTAILS_FILE, iter_cocktail_recipes
+
+SEARCH_INDEX_VERSION = 1
+
+# Weight of a word occurrence per field (summed per recipe)
+FIELD_WEIGHTS = {"name": 8, "ingredients": 4, "garnish": 2, "description": 2, "instructions": 1}
+
+# Match quality by kind; fuzzy matches lose FUZZY_QUALITY per edit
+EXACT_QUALITY = 1.0
+PREFIX_QUALITY = 0.75
+FUZZY_QUALITY = 0.5
+# Words sharing the most trigrams with a query word that are checked for a fuzzy match
+FUZZY_CANDIDATES = 50
+
+STOP_WORDS = {"a", "an", "and", "the", "of", "in", "into", "with", "to", "or", "on", "it", "is"}
+
+SearchResult = namedtuple("SearchResult", ["name", "position", "score"])
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_words(text: str) -> list[str]:
+    """Lowercases, strips accents and splits text into words ("Piña Colada" -> ["pina", "colada"])."""
+    if not text:
+        return []
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return _WORD_PATTERN.findall("".join(char for char in decomposed if not unicodedata.combining(char)))
+
+
+def _trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent transpositions cost 1); limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def _recipe_fields(recipe: CocktailRecipe) -> dict[str, str]:
+    ingredient_text = " ".join(f"{req.category_needed} {req.specific_brand_optional or ''}" for req in recipe.ingredients)
+    return {"name": recipe.name, "ingredients": ingredient_text, "garnish": recipe.garnish_suggestion,
+            "description": recipe.description, "instructions": recipe.preparation_instructions}
+
+
+class RecipeSearchIndex:
+    """
+    Inverted word index over a recipe list, with prefix and fuzzy word lookup.
+    Build it with RecipeSearchIndex(recipes), or load a persisted one with load_search_index().
+    Results refer to recipes by name and by position in the list the index was built from.
+    """
+    def __init__(self, recipes: list[CocktailRecipe] = ()):
+        self.names = []
+        weights_by_word = {} # word -> {position: weight}
+        for position, recipe in enumerate(recipes):
+            self.names.append(recipe.name)
+            for field, text in _recipe_fields(recipe).items():
+                for word in normalize_words(text):
+                    if word not in STOP_WORDS:
+                        postings = weights_by_word.setdefault(word, {})
+                        postings[position] = postings.get(position, 0) + FIELD_WEIGHTS[field]
+        self.source_stamp = None # (mtime_ns, size) of the catalog file the index was built from
+        self._set_postings({word: [value for item in postings.items() for value in item]
+                            for word, postings in weights_by_word.items()})
+
+    def _set_postings(self, postings: dict[str, list[int]]):
+        """Installs postings ({word: [position, weight, position, weight, ...]}) and derived lookups."""
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+        self._idf = {word: math.log(1 + len(self.names) / (len(flat) // 2)) for word, flat in postings.items()}
+        self._words_by_trigram = None # Built on the first fuzzy lookup
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _fuzzy_matches(self, term: str) -> list[tuple[str, float]]:
+        if self._words_by_trigram is None:
+            self._words_by_trigram = {}
+            for word in self.vocabulary:
+                for trigram in _trigrams(word):
+                    self._words_by_trigram.setdefault(trigram, []).append(word)
+
+        shared = {}
+        for trigram in _trigrams(term):
+            for word in self._words_by_trigram.get(trigram, ()):
+                shared[word] = shared.get(word, 0) + 1
+        limit = 1 if len(term) <= 4 else 2
+        candidates = sorted(shared, key=shared.get, reverse=True)[:FUZZY_CANDIDATES]
+        matches = []
+        for word in candidates:
+            distance = _edit_distance(term, word, limit)
+            if distance <= limit:
+                matches.append((word, FUZZY_QUALITY ** distance))
+        return matches
+
+    def _matching_words(self, term: str) -> dict[str, float]:
+        """Index words matching a query word, with their match quality."""
+        matches = {}
+        if term in self.postings:
+            matches[term] = EXACT_QUALITY
+        start = bisect.bisect_left(self.vocabulary, term)
+        for word in self.vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            matches.setdefault(word, PREFIX_QUALITY)
+        if not matches and len(term) >= 3:
+            for word, quality in self._fuzzy_matches(term):
+                matches.setdefault(word, quality)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list[SearchResult]:
+        """
+        Returns up to `limit` recipes matching the query, best first.
+        Recipes matching more of the query words rank higher.
+        """
+        terms = [term for term in normalize_words(query) if term not in STOP_WORDS] or normalize_words(query)
+        scores = {}
+        for term in terms:
+            best = {} # position -> best score for this term
+            for word, quality in self._matching_words(term).items():
+                factor = quality * self._idf[word]
+                flat = self.postings[word]
+                for i in range(0, len(flat), 2):
+                    score = flat[i + 1] * factor
+                    if score > best.get(flat[i], 0.0):
+                        best[flat[i]] = score
+            for position, score in best.items():
+                scores[position] = scores.get(position, 0.0) + score
+
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1], self.names[entry[0]]))[:limit]
+        return [SearchResult(self.names[position], position, round(score, 3)) for position, score in ranked]
+
+    def to_dict(self) -> dict:
+        return {"version": SEARCH_INDEX_VERSION, "source_stamp": self.source_stamp,
+                "names": self.names, "postings": self.postings}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecipeSearchIndex":
+        if data.get("version") != SEARCH_INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        index = cls()
+        index.names = data["names"]
+        index.source_stamp = tuple(data["source_stamp"]) if data.get("source_stamp") else None
+        index._set_postings(data["postings"])
+        return index
+
+
+def search_index_path(catalog_path: str = CURATED_COCKTAILS_FILE) -> str:
+    """The search index for a catalog lives next to it ("cocktails.json" -> "cocktails.search.json")."""
+    return os.path.splitext(catalog_path)[0] + ".search.json"
+
+
+def _file_stamp(filepath: str) -> tuple[int, int]:
+    file_stat = os.stat(filepath)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def build_search_index(catalog_path: str = CURATED_COCKTAILS_FILE) -> RecipeSearchIndex:
+    """Builds the search index for a catalog file and saves it next to the catalog."""
+    stamp = _file_stamp(catalog_path)
+    index = RecipeSearchIndex(iter_cocktail_recipes(catalog_path))
+    index.source_stamp = stamp
+    index_path = search_index_path(catalog_path)
+    temp_path = index_path + ".tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index.to_dict(), f, separators=(",", ":"))
+        os.replace(temp_path, index_path)
+        print(f"Saved search index for {len(index)} recipes to {index_path}")
+    except IOError as e:
+        print(f"Error saving search index to {index_path}: {e}")
+    return index
+
+
+def load_search_index(catalog_path: str = CURATED_COCKTAILS_FILE) -> RecipeSearchIndex | None:
+    """
+    Loads the persisted search index for a catalog, (re)building it if it is missing,
+    unreadable or older than the catalog. Returns None if there is no catalog to index.
+    """
+    if not os.path.exists(catalog_path):
+        print(f"Info: Curated cocktails file '{catalog_path}' not found.")
+        return None
+    index_path = search_index_path(catalog_path)
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = RecipeSearchIndex.from_dict(json.load(f))
+            if index.source_stamp == _file_stamp(catalog_path):
+                return index
+            print(f"{catalog_path} has changed since the search index was built. Rebuilding...")
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            print(f"Error loading search index from {index_path}: {e}. Rebuilding...")
+    try:
+        return build_search_index(catalog_path)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Error building search index from {catalog_path}: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search the curated cocktail catalog.")
+    parser.add_argument("--catalog", default=CURATED_COCKTAILS_FILE, help="Curated cocktails JSON file.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="(Re)build the search index next to the catalog.")
+    query_parser = commands.add_parser("query", help="Search recipes by name, ingredient or description.")
+    query_parser.add_argument("text", help='Search text, e.g. "negroni" or "gin lime".')
+    query_parser.add_argument("--limit", type=int, default=10, help="Maximum number of results.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_search_index(args.catalog)
+    else:
+        search_index = load_search_index(args.catalog)
+        if search_index is not None:
+            start = time.perf_counter()
+            results = search_index.search(args.text, args.limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"\n--- {len(results)} result(s) for '{args.text}' ({elapsed_ms:.1f}ms) ---")
+            for result in results:
+                print(f"- {result.name} (score {result.score:g})")
@@ -0,0 +1,167 @@
+# src/recipe_similarity.py
+"""
+"More like this" recommendations: cocktails similar to one a guest liked.
+
+Each recipe becomes a sparse vector over ingredient features, weighted by IDF so that
+shared rare ingredients (Campari, orgeat) count for more than shared staples (lime, sugar).
+Features are the recipe's ingredient keys (as used by RecipeIndex). With a taxonomy, each
+category also contributes its parent categories at ANCESTOR_WEIGHT, so a dark-rum drink is
+close to a light-rum one through "rum". Vectors are L2-normalized once, when the engine is
+built, so similarity is a cosine, i.e. a dot product.
+
+The normalized vectors are stored column-wise (per feature: the recipes that have it and
+their weights). A query multiplies its few non-zero features into those columns and sums
+per recipe with numpy.bincount: one vectorized pass instead of comparing recipe pairs.
+NumPy is optional; without it the same sums are accumulated in a dict.
+"""
+import math
+
+from cocktail_manager import CocktailRecipe
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex, requirement_key
+from taxonomy import Taxonomy
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; fall back to the pure-Python path
+    np = None
+
+# Weight of a parent category relative to the ingredient itself
+ANCESTOR_WEIGHT = 0.5
+
+
+class SimilarityEngine:
+    """
+    Precomputed ingredient vectors for a fixed recipe list.
+
+    Args:
+        recipes (list[CocktailRecipe], optional): The catalog. Not needed if `index` is given.
+        inventory (list[InventoryItem], optional): What the bar has, for makeable_only queries.
+                                                   Can be changed later with set_inventory.
+        index (RecipeIndex, optional): A prebuilt index to share with other queries.
+        taxonomy (Taxonomy, optional): Used when building the index from `recipes`.
+        use_numpy (bool): Use NumPy when it is installed.
+    """
+    def __init__(self, recipes: list[CocktailRecipe] = None, inventory: list[InventoryItem] = None,
+                 index: RecipeIndex = None, taxonomy: Taxonomy = None, use_numpy: bool = True):
+        self.index = index if index is not None else RecipeIndex(recipes or [], taxonomy)
+        self.recipes = self.index.recipes
+        self.use_numpy = use_numpy and np is not None
+        self._positions_by_name = {}
+        for position, recipe in enumerate(self.recipes):
+            self._positions_by_name.setdefault(recipe.name.lower(), position)
+
+        # Raw (unweighted) features per recipe, then IDF over the catalog
+        raw_features = [self._raw_features(keys) for keys in self.index.recipe_keys]
+        document_frequency = {}
+        for features in raw_features:
+            for feature in features:
+                document_frequency[feature] = document_frequency.get(feature, 0) + 1
+        self.feature_ids = {feature: feature_id for feature_id, feature in enumerate(document_frequency)}
+        self._idf = [math.log(1 + len(self.recipes) / document_frequency[feature]) for feature in self.feature_ids]
+
+        # Normalized vectors, stored per feature: columns[feature_id] = (positions, weights)
+        columns = [([], []) for _ in self.feature_ids]
+        for position, features in enumerate(raw_features):
+            for feature_id, weight in self._normalized(features).items():
+                columns[feature_id][0].append(position)
+                columns[feature_id][1].append(weight)
+        if self.use_numpy:
+            self._columns = [(np.array(positions, dtype=np.int64), np.array(weights)) for positions, weights in columns]
+        else:
+            self._columns = columns
+
+        self._makeable = None
+        if inventory is not None:
+            self.set_inventory(inventory)
+
+    def _raw_features(self, keys) -> dict:
+        """Feature -> base weight for a recipe's ingredient keys (max weight if reached twice)."""
+        taxonomy = self.index.taxonomy
+        features = {}
+        for key in keys:
+            features[key] = 1.0
+            category = key[0] if isinstance(key, tuple) else key
+            features[category] = max(features.get(category, 0.0), 1.0 if category == key else ANCESTOR_WEIGHT)
+            if taxonomy is not None:
+                for ancestor in taxonomy.ancestors(category):
+                    if ancestor != category:
+                        features[ancestor] = max(features.get(ancestor, 0.0), ANCESTOR_WEIGHT)
+        return features
+
+    def _normalized(self, features: dict) -> dict[int, float]:
+        """IDF-weights known features and scales the vector to unit length."""
+        vector = {self.feature_ids[feature]: weight * self._idf[self.feature_ids[feature]]
+                  for feature, weight in features.items() if feature in self.feature_ids}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {feature_id: weight / norm for feature_id, weight in vector.items()} if norm else {}
+
+    def set_inventory(self, inventory: list[InventoryItem]):
+        """Sets the inventory used by makeable_only queries."""
+        makeable = self.index.makeable_positions(self.index.inventory_keys(inventory))
+        if self.use_numpy:
+            self._makeable = np.zeros(len(self.recipes), dtype=bool)
+            self._makeable[makeable] = True
+        else:
+            self._makeable = set(makeable)
+
+    def similar(self, recipe: CocktailRecipe | str, k: int = 5,
+                makeable_only: bool = True) -> list[tuple[CocktailRecipe, float]]:
+        """
+        Returns the k recipes most similar to `recipe`, best first, with their cosine similarity.
+        The recipe itself is never returned, nor are recipes sharing no ingredient feature with it.
+
+        Args:
+            recipe (CocktailRecipe | str): A recipe (from the catalog or not) or a catalog recipe name.
+            k (int): Maximum number of results.
+            makeable_only (bool): Only return recipes makeable from the current inventory.
+
+        Raises:
+            KeyError: If `recipe` is a name that isn't in the catalog.
+            ValueError: If makeable_only is set but no inventory was given.
+        """
+        if makeable_only and self._makeable is None:
+            raise ValueError("makeable_only needs an inventory; pass one to SimilarityEngine or call set_inventory().")
+        if isinstance(recipe, str):
+            own_position = self._positions_by_name[recipe.lower()]
+            recipe = self.recipes[own_position]
+        else:
+            own_position = self._positions_by_name.get(recipe.name.lower())
+        keys = {requirement_key(req, self.index.taxonomy) for req in recipe.ingredients}
+        query = self._normalized(self._raw_features(keys))
+        if not query or k <= 0:
+            return []
+
+        if self.use_numpy:
+            positions = np.concatenate([self._columns[feature_id][0] for feature_id in query])
+            weights = np.concatenate([self._columns[feature_id][1] * weight for feature_id, weight in query.items()])
+            scores = np.bincount(positions, weights=weights, minlength=len(self.recipes))
+            eligible = scores > 1e-12
+            if makeable_only:
+                eligible &= self._makeable
+            if own_position is not None:
+                eligible[own_position] = False
+            candidates = np.flatnonzero(eligible)
+            if len(candidates) > k: # Keep everything scoring at least the k-th best (ties included)
+                kth_best = -np.partition(-scores[candidates], k - 1)[k - 1]
+                candidates = candidates[scores[candidates] >= kth_best]
+            # Best score first, catalog order among ties
+            ranked = candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+            return [(self.recipes[position], float(scores[position])) for position in ranked]
+
+        scores = {}
+        for feature_id, weight in query.items():
+            for position, column_weight in zip(*self._columns[feature_id]):
+                scores[position] = scores.get(position, 0.0) + column_weight * weight
+        ranked = sorted((position for position, score in scores.items()
+                         if score > 1e-12 and position != own_position
+                         and (not makeable_only or position in self._makeable)),
+                        key=lambda position: (-scores[position], position))
+        return [(self.recipes[position], scores[position]) for position in ranked[:k]]
+
+
+def similar_cocktails(recipe: CocktailRecipe | str, recipes: list[CocktailRecipe], inventory: list[InventoryItem] = None,
+                      k: int = 5, taxonomy: Taxonomy = None) -> list[tuple[CocktailRecipe, float]]:
+    """Convenience wrapper: recipes similar to `recipe`, makeable from `inventory` if one is given."""
+    engine = SimilarityEngine(recipes, inventory, taxonomy=taxonomy)
+    return engine.similar(recipe, k, makeable_only=inventory is not None)
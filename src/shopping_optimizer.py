@@ -0,0 +1,164 @@
+# src/shopping_optimizer.py
+"""
+"What should I buy next?" queries over a RecipeIndex.
+
+For a given inventory this finds near-miss recipes (missing at most k ingredients),
+ranks single purchases by how many new recipes they unlock, and builds a greedy
+multi-step shopping plan ("buy these 3 bottles to unlock 40 drinks").
+
+Everything works on per-recipe missing-key counts derived from the index. Buying a
+key only updates the recipes that use it, so a plan step costs time proportional to
+those recipes, not to the catalog. Nothing re-runs the matcher per candidate bottle.
+
+A purchase is an ingredient key as used by RecipeIndex: a lowercase category
+("gin") or a (category, brand) pair for brand-specific requirements.
+"""
+import argparse
+
+from cocktail_manager import CocktailRecipe
+from data_handler import load_inventory, DEFAULT_INVENTORY_FILE
+from inventory_manager import InventoryItem
+from recipe_index import RecipeIndex, get_catalog_index
+
+
+def describe_key(key: str | tuple[str, str]) -> str:
+    """Human-readable name for an ingredient key ("gin", "campari (brand: campari)")."""
+    if isinstance(key, tuple):
+        return f"{key[0]} (brand: {key[1]})"
+    return key
+
+
+class ShoppingOptimizer:
+    """
+    Near-miss and purchase-ranking queries for one inventory against an indexed catalog.
+
+    Args:
+        index (RecipeIndex): The catalog to plan against.
+        inventory (list[InventoryItem]): What the bar has now.
+        weights (dict[str, float], optional): Popularity score per recipe name.
+                                              Recipes not listed (or all, if omitted) count 1.
+    """
+    def __init__(self, index: RecipeIndex, inventory: list[InventoryItem], weights: dict[str, float] = None):
+        self.index = index
+        self.available_keys = index.inventory_keys(inventory)
+        self.weights = [weights.get(recipe.name, 1.0) if weights else 1.0 for recipe in index.recipes]
+        # Missing keys per recipe (only for recipes that aren't makeable yet)
+        self.missing_keys = {}
+        for position, keys in enumerate(index.recipe_keys):
+            missing = [key for key in keys if key not in self.available_keys]
+            if missing:
+                self.missing_keys[position] = missing
+
+    def near_misses(self, max_missing: int = 1) -> list[tuple[CocktailRecipe, list]]:
+        """
+        Returns recipes missing between 1 and `max_missing` ingredient keys, with the
+        missing keys, sorted by fewest missing then highest weight.
+        """
+        found = [(position, missing) for position, missing in self.missing_keys.items()
+                 if len(missing) <= max_missing]
+        found.sort(key=lambda entry: (len(entry[1]), -self.weights[entry[0]], entry[0]))
+        return [(self.index.recipes[position], missing) for position, missing in found]
+
+    def rank_purchases(self, top_n: int = 10) -> list[tuple[str | tuple[str, str], float, list[CocktailRecipe]]]:
+        """
+        Ranks single purchases by the total weight of recipes they would make makeable
+        on their own, i.e. recipes missing exactly that one key.
+
+        Returns:
+            list of (key, gain, unlocked recipes), best first.
+        """
+        unlocked_by_key = {}
+        for position, missing in self.missing_keys.items():
+            if len(missing) == 1:
+                unlocked_by_key.setdefault(missing[0], []).append(position)
+
+        ranking = []
+        for key, positions in unlocked_by_key.items():
+            gain = sum(self.weights[position] for position in positions)
+            ranking.append((key, gain, [self.index.recipes[position] for position in positions]))
+        ranking.sort(key=lambda entry: (-entry[1], describe_key(entry[0])))
+        return ranking[:top_n]
+
+    def plan(self, steps: int = 3) -> list[tuple[str | tuple[str, str], float, list[CocktailRecipe]]]:
+        """
+        Greedy shopping plan: at each step buy the key with the largest immediate gain
+        (weight of recipes it completes). When no single key completes anything, buy the key
+        that brings the most weight closer to completion (weight / keys still missing).
+
+        Returns:
+            One (key, gain, recipes unlocked at that step) entry per purchase, in buying order.
+            Stops early when nothing left in the catalog can be unlocked.
+        """
+        recipes_by_key = self.index.recipes_by_key
+        weights = self.weights
+        missing_count = {position: len(missing) for position, missing in self.missing_keys.items()}
+        bought = set()
+
+        # gain[key]: weight of recipes missing only `key`.
+        # progress[key]: sum of weight / missing count over recipes missing `key` (tie-breaker).
+        gain = {}
+        progress = {}
+        for position, missing in self.missing_keys.items():
+            for key in missing:
+                progress[key] = progress.get(key, 0.0) + weights[position] / len(missing)
+            if len(missing) == 1:
+                gain[missing[0]] = gain.get(missing[0], 0.0) + weights[position]
+
+        plan = []
+        for _ in range(steps):
+            candidates = gain if any(value > 0 for value in gain.values()) else progress
+            candidates = {key: value for key, value in candidates.items() if key not in bought and value > 0}
+            if not candidates:
+                break
+            best_key = max(candidates, key=lambda key: (candidates[key], progress.get(key, 0.0)))
+            bought.add(best_key)
+            step_gain = gain.pop(best_key, 0.0)
+            progress.pop(best_key, None)
+
+            # Only recipes using the bought key change
+            unlocked = []
+            for position in recipes_by_key.get(best_key, ()):
+                count = missing_count.get(position)
+                if not count:
+                    continue
+                weight = weights[position]
+                remaining = [key for key in self.missing_keys[position] if key not in bought]
+                for key in remaining: # Progress shares change from 1/count to 1/(count - 1)
+                    progress[key] += weight / (count - 1) - weight / count
+                missing_count[position] = count - 1
+                if count == 1:
+                    unlocked.append(self.index.recipes[position])
+                elif count == 2:
+                    gain[remaining[0]] = gain.get(remaining[0], 0.0) + weight
+            plan.append((best_key, step_gain, unlocked))
+        return plan
+
+
+def suggest_purchases(inventory: list[InventoryItem], recipes: list[CocktailRecipe],
+                      top_n: int = 10, weights: dict[str, float] = None) -> list:
+    """Convenience wrapper: ranks single purchases for an inventory against a recipe list."""
+    return ShoppingOptimizer(RecipeIndex(recipes), inventory, weights).rank_purchases(top_n)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suggest which bottles to buy next.")
+    parser.add_argument("--inventory", default=DEFAULT_INVENTORY_FILE, help="Inventory JSON file.")
+    parser.add_argument("--steps", type=int, default=3, help="Number of purchases to plan.")
+    parser.add_argument("--max-missing", type=int, default=1, help="Show near misses missing up to this many ingredients.")
+    args = parser.parse_args()
+
+    optimizer = ShoppingOptimizer(get_catalog_index(), load_inventory(args.inventory))
+
+    print(f"\n--- Near misses (missing up to {args.max_missing}) ---")
+    for recipe, missing in optimizer.near_misses(args.max_missing):
+        print(f"- {recipe.name}: missing {', '.join(describe_key(key) for key in missing)}")
+
+    print("\n--- Best single purchases ---")
+    for key, gain, unlocked in optimizer.rank_purchases():
+        print(f"- {describe_key(key)}: unlocks {gain:g} ({', '.join(recipe.name for recipe in unlocked)})")
+
+    print(f"\n--- {args.steps}-step shopping plan ---")
+    total = 0.0
+    for step, (key, gain, unlocked) in enumerate(optimizer.plan(args.steps), start=1):
+        total += gain
+        print(f"{step}. Buy {describe_key(key)} -> +{gain:g} (total {total:g})")
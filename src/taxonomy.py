@@ -0,0 +1,190 @@
+# src/taxonomy.py
+"""
+Ingredient taxonomy: parent/child categories, synonyms and substitutions.
+
+Inventory categories ("Rum", "Lime", "Vermouth") rarely match recipe categories
+("Light rum", "Lime juice", "Sweet Vermouth") exactly. The taxonomy describes how they
+relate, and at load time its transitive closure is flattened into lookup tables:
+
+- canonical(term): the canonical name for a term or any of its synonyms.
+- satisfies(category): every requirement category an item of `category` can fill
+  (itself, all its ancestors, and anything it is listed as a substitute for).
+- ancestors(category) / is_a(category, ancestor): parent/child relationship only
+  (used for menu grouping and recipe similarity).
+
+Each lookup is a single dict access however deep the hierarchy is.
+
+Taxonomy spec format (DEFAULT_TAXONOMY, or data/taxonomy.json with the same shape):
+    {"light rum": {"parent": "rum", "synonyms": ["white rum"], "substitutes": ["rum"]}, ...}
+"parent" is the broader category, "synonyms" are alternative names, and
+"substitutes" are categories whose items may be used when this one is required.
+"""
+import hashlib
+import json
+import os
+
+TAXONOMY_FILE = "data/taxonomy.json"
+
+DEFAULT_TAXONOMY = {
+    # --- Spirits ---
+    "spirit": {},
+    "gin": {"parent": "spirit"},
+    "london dry gin": {"parent": "gin", "synonyms": ["dry gin"]},
+    "sloe gin": {"parent": "liqueur"},
+    "vodka": {"parent": "spirit"},
+    "rum": {"parent": "spirit"},
+    "light rum": {"parent": "rum", "synonyms": ["white rum", "silver rum"], "substitutes": ["rum"]},
+    "dark rum": {"parent": "rum", "synonyms": ["black rum"], "substitutes": ["rum"]},
+    "gold rum": {"parent": "rum", "substitutes": ["rum"]},
+    "spiced rum": {"parent": "rum"},
+    "tequila": {"parent": "spirit"},
+    "mezcal": {"parent": "spirit"},
+    "brandy": {"parent": "spirit"},
+    "cognac": {"parent": "brandy"},
+    "whiskey": {"parent": "spirit", "synonyms": ["whisky"]},
+    "bourbon": {"parent": "whiskey", "synonyms": ["bourbon whiskey"]},
+    "rye whiskey": {"parent": "whiskey", "synonyms": ["rye", "rye whisky"]},
+    "scotch": {"parent": "whiskey", "synonyms": ["scotch whisky", "blended scotch"]},
+    "irish whiskey": {"parent": "whiskey", "synonyms": ["irish whisky"]},
+    "blended whiskey": {"parent": "whiskey", "synonyms": ["blended whisky"], "substitutes": ["whiskey"]},
+    # --- Liqueurs, aperitifs and fortified wines ---
+    "liqueur": {},
+    "triple sec": {"parent": "liqueur", "synonyms": ["orange liqueur"]},
+    "cointreau": {"parent": "triple sec"},
+    "grand marnier": {"parent": "triple sec"},
+    "campari": {"parent": "bitter aperitif"},
+    "aperol": {"parent": "bitter aperitif"},
+    "bitter aperitif": {"parent": "liqueur"},
+    "vermouth": {"parent": "fortified wine"},
+    "sweet vermouth": {"parent": "vermouth", "synonyms": ["red vermouth", "rosso vermouth"], "substitutes": ["vermouth"]},
+    "dry vermouth": {"parent": "vermouth", "synonyms": ["white vermouth"], "substitutes": ["vermouth"]},
+    "fortified wine": {},
+    "bitters": {},
+    "angostura bitters": {"parent": "bitters", "synonyms": ["angostura"]},
+    "orange bitters": {"parent": "bitters"},
+    "champagne": {"parent": "sparkling wine"},
+    "prosecco": {"parent": "sparkling wine", "substitutes": ["champagne"]},
+    "sparkling wine": {},
+    # --- Mixers ---
+    "mixer": {},
+    "tonic water": {"parent": "mixer", "synonyms": ["tonic", "indian tonic"]},
+    "soda water": {"parent": "mixer", "synonyms": ["club soda", "carbonated water", "soda", "sparkling water"]},
+    "cola": {"parent": "mixer", "synonyms": ["coca-cola", "coke"]},
+    "ginger ale": {"parent": "mixer"},
+    "ginger beer": {"parent": "mixer"},
+    "lemonade": {"parent": "mixer", "synonyms": ["lemon-lime soda", "sprite", "7-up"]},
+    "juice": {"parent": "mixer"},
+    "orange juice": {"parent": "juice"},
+    "lime juice": {"parent": "juice", "substitutes": ["lime"]},
+    "lemon juice": {"parent": "juice", "substitutes": ["lemon"]},
+    "cranberry juice": {"parent": "juice"},
+    "pineapple juice": {"parent": "juice"},
+    "grapefruit juice": {"parent": "juice"},
+    "tomato juice": {"parent": "juice"},
+    "syrup": {"parent": "mixer"},
+    "sugar syrup": {"parent": "syrup", "synonyms": ["simple syrup"]},
+    "grenadine": {"parent": "syrup"},
+    "coconut cream": {"parent": "mixer", "synonyms": ["cream of coconut"]},
+    # --- Garnishes and fresh produce ---
+    "garnish": {},
+    "citrus": {"parent": "garnish"},
+    "lime": {"parent": "citrus"},
+    "lemon": {"parent": "citrus"},
+    "orange": {"parent": "citrus"},
+    "lemon peel": {"parent": "garnish", "substitutes": ["lemon"]},
+    "orange peel": {"parent": "garnish", "substitutes": ["orange"]},
+    "mint": {"parent": "garnish"},
+    "olive": {"parent": "garnish"},
+}
+
+
+def _normalize(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+class Taxonomy:
+    """
+    Ingredient taxonomy with its transitive closure precomputed into flat lookup tables.
+    Build it with Taxonomy(spec) or load_taxonomy(); terms are case-insensitive.
+    `fingerprint` identifies the spec, so taxonomies built from equal specs share caches.
+    """
+    def __init__(self, spec: dict):
+        self.fingerprint = hashlib.sha1(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+        self._canonical = {}  # any known term or synonym -> canonical name
+        parents = {}          # canonical -> parent canonical
+        substitute_for = {}   # canonical S -> canonical categories S may stand in for
+
+        for name in spec:
+            self._canonical[_normalize(name)] = _normalize(name)
+        for name, node in spec.items():
+            for synonym in node.get("synonyms", []):
+                self._canonical.setdefault(_normalize(synonym), _normalize(name))
+
+        for name, node in spec.items():
+            canonical = _normalize(name)
+            if node.get("parent"):
+                parents[canonical] = self.canonical(node["parent"])
+            for substitute in node.get("substitutes", []):
+                substitute_for.setdefault(self.canonical(substitute), []).append(canonical)
+
+        # Ancestor closure (is-a only) and "satisfies" closure (is-a plus substitutions)
+        self._ancestors = {}
+        self._satisfies = {}
+        all_terms = set(self._canonical.values()) | set(parents.values()) | set(substitute_for)
+        for term in all_terms:
+            ancestors = set()
+            current = term
+            while current is not None and current not in ancestors: # Guard against parent cycles
+                ancestors.add(current)
+                current = parents.get(current)
+            self._ancestors[term] = frozenset(ancestors)
+
+        for term in all_terms:
+            reachable = set()
+            pending = [term]
+            while pending:
+                current = pending.pop()
+                if current in reachable:
+                    continue
+                reachable.add(current)
+                pending.extend(self._ancestors.get(current, ()))
+                pending.extend(substitute_for.get(current, ()))
+            self._satisfies[term] = frozenset(reachable)
+
+    def canonical(self, term: str) -> str:
+        """Returns the canonical (lowercase) name of a term; unknown terms are just normalized."""
+        normalized = _normalize(term)
+        return self._canonical.get(normalized, normalized)
+
+    def knows(self, term: str) -> bool:
+        """True if the term (or a synonym of it) is part of the taxonomy."""
+        return _normalize(term) in self._canonical
+
+    def satisfies(self, category: str) -> frozenset:
+        """Canonical requirement categories an item of `category` can fill (including itself)."""
+        canonical = self.canonical(category)
+        return self._satisfies.get(canonical) or frozenset((canonical,))
+
+    def ancestors(self, category: str) -> frozenset:
+        """Canonical names of `category` and all its parent categories (is-a only)."""
+        canonical = self.canonical(category)
+        return self._ancestors.get(canonical) or frozenset((canonical,))
+
+    def is_a(self, category: str, ancestor: str) -> bool:
+        """True if `category` is `ancestor` or one of its descendants."""
+        canonical = self.canonical(category)
+        return self.canonical(ancestor) in self._ancestors.get(canonical, (canonical,))
+
+
+def load_taxonomy(filepath: str = TAXONOMY_FILE) -> Taxonomy:
+    """
+    Loads the taxonomy from a JSON file in the DEFAULT_TAXONOMY format,
+    falling back to DEFAULT_TAXONOMY if the file doesn't exist or can't be read.
+    """
+    if os.path.exists(filepath):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return Taxonomy(json.load(f))
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Error loading taxonomy from {filepath}: {e}. Using the built-in taxonomy.")
+    return Taxonomy(DEFAULT_TAXONOMY)
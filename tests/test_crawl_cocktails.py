@@ -0,0 +1,109 @@
+# tests/test_crawl_cocktails.py
+"""
+Crawls the stub CocktailDB (benchmarks/cocktaildb_stub.py) replaying recorded letter pages.
+
+Run from the project root: python -m pytest tests/
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import api_client
+import crawl_cocktails
+from cocktaildb_stub import StubCocktailDB, make_drink
+
+
+def write_page(fixtures_dir, letter: str, drinks: list[dict]):
+    with open(os.path.join(fixtures_dir, f"search_f_{letter}.json"), 'w', encoding='utf-8') as f:
+        json.dump({"drinks": drinks}, f)
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    """A stub API serving the letter pages in tmp_path/fixtures (every other letter is empty)."""
+    fixtures_dir = tmp_path / "fixtures"
+    fixtures_dir.mkdir()
+    write_page(fixtures_dir, "g", [make_drink("Gin Tonic", 1), make_drink("Gimlet", 2)])
+    write_page(fixtures_dir, "n", [make_drink("Negroni", 3)])
+    with StubCocktailDB(latency=0, fixtures_dir=str(fixtures_dir)) as server:
+        monkeypatch.setattr(api_client, "API_BASE_URL", server.base_url)
+        monkeypatch.setattr(api_client, "_RATE_LIMITER", None)
+        yield fixtures_dir
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "cocktails.json"), str(tmp_path / "crawl_state.json")
+
+
+def test_first_crawl_writes_catalog_and_state(stub, paths):
+    curated_file, state_file = paths
+    summary = crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+
+    assert summary["new"] == 3 and summary["written"] == 3 and not summary["write_failed"]
+    with open(curated_file, encoding='utf-8') as f:
+        assert sorted(recipe["name"] for recipe in json.load(f)) == ["Gimlet", "Gin Tonic", "Negroni"]
+    assert os.path.exists(state_file)
+
+
+def test_unchanged_catalog_is_not_rewritten(stub, paths):
+    curated_file, state_file = paths
+    crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+    before = os.stat(curated_file).st_mtime_ns, open(curated_file, 'rb').read()
+
+    summary = crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+
+    assert summary["new"] == summary["changed"] == summary["written"] == 0
+    assert summary["unchanged"] == 3
+    assert (os.stat(curated_file).st_mtime_ns, open(curated_file, 'rb').read()) == before
+
+
+def test_failed_write_keeps_catalog_and_state(stub, paths, monkeypatch):
+    curated_file, state_file = paths
+    crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+    catalog_before = open(curated_file, 'rb').read()
+    state_before = open(state_file, 'rb').read()
+
+    write_page(stub, "m", [make_drink("Martini", 4)])
+    real_replace = os.replace
+
+    def failing_replace(source, destination):
+        if destination == curated_file:
+            raise OSError("disk full")
+        real_replace(source, destination)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    summary = crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+
+    assert summary["write_failed"] and summary["written"] == 0
+    assert open(curated_file, 'rb').read() == catalog_before
+    assert open(state_file, 'rb').read() == state_before
+    assert not os.path.exists(curated_file + ".tmp")
+
+    # The next run retries the new drink, since the state never recorded it
+    monkeypatch.setattr(os, "replace", real_replace)
+    summary = crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+    assert summary["new"] == 1 and summary["written"] == 4
+
+
+@pytest.mark.parametrize("damage", ["delete", "corrupt"])
+def test_missing_or_unreadable_catalog_forces_full_crawl(stub, paths, damage):
+    curated_file, state_file = paths
+    crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+    if damage == "delete":
+        os.remove(curated_file)
+    else:
+        with open(curated_file, 'w', encoding='utf-8') as f:
+            f.write('[{"name": "Gin To')
+
+    summary = crawl_cocktails.crawl_catalog(curated_file, state_file, max_workers=4)
+
+    assert summary["new"] == 3 and summary["written"] == 3
+    with open(curated_file, encoding='utf-8') as f:
+        assert sorted(recipe["name"] for recipe in json.load(f)) == ["Gimlet", "Gin Tonic", "Negroni"]